@@ -1,9 +1,6 @@
-from dealership_review.core.mediator import Mediator
+import sys
 
-# Tweak the search on `.get_scores()`
-reviews = Mediator().get_scores()
+from dealership_review.cli import main
 
-print('###')
-for review in reviews:
-    print(review)
-print('###')
+# Tweak the search with command-line arguments, see `python assessment.py --help`
+sys.exit(main())
@@ -0,0 +1,73 @@
+import argparse
+import json
+import sys
+
+from benchmarks.benchmark_suite import (
+    run_benchmarks, DEFAULT_PAGES, DEFAULT_REPEAT, DEFAULT_LATENCY, DEFAULT_MAX_WORKERS,
+)
+from benchmarks.page_generator import (
+    DEFAULT_REVIEWS_COUNT,
+    DEFAULT_MESSAGE_WORDS,
+    DEFAULT_EMPLOYEES_COUNT,
+    DEFAULT_SPECIFIC_RATINGS_COUNT,
+)
+
+
+def main():
+    """
+    Runs the benchmarks and writes their results as JSON
+    """
+    argument_parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Benchmarks the review scrapping over generated DealerRater pages',
+    )
+    argument_parser.add_argument('--pages', type=int, default=DEFAULT_PAGES)
+    argument_parser.add_argument('--reviews-count', type=int, default=DEFAULT_REVIEWS_COUNT)
+    argument_parser.add_argument('--message-words', type=int, default=DEFAULT_MESSAGE_WORDS)
+    argument_parser.add_argument('--employees-count', type=int, default=DEFAULT_EMPLOYEES_COUNT)
+    argument_parser.add_argument(
+        '--specific-ratings-count',
+        type=int,
+        default=DEFAULT_SPECIFIC_RATINGS_COUNT,
+    )
+    argument_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    argument_parser.add_argument(
+        '--over-http',
+        action='store_true',
+        help='also benchmark get_scores against a local stand-in server',
+    )
+    argument_parser.add_argument(
+        '--latency',
+        type=float,
+        default=DEFAULT_LATENCY,
+        help='latency of the stand-in server, in seconds',
+    )
+    argument_parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS)
+    argument_parser.add_argument(
+        '--output',
+        help='file to write the results to, instead of the standard output',
+    )
+    arguments = argument_parser.parse_args()
+
+    results = run_benchmarks(
+        pages=arguments.pages,
+        reviews_count=arguments.reviews_count,
+        message_words=arguments.message_words,
+        employees_count=arguments.employees_count,
+        specific_ratings_count=arguments.specific_ratings_count,
+        repeat=arguments.repeat,
+        over_http=arguments.over_http,
+        latency=arguments.latency,
+        max_workers=arguments.max_workers,
+    )
+
+    if arguments.output:
+        with open(arguments.output, 'w', encoding='utf8') as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+# pylint: disable=protected-access,too-many-arguments
+
+import platform
+import statistics
+import time
+import tracemalloc
+
+from benchmarks.stand_in_server import StandInServer, StandInServerOptions
+from benchmarks.page_generator import (
+    generate_reviews,
+    generate_review_page,
+    render_review_page,
+    DEFAULT_REVIEWS_COUNT,
+    DEFAULT_MESSAGE_WORDS,
+    DEFAULT_EMPLOYEES_COUNT,
+    DEFAULT_SPECIFIC_RATINGS_COUNT,
+)
+
+from dealership_review.core.batch_scorer import calculate_scores
+from dealership_review.core.dealership_review_scrapper import (
+    DealerShipReviewScrapper, PAGE_NUMBER_PATTERN,
+)
+from dealership_review.core.mediator import Mediator
+from dealership_review.core.review import Review
+
+from dealership_review.utils.http_client import HttpClient
+from dealership_review.utils.scrapper import Scrapper, ParserType
+
+DEFAULT_PAGES = 10
+DEFAULT_REPEAT = 5
+DEFAULT_LATENCY = 0.05
+DEFAULT_MAX_WORKERS = 8
+BENCHMARK_DEALERSHIP_URL = 'https://www.dealerrater.com/dealer/Generated-Dealership-12345'
+
+
+class GeneratedPagesHttpClient(HttpClient):
+    """
+    HTTP client answering with generated review pages instead of requesting them,
+    and with an empty page past the last one
+    """
+
+    def __init__(self, pages: int, **page_options):
+        super().__init__()
+        self.pages_html = {
+            page_number: generate_review_page(
+                page_number=page_number,
+                last_page_number=pages,
+                **page_options,
+            )
+            for page_number in range(1, pages + 1)
+        }
+        self.empty_page_html = render_review_page([], last_page_number=pages)
+
+    def get_html(self, url: str) -> str:
+        page_number = int(PAGE_NUMBER_PATTERN.search(url).group(1))
+
+        return self.pages_html.get(page_number, self.empty_page_html)
+
+
+def run_benchmarks(
+        pages: int = DEFAULT_PAGES,
+        reviews_count: int = DEFAULT_REVIEWS_COUNT,
+        message_words: int = DEFAULT_MESSAGE_WORDS,
+        employees_count: int = DEFAULT_EMPLOYEES_COUNT,
+        specific_ratings_count: int = DEFAULT_SPECIFIC_RATINGS_COUNT,
+        repeat: int = DEFAULT_REPEAT,
+        over_http: bool = False,
+        latency: float = DEFAULT_LATENCY,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+) -> dict:
+    """
+    Runs every benchmark over generated pages and returns their results,
+    along with the options and the environment they ran with.
+    With over_http, `Mediator.get_scores` is also measured against a local
+    stand-in server answering after the given latency.
+    """
+    page_options = {
+        'reviews_count': reviews_count,
+        'message_words': message_words,
+        'employees_count': employees_count,
+        'specific_ratings_count': specific_ratings_count,
+    }
+    page_html = generate_review_page(**page_options)
+    scrapped_reviews = generate_reviews(**page_options)
+
+    results = {
+        'environment': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+        },
+        'options': {
+            'pages': pages,
+            'repeat': repeat,
+            **{name.replace('_', '-'): value for name, value in page_options.items()},
+        },
+        'results': {
+            'scrapper-parse': {
+                parser.value: benchmark_parse(page_html, parser, repeat)
+                for parser in ParserType
+            },
+            'review-extraction': {
+                parser.value: benchmark_extraction(page_html, parser, repeat)
+                for parser in ParserType
+            },
+            'review-scoring': benchmark_scoring(scrapped_reviews, repeat),
+            'batch-scoring': benchmark_batch_scoring(scrapped_reviews, repeat),
+            'get-scores': benchmark_get_scores(pages, page_options, repeat),
+        },
+    }
+
+    if over_http:
+        results['options'].update({'latency': latency, 'max-workers': max_workers})
+        results['results']['get-scores-over-http'] = benchmark_get_scores_over_http(
+            pages,
+            page_options,
+            latency,
+            max_workers,
+            repeat,
+        )
+
+    return results
+
+
+def benchmark_parse(page_html: str, parser: ParserType, repeat: int = DEFAULT_REPEAT) -> dict:
+    """
+    Measures the time to parse a page and find its reviews with `Scrapper`
+    """
+    def parse():
+        Scrapper(page_html, parser).find_all_elements('div', cls='review-entry')
+
+    return _get_timing(_measure(parse, repeat), 'seconds-per-page', 1)
+
+
+def benchmark_extraction(
+        page_html: str,
+        parser: ParserType,
+        repeat: int = DEFAULT_REPEAT,
+) -> dict:
+    """
+    Measures the time `DealerShipReviewScrapper` takes to extract the data of
+    each review of an already parsed page
+    """
+    dealership_review_scrapper = DealerShipReviewScrapper(parser=parser)
+    raw_reviews = Scrapper(page_html, parser).find_all_elements('div', cls='review-entry')
+
+    def extract():
+        for raw_review in raw_reviews:
+            dealership_review_scrapper._get_processed_review_from_raw_review(raw_review)
+
+    return _get_timing(_measure(extract, repeat), 'seconds-per-review', len(raw_reviews))
+
+
+def benchmark_scoring(scrapped_reviews: list, repeat: int = DEFAULT_REPEAT) -> dict:
+    """
+    Measures the throughput of `Review.score`, on new reviews every time
+    since the score is cached
+    """
+    def score():
+        for scrapped_review in scrapped_reviews:
+            _ = Review.from_dict(scrapped_review).score
+
+    return _get_throughput(_measure(score, repeat), len(scrapped_reviews))
+
+
+def benchmark_batch_scoring(scrapped_reviews: list, repeat: int = DEFAULT_REPEAT) -> dict:
+    """
+    Measures the throughput of the vectorized `calculate_scores`
+    """
+    return _get_throughput(
+        _measure(lambda: calculate_scores(scrapped_reviews), repeat),
+        len(scrapped_reviews),
+    )
+
+
+def benchmark_get_scores(pages: int, page_options: dict, repeat: int = DEFAULT_REPEAT) -> dict:
+    """
+    Measures `Mediator.get_scores` from end to end over generated pages, and its
+    peak memory, traced in a run of its own so the timings are not slowed down
+    """
+    mediator = Mediator(http_client=GeneratedPagesHttpClient(pages, **page_options))
+
+    def get_scores():
+        mediator.get_scores(pages=pages, dealership_url=BENCHMARK_DEALERSHIP_URL)
+
+    timing = _get_timing(_measure(get_scores, repeat), 'seconds-per-page', pages)
+
+    tracemalloc.start()
+    try:
+        get_scores()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {**timing, 'peak-memory-bytes': peak_memory}
+
+
+def benchmark_get_scores_over_http(
+        pages: int,
+        page_options: dict,
+        latency: float = DEFAULT_LATENCY,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        repeat: int = DEFAULT_REPEAT,
+) -> dict:
+    """
+    Measures `Mediator.get_scores` from end to end against a local stand-in server
+    """
+    options = StandInServerOptions(pages=pages, latency=latency, **page_options)
+
+    with StandInServer(options) as stand_in_server:
+        mediator = Mediator(http_client=HttpClient(pool_size=max_workers))
+
+        def get_scores():
+            mediator.get_scores(
+                pages=pages,
+                dealership_url=stand_in_server.url,
+                max_workers=max_workers,
+            )
+
+        try:
+            timing = _get_timing(_measure(get_scores, repeat), 'seconds-per-page', pages)
+        finally:
+            mediator.close()
+
+    return {**timing, 'requests': stand_in_server.requests_count}
+
+
+def _measure(function, repeat: int) -> list:
+    """
+    Returns the duration in seconds of each of repeat calls to the function
+    """
+    durations = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return durations
+
+
+def _get_timing(durations: list, unit_name: str, units_count: int) -> dict:
+    return {
+        'best-seconds': min(durations),
+        'mean-seconds': statistics.mean(durations),
+        unit_name: min(durations) / max(units_count, 1),
+        'runs': len(durations),
+    }
+
+
+def _get_throughput(durations: list, reviews_count: int) -> dict:
+    return {
+        **_get_timing(durations, 'seconds-per-review', reviews_count),
+        'reviews-per-second': reviews_count / min(durations) if min(durations) else None,
+    }
@@ -0,0 +1,183 @@
+# pylint: disable=too-many-arguments
+
+import html
+import random
+
+from dealership_review.core.review import POSITIVE_WORDS, NEGATIVE_WORDS
+from dealership_review.utils.slugifier import Slugifier
+
+DEFAULT_REVIEWS_COUNT = 10
+DEFAULT_MESSAGE_WORDS = 80
+DEFAULT_EMPLOYEES_COUNT = 2
+DEFAULT_SPECIFIC_RATINGS_COUNT = 5
+DEALERSHIP_PATH = '/dealer/Generated-Dealership-dealer-reviews-12345'
+SPECIFIC_RATINGS_NAMES = [
+    'Customer Service',
+    'Quality of Work',
+    'Friendliness',
+    'Pricing',
+    'Overall Experience',
+]
+FILLER_WORDS = [
+    'the', 'car', 'was', 'and', 'we', 'they', 'sales', 'truck', 'service', 'team',
+    'dealership', 'finance', 'trade', 'in', 'price', 'visit', 'drive', 'test', 'new',
+    'used', 'to', 'my', 'with', 'for', 'at', 'oil', 'change', 'warranty', 'paperwork',
+]
+SENTIMENT_WORDS_RATIO = 0.1
+TITLE_WORDS = 3
+
+
+def generate_reviews(
+        reviews_count: int = DEFAULT_REVIEWS_COUNT,
+        message_words: int = DEFAULT_MESSAGE_WORDS,
+        employees_count: int = DEFAULT_EMPLOYEES_COUNT,
+        specific_ratings_count: int = DEFAULT_SPECIFIC_RATINGS_COUNT,
+        seed: int = 0,
+) -> list:
+    """
+    Generates the data of random reviews, as dictionaries in the format of `Review.to_dict`
+    """
+    generator = random.Random(seed)
+
+    return [
+        _generate_review(
+            generator,
+            index,
+            message_words,
+            employees_count,
+            specific_ratings_count,
+        )
+        for index in range(reviews_count)
+    ]
+
+
+def render_review_page(reviews: list, page_number: int = 1, last_page_number: int = 1) -> str:
+    """
+    Renders reviews as a DealerRater review page, with the pagination up to last_page_number
+    """
+    reviews_html = ''.join(_render_review(review) for review in reviews)
+    pagination_html = ''.join(
+        f'<a class="page_{"active" if number == page_number else "inactive"}" '
+        f'href="{DEALERSHIP_PATH}/page{number}/">{number}</a>'
+        for number in range(1, last_page_number + 1)
+    )
+
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="UTF-8">'
+        '<title>Generated Dealership - Dealer Reviews | DealerRater.com</title>'
+        '<script type="text/javascript">var dataLayer = [{"page": "dealer-reviews"}];</script>'
+        '</head><body>'
+        '<div id="header" class="header"><a href="/" class="logo">DealerRater</a></div>'
+        f'<div id="reviews" class="review-list">{reviews_html}</div>'
+        f'<div class="pagination">{pagination_html}</div>'
+        '<div id="footer" class="footer"><p class="font-16">Copyright DealerRater</p></div>'
+        '</body></html>'
+    )
+
+
+def generate_review_page(
+        reviews_count: int = DEFAULT_REVIEWS_COUNT,
+        message_words: int = DEFAULT_MESSAGE_WORDS,
+        employees_count: int = DEFAULT_EMPLOYEES_COUNT,
+        specific_ratings_count: int = DEFAULT_SPECIFIC_RATINGS_COUNT,
+        page_number: int = 1,
+        last_page_number: int = 1,
+) -> str:
+    """
+    Generates a DealerRater review page of random reviews. The same page number
+    always gives the same page.
+    """
+    reviews = generate_reviews(
+        reviews_count=reviews_count,
+        message_words=message_words,
+        employees_count=employees_count,
+        specific_ratings_count=specific_ratings_count,
+        seed=page_number,
+    )
+
+    return render_review_page(reviews, page_number, last_page_number)
+
+
+def _generate_review(
+        generator: random.Random,
+        index: int,
+        message_words: int,
+        employees_count: int,
+        specific_ratings_count: int,
+) -> dict:
+    specific_ratings_names = [
+        SPECIFIC_RATINGS_NAMES[rating_index % len(SPECIFIC_RATINGS_NAMES)] +
+        (f' {rating_index // len(SPECIFIC_RATINGS_NAMES)}'
+         if rating_index >= len(SPECIFIC_RATINGS_NAMES) else '')
+        for rating_index in range(specific_ratings_count)
+    ]
+    words = [_generate_word(generator) for _ in range(max(message_words, TITLE_WORDS + 1))]
+    title = ' '.join(words[:TITLE_WORDS]).capitalize()
+    whole_message = ' '.join(words[TITLE_WORDS:]).capitalize() + '.'
+
+    return {
+        'reviewer': f'Reviewer {index}',
+        'overall-score': _generate_rating(generator),
+        'employees-scores': [_generate_rating(generator) for _ in range(employees_count)],
+        'message': f'{title} {whole_message}',
+        'recommend-dealer': generator.random() < 0.8,
+        'specific-scores': {
+            Slugifier.slugify(name): _generate_rating(generator)
+            for name in specific_ratings_names
+        },
+    }
+
+
+def _generate_word(generator: random.Random) -> str:
+    if generator.random() < SENTIMENT_WORDS_RATIO:
+        return generator.choice(POSITIVE_WORDS + NEGATIVE_WORDS)
+
+    return generator.choice(FILLER_WORDS)
+
+
+def _generate_rating(generator: random.Random) -> int:
+    return generator.randrange(0, 60, 10)
+
+
+def _render_review(review: dict) -> str:
+    *title_words, whole_message = review['message'].split(' ', TITLE_WORDS)
+    title = ' '.join(title_words)
+    employees_html = ''.join(
+        '<div class="col-xs-12 col-sm-6 col-md-4 pad-left-none review-employee">'
+        f'<a class="notranslate tagged-emp small-text teal" href="/sales/Employee-{index}/">'
+        f'Employee {index}</a>'
+        f'<div class="rating-static rating-{score:02d} margin-center"></div></div>'
+        for index, score in enumerate(review['employees-scores'])
+    )
+    specific_ratings_html = ''.join(
+        '<div class="tr"><div class="lt-grey small-text td">'
+        f'{html.escape(name.replace("-", " ").title())}</div>'
+        f'<div class="rating-static-indv rating-{score:02d} margin-top-none td"></div></div>'
+        for name, score in review['specific-scores'].items()
+    )
+    recommend_dealer = 'Yes' if review['recommend-dealer'] else 'No'
+
+    return (
+        '<div class="review-entry col-xs-12 text-left pad-none pad-top-lg">'
+        '<div class="col-xs-12 col-sm-3 pad-left-none text-center review-date">'
+        '<div class="italic col-xs-6 col-sm-12 pad-none margin-none font-20">January 1, 2022</div>'
+        '<div class="rating-static visible-xs pad-none margin-none '
+        f'rating-{review["overall-score"]:02d} pull-right"></div>'
+        f'<div class="rating-static hidden-xs rating-{review["overall-score"]:02d} '
+        'margin-center"></div></div>'
+        '<div class="col-xs-12 col-sm-9 pad-none review-wrapper">'
+        '<div class="margin-bottom-sm line-height-150">'
+        '<span class="italic font-16 bolder notranslate">'
+        f'by {html.escape(review["reviewer"])}</span></div>'
+        '<p class="font-16 review-content margin-bottom-none line-height-25">'
+        f'<span class="review-title bolder font-18 italic">{html.escape(title)}</span> '
+        '<span class="review-whole display-none">'
+        f'{html.escape(whole_message)}</span></p>'
+        '<div class="pull-left bg-grey-lt margin-bottom-md review-ratings-all review-hide">'
+        f'<div class="table width-100">{specific_ratings_html}'
+        '<div class="tr"><div class="lt-grey small-text td">Recommend Dealer</div>'
+        f'<div class="td small-text boldest">{recommend_dealer}</div></div></div></div>'
+        '<div class="col-xs-12 lt-grey pad-left-none employees-wrapper">'
+        f'<span class="small-text">Employees Worked With </span>{employees_html}</div>'
+        '</div></div>'
+    )
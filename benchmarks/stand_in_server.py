@@ -0,0 +1,325 @@
+# pylint: disable=too-many-instance-attributes,too-many-arguments,too-few-public-methods
+
+import argparse
+import random
+import socket
+import struct
+import threading
+import time
+from enum import Enum
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks.page_generator import (
+    generate_review_page,
+    DEFAULT_REVIEWS_COUNT,
+    DEFAULT_MESSAGE_WORDS,
+    DEFAULT_EMPLOYEES_COUNT,
+    DEFAULT_SPECIFIC_RATINGS_COUNT,
+)
+
+from dealership_review.core.dealership_review_scrapper import PAGE_NUMBER_PATTERN
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PAGES = 10
+DEALERSHIP_PATH = '/dealer/Stand-In-Dealership-dealer-reviews-12345'
+SERVER_ERROR_STATUS_CODES = (500, 502, 503)
+RETRY_AFTER_SECONDS = 1
+POLL_INTERVAL = 0.05
+
+
+class LatencyDistribution(Enum):
+    """
+    Enum class to define how the latency of each response is drawn
+    """
+    CONSTANT = 'constant'
+    UNIFORM = 'uniform'
+    EXPONENTIAL = 'exponential'
+
+
+class StandInServerOptions:
+    """
+    Behaviour of a stand-in server: the pages it serves, how long it takes to
+    answer them, and the share of requests that fail on purpose
+    """
+
+    def __init__(
+            self,
+            pages: int = DEFAULT_PAGES,
+            reviews_count: int = DEFAULT_REVIEWS_COUNT,
+            message_words: int = DEFAULT_MESSAGE_WORDS,
+            employees_count: int = DEFAULT_EMPLOYEES_COUNT,
+            specific_ratings_count: int = DEFAULT_SPECIFIC_RATINGS_COUNT,
+            latency: float = 0,
+            latency_distribution: LatencyDistribution = LatencyDistribution.CONSTANT,
+            throttle_rate: float = 0,
+            server_error_rate: float = 0,
+            reset_rate: float = 0,
+            drip_chunk_size: int = None,
+            drip_interval: float = 0,
+            seed: int = 0,
+    ):
+        self.pages = pages
+        self.page_options = {
+            'reviews_count': reviews_count,
+            'message_words': message_words,
+            'employees_count': employees_count,
+            'specific_ratings_count': specific_ratings_count,
+        }
+        self.latency = latency
+        self.latency_distribution = latency_distribution
+        self.throttle_rate = throttle_rate
+        self.server_error_rate = server_error_rate
+        self.reset_rate = reset_rate
+        self.drip_chunk_size = drip_chunk_size
+        self.drip_interval = drip_interval
+        self.seed = seed
+
+
+class StandInServer:
+    """
+    Local HTTP server standing in for DealerRater. It serves generated review
+    pages at `{url}/pageN/`, and an empty page past the last one, so a whole
+    scrapping can be load tested without network access.
+    Responses can be delayed, dripped slowly, answered with 429 or 5xx status
+    codes, or have their connection reset, see `StandInServerOptions`.
+    """
+
+    def __init__(
+            self,
+            options: StandInServerOptions = None,
+            host: str = DEFAULT_HOST,
+            port: int = 0,
+    ):
+        self.options = options or StandInServerOptions()
+        self.requests_count = 0
+        self._random = random.Random(self.options.seed)
+        self._lock = threading.Lock()
+        self._http_server = ThreadingHTTPServer((host, port), _StandInRequestHandler)
+        self._http_server.daemon_threads = True
+        self._http_server.stand_in_server = self
+        self._thread = None
+
+    def __enter__(self) -> 'StandInServer':
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """
+        The dealership url to scrap the served pages from
+        """
+        host, port = self._http_server.server_address[:2]
+
+        return f'http://{host}:{port}{DEALERSHIP_PATH}'
+
+    def start(self):
+        """
+        Starts serving in a background thread
+        """
+        self._thread = threading.Thread(
+            target=self._http_server.serve_forever,
+            args=(POLL_INTERVAL,),
+            daemon=True,
+        )
+        self._thread.start()
+
+    def serve_forever(self):
+        """
+        Serves in the current thread until interrupted
+        """
+        self._http_server.serve_forever()
+
+    def stop(self):
+        """
+        Stops serving and closes the listening socket
+        """
+        self._http_server.shutdown()
+        self._http_server.server_close()
+
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def draw_outcome(self) -> tuple:
+        """
+        Counts a new request and draws its latency and whether it should be
+        reset, throttled or fail. Returns the latency and the status code,
+        which is None for a reset connection.
+        """
+        with self._lock:
+            self.requests_count += 1
+            latency = self._draw_latency()
+            draw = self._random.random()
+
+        options = self.options
+
+        if draw < options.reset_rate:
+            return latency, None
+        draw -= options.reset_rate
+
+        if draw < options.throttle_rate:
+            return latency, 429
+        draw -= options.throttle_rate
+
+        if draw < options.server_error_rate:
+            return latency, SERVER_ERROR_STATUS_CODES[
+                int(draw / options.server_error_rate * len(SERVER_ERROR_STATUS_CODES))
+            ]
+
+        return latency, 200
+
+    def get_page(self, page_number: int) -> bytes:
+        """
+        Returns the html of a page, empty past the last one
+        """
+        return _render_page(
+            page_number if page_number <= self.options.pages else 0,
+            self.options.pages,
+            tuple(sorted(self.options.page_options.items())),
+        )
+
+    def _draw_latency(self) -> float:
+        latency = self.options.latency
+
+        if self.options.latency_distribution is LatencyDistribution.UNIFORM:
+            return self._random.uniform(0, 2 * latency)
+        if self.options.latency_distribution is LatencyDistribution.EXPONENTIAL:
+            return self._random.expovariate(1 / latency) if latency else 0
+
+        return latency
+
+
+@lru_cache(maxsize=None)
+def _render_page(page_number: int, last_page_number: int, page_options: tuple) -> bytes:
+    page_options = dict(page_options)
+
+    if not page_number:
+        page_options['reviews_count'] = 0
+
+    return generate_review_page(
+        page_number=page_number,
+        last_page_number=last_page_number,
+        **page_options,
+    ).encode('utf8')
+
+
+class _StandInRequestHandler(BaseHTTPRequestHandler):
+    """
+    Answers the requests made to a `StandInServer`
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """
+        Answers a review page after the drawn latency, unless the request
+        is drawn to be reset or to fail
+        """
+        stand_in_server = self.server.stand_in_server
+        page_number_match = PAGE_NUMBER_PATTERN.search(self.path)
+        latency, status_code = stand_in_server.draw_outcome()
+
+        time.sleep(latency)
+
+        if status_code is None:
+            self._reset_connection()
+        elif not page_number_match:
+            self._send_body(404, b'Not Found')
+        elif status_code != 200:
+            self._send_body(status_code, b'', {'Retry-After': str(RETRY_AFTER_SECONDS)})
+        else:
+            self._send_body(200, stand_in_server.get_page(int(page_number_match.group(1))))
+
+    def log_message(self, *_):  # pylint: disable=arguments-differ
+        pass
+
+    def _send_body(self, status_code: int, body: bytes, headers: dict = None):
+        options = self.server.stand_in_server.options
+
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        if not options.drip_chunk_size:
+            self.wfile.write(body)
+            return
+
+        try:
+            for start in range(0, len(body), options.drip_chunk_size):
+                self.wfile.write(body[start:start + options.drip_chunk_size])
+                self.wfile.flush()
+                time.sleep(options.drip_interval)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client gave up on the body
+            self.close_connection = True
+
+    def _reset_connection(self):
+        """
+        Closes the connection with a TCP reset instead of a response
+        """
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+        self.connection.close()
+        self.close_connection = True
+
+
+def main():
+    """
+    Runs a stand-in server until interrupted
+    """
+    argument_parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.stand_in_server',
+        description='Serves generated DealerRater review pages locally',
+    )
+    argument_parser.add_argument('--host', default=DEFAULT_HOST)
+    argument_parser.add_argument('--port', type=int, default=8000)
+    argument_parser.add_argument('--pages', type=int, default=DEFAULT_PAGES)
+    argument_parser.add_argument('--reviews-count', type=int, default=DEFAULT_REVIEWS_COUNT)
+    argument_parser.add_argument('--latency', type=float, default=0, help='mean, in seconds')
+    argument_parser.add_argument(
+        '--latency-distribution',
+        type=LatencyDistribution,
+        choices=list(LatencyDistribution),
+        default=LatencyDistribution.CONSTANT,
+    )
+    argument_parser.add_argument('--throttle-rate', type=float, default=0)
+    argument_parser.add_argument('--server-error-rate', type=float, default=0)
+    argument_parser.add_argument('--reset-rate', type=float, default=0)
+    argument_parser.add_argument('--drip-chunk-size', type=int)
+    argument_parser.add_argument('--drip-interval', type=float, default=0)
+    arguments = argument_parser.parse_args()
+
+    stand_in_server = StandInServer(
+        StandInServerOptions(
+            pages=arguments.pages,
+            reviews_count=arguments.reviews_count,
+            latency=arguments.latency,
+            latency_distribution=arguments.latency_distribution,
+            throttle_rate=arguments.throttle_rate,
+            server_error_rate=arguments.server_error_rate,
+            reset_rate=arguments.reset_rate,
+            drip_chunk_size=arguments.drip_chunk_size,
+            drip_interval=arguments.drip_interval,
+        ),
+        host=arguments.host,
+        port=arguments.port,
+    )
+
+    print(f'Serving review pages at {stand_in_server.url}/pageN/')
+
+    try:
+        stand_in_server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stand_in_server.stop()
+
+
+if __name__ == '__main__':
+    main()
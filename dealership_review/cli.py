@@ -0,0 +1,232 @@
+import argparse
+import sys
+from contextlib import ExitStack, nullcontext
+
+from dealership_review.core.dealership_review_scrapper import create_parse_executor
+from dealership_review.core.mediator import (
+    Mediator,
+    DEFAULT_REVIEWED_PAGES,
+    DEFAULT_RETURNED_REVIEWS,
+    DEFAULT_DEALERSHIP_URL,
+    DEFAULT_MANY_MAX_WORKERS,
+)
+from dealership_review.core.review_sinks import open_review_sink
+from dealership_review.core.review_sorter import SortType
+from dealership_review.core.review_store import ReviewStore, DEFAULT_MAX_AGE
+from dealership_review.core.watermark_store import WatermarkStore
+
+from dealership_review.utils.hedging_policy import HedgingPolicy
+from dealership_review.utils.http_cache import HttpCache, DEFAULT_TTL
+from dealership_review.utils.http_client import HttpClient, DEFAULT_POOL_SIZE
+from dealership_review.utils.logger import Logger
+from dealership_review.utils.metrics import MetricsCollector
+from dealership_review.utils.profiler import Profiler
+from dealership_review.utils.rate_limiter import RateLimiter
+from dealership_review.utils.retry_policy import RetryPolicy, DEFAULT_MAX_RETRIES
+from dealership_review.utils.scrapper import ParserType, DEFAULT_PARSER
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def build_argument_parser() -> argparse.ArgumentParser:
+    """
+    Returns the parser of the command-line arguments
+    """
+    argument_parser = argparse.ArgumentParser(
+        prog='python -m dealership_review',
+        description='Scraps DealerRater reviews of dealerships and prints the top scored ones',
+    )
+    argument_parser.add_argument(
+        '--url',
+        dest='urls',
+        action='append',
+        help='dealership url to scrap, may be given many times '
+             '(default: McKaig Chevrolet Buick)',
+    )
+    argument_parser.add_argument('--pages', type=int, default=DEFAULT_REVIEWED_PAGES)
+    argument_parser.add_argument(
+        '--all-pages',
+        action='store_true',
+        help='scrap every page of the pagination, instead of --pages',
+    )
+    argument_parser.add_argument(
+        '--discover-pages',
+        action='store_true',
+        help='never request pages past the last one of the pagination',
+    )
+    argument_parser.add_argument('--count', type=int, default=DEFAULT_RETURNED_REVIEWS)
+    argument_parser.add_argument(
+        '--sort',
+        choices=[sort_type.value for sort_type in SortType],
+        default=SortType.ASC.value,
+    )
+    argument_parser.add_argument('--debug', action='store_true', help='log the scrapping steps')
+
+    concurrency_arguments = argument_parser.add_argument_group('concurrency')
+    concurrency_arguments.add_argument(
+        '--max-workers',
+        type=int,
+        help=f'pages fetched at the same time (default: {DEFAULT_MAX_WORKERS}, '
+             f'or {DEFAULT_MANY_MAX_WORKERS} for many urls)',
+    )
+    concurrency_arguments.add_argument(
+        '--parse-processes',
+        type=int,
+        default=0,
+        help='processes parsing the pages, none to parse them in the fetching threads',
+    )
+    concurrency_arguments.add_argument('--pool-size', type=int, default=DEFAULT_POOL_SIZE)
+    concurrency_arguments.add_argument(
+        '--parser',
+        choices=[parser.value for parser in ParserType],
+        default=DEFAULT_PARSER.value,
+    )
+
+    http_arguments = argument_parser.add_argument_group('http')
+    http_arguments.add_argument('--retries', type=int, default=DEFAULT_MAX_RETRIES)
+    http_arguments.add_argument(
+        '--hedge',
+        action='store_true',
+        help='duplicate the requests slower than the p95 latency',
+    )
+    http_arguments.add_argument(
+        '--rate-limit',
+        action='store_true',
+        help='adapt the request rate and concurrency to each host',
+    )
+
+    cache_arguments = argument_parser.add_argument_group('cache')
+    cache_arguments.add_argument('--cache-dir', help='directory to cache the responses in')
+    cache_arguments.add_argument('--cache-ttl', type=float, default=DEFAULT_TTL)
+    cache_arguments.add_argument(
+        '--watermark-dir',
+        help='directory to store the scrapped reviews in, to only scrap new ones later',
+    )
+    cache_arguments.add_argument(
+        '--review-store',
+        help='SQLite database to store the scored reviews in, and to answer from, '
+             'for a single url',
+    )
+    cache_arguments.add_argument('--max-age', type=float, default=DEFAULT_MAX_AGE)
+
+    output_arguments = argument_parser.add_argument_group('output')
+    output_arguments.add_argument(
+        '--output',
+        help='file to write every scrapped review to, as CSV if it ends with .csv, '
+             'or as JSON lines otherwise',
+    )
+    output_arguments.add_argument(
+        '--profile',
+        metavar='PATH',
+        help='profile the run, writing the cProfile stats to PATH, and a summary '
+             'of the time and memory taken to the standard error',
+    )
+
+    return argument_parser
+
+
+def main(argv: list = None) -> int:
+    """
+    Runs the scrapping described by the command-line arguments and prints the
+    top scored reviews of each dealership
+    """
+    arguments = build_argument_parser().parse_args(argv)
+    metrics = MetricsCollector() if arguments.profile else None
+    profiler = Profiler(metrics) if arguments.profile else None
+
+    with ExitStack() as exit_stack:
+        mediator = _create_mediator(arguments, metrics, exit_stack)
+        exit_stack.callback(mediator.close)
+
+        sink = exit_stack.enter_context(open_review_sink(arguments.output)) \
+            if arguments.output else None
+
+        with profiler or nullcontext():
+            dealerships_reviews = _get_scores(mediator, arguments, sink)
+
+    Logger().flush()
+
+    for dealership_url, reviews in dealerships_reviews.items():
+        if len(dealerships_reviews) > 1:
+            print(dealership_url)
+
+        print('###')
+        for review in reviews:
+            print(review)
+        print('###')
+
+    if profiler:
+        profiler.dump_stats(arguments.profile)
+        print(profiler.get_summary(), file=sys.stderr)
+
+    return 0
+
+
+def _create_mediator(
+        arguments: argparse.Namespace,
+        metrics: MetricsCollector,
+        exit_stack: ExitStack,
+) -> Mediator:
+    http_client = HttpClient(
+        pool_size=arguments.pool_size,
+        cache=HttpCache(arguments.cache_dir, ttl=arguments.cache_ttl)
+        if arguments.cache_dir else None,
+        metrics=metrics,
+        rate_limiter=RateLimiter() if arguments.rate_limit else None,
+        retry_policy=RetryPolicy(max_retries=arguments.retries),
+        hedging_policy=HedgingPolicy() if arguments.hedge else None,
+    )
+    parse_executor = exit_stack.enter_context(
+        create_parse_executor(arguments.parse_processes, ParserType(arguments.parser))
+    ) if arguments.parse_processes else None
+
+    return Mediator(
+        http_client=http_client,
+        parser=ParserType(arguments.parser),
+        parse_executor=parse_executor,
+        metrics=metrics,
+    )
+
+
+def _get_scores(mediator: Mediator, arguments: argparse.Namespace, sink) -> dict:
+    """
+    Returns the top reviews of each dealership of the arguments, by url
+    """
+    urls = arguments.urls or [DEFAULT_DEALERSHIP_URL]
+    pages = None if arguments.all_pages else arguments.pages
+    discover_pages = arguments.all_pages or arguments.discover_pages
+    watermark_store = WatermarkStore(arguments.watermark_dir) \
+        if arguments.watermark_dir else None
+
+    if len(urls) > 1:
+        return mediator.get_scores_for_many(
+            urls,
+            pages=pages,
+            count=arguments.count,
+            sort_type=SortType(arguments.sort),
+            debug_log=arguments.debug,
+            max_workers=arguments.max_workers or DEFAULT_MANY_MAX_WORKERS,
+            watermark_store=watermark_store,
+            discover_pages=discover_pages,
+            sink=sink,
+        )
+
+    review_store = ReviewStore(arguments.review_store, max_age=arguments.max_age) \
+        if arguments.review_store else None
+
+    try:
+        return {urls[0]: mediator.get_scores(
+            pages=pages,
+            count=arguments.count,
+            dealership_url=urls[0],
+            sort_type=SortType(arguments.sort),
+            debug_log=arguments.debug,
+            max_workers=arguments.max_workers or DEFAULT_MAX_WORKERS,
+            watermark_store=watermark_store,
+            discover_pages=discover_pages,
+            review_store=review_store,
+            sink=sink,
+        )}
+    finally:
+        if review_store:
+            review_store.close()
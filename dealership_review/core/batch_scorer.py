@@ -0,0 +1,75 @@
+from itertools import chain
+
+import numpy as np
+
+from dealership_review.core.lexicon import Lexicon
+from dealership_review.core.review import (
+    DEFAULT_LEXICON,
+    RECOMMEND_DEALER_SCORE,
+    OVERALL_SCORE_WEIGHT,
+    EMPLOYEES_SCORE_WEIGHT,
+    SPECIFIC_SCORES_WEIGHT,
+)
+
+
+def calculate_scores(scrapped_reviews: list, lexicon: Lexicon = DEFAULT_LEXICON) -> np.ndarray:
+    """
+    Calculates the score of many scrapped reviews at once, laying their values
+    out as arrays. The returned scores are exactly the ones `Review.score` gives
+    for each review, in the same order.
+    """
+    reviews_count = len(scrapped_reviews)
+
+    recommend_dealer = np.fromiter(
+        (bool(review['recommend-dealer']) for review in scrapped_reviews),
+        dtype=np.bool_,
+        count=reviews_count,
+    )
+    overall_scores = np.fromiter(
+        (review['overall-score'] for review in scrapped_reviews),
+        dtype=np.float64,
+        count=reviews_count,
+    )
+    message_scores = np.array(
+        lexicon.score_many(review['message'] for review in scrapped_reviews),
+        dtype=np.int64,
+    )
+    employees_scores = _calculate_average_scores(
+        [review['employees-scores'] for review in scrapped_reviews],
+        EMPLOYEES_SCORE_WEIGHT,
+    )
+    specific_scores = _calculate_average_scores(
+        [list(review['specific-scores'].values()) for review in scrapped_reviews],
+        SPECIFIC_SCORES_WEIGHT,
+    )
+
+    scores = \
+        np.where(recommend_dealer, RECOMMEND_DEALER_SCORE, 0) + \
+        np.floor(OVERALL_SCORE_WEIGHT * overall_scores).astype(np.int64) + \
+        message_scores + \
+        employees_scores + \
+        specific_scores
+
+    return np.maximum(scores, 0)
+
+
+def _calculate_average_scores(scores_lists: list, weight: float) -> np.ndarray:
+    """
+    Returns floor(weight * sum / count) for each list of scores, or 0 for an empty list
+    """
+    counts = np.fromiter(map(len, scores_lists), dtype=np.int64, count=len(scores_lists))
+    flat_scores = np.fromiter(chain.from_iterable(scores_lists), dtype=np.float64)
+    sums = np.bincount(
+        np.repeat(np.arange(len(scores_lists)), counts),
+        weights=flat_scores,
+        minlength=len(scores_lists),
+    )
+
+    averages = np.divide(
+        weight * sums,
+        counts,
+        out=np.zeros(len(scores_lists)),
+        where=counts > 0,
+    )
+
+    return np.floor(averages).astype(np.int64)
@@ -1,10 +1,28 @@
-# pylint: disable=missing-function-docstring,bad-staticmethod-argument,too-few-public-methods
+# pylint: disable=missing-function-docstring,bad-staticmethod-argument,too-few-public-methods,too-many-arguments
+# pylint: disable=too-many-locals,too-many-instance-attributes,import-outside-toplevel
+
+from __future__ import annotations
 
 import re
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from dealership_review.core.lexicon import Lexicon
+from dealership_review.core.review import Review
+from dealership_review.core.review_sinks import ReviewSink
+from dealership_review.core.watermark_store import WatermarkStore
 
 from dealership_review.utils.logger import Logger
+from dealership_review.utils.async_http_client import AsyncHttpClient
 from dealership_review.utils.http_client import HttpClient
-from dealership_review.utils.scrapper import Scrapper, ScrapperElement
+from dealership_review.utils.metrics import MetricsCollector, DISABLED_METRICS
+from dealership_review.utils.pipeline import Pipeline, PipelineStage, DEFAULT_QUEUE_SIZE
+from dealership_review.utils.scrapper import (
+    Scrapper, ScrapperElement, ScrapperFilter, ParserType, DEFAULT_PARSER,
+)
 from dealership_review.utils.slugifier import Slugifier
 
 from dealership_review.exceptions.http_client_exceptions import (
@@ -13,21 +31,104 @@ from dealership_review.exceptions.http_client_exceptions import (
 from dealership_review.exceptions.reviewer_exceptions import (
     OverallScoreNotFound, UnableToProcessRating,
 )
-from dealership_review.exceptions.scrapper_exceptions import ElementNotFound
+from dealership_review.exceptions.scrapper_exceptions import ElementNotFound, ScrappingFailed
 
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
 
 RECOMMEND_DEALER_RATING = 'Recommend Dealer'
 RECOMMEND_DEALER_YES_ANSWER = 'yes'
 
+DEFAULT_MAX_WORKERS = 1
+DEFAULT_FETCH_WORKERS = 4
+DEFAULT_PARSE_WORKERS = 1
+DEFAULT_SCORE_WORKERS = 1
+REVIEW_ENTRY_FILTER = ScrapperFilter('div', cls='review-entry')
+FIRST_PAGE_FILTER = ScrapperFilter('div', cls=['review-entry', 'pagination'])
+PAGE_NUMBER_PATTERN = re.compile(r'/page(\d+)/')
+SCRAPPING_EXCEPTIONS = (
+    HttpRequestDidNotReturnOk,
+    HttpRequestConnectionError,
+    ElementNotFound,
+    OverallScoreNotFound,
+    UnableToProcessRating,
+)
+
+
+_parsing_worker = None  # pylint: disable=invalid-name
+
+
+def _raise(exception: Exception):
+    raise exception
+
+
+def _score_reviews(reviews: list) -> list:
+    for review in reviews:
+        _ = review.score
+
+    return reviews
+
+
+def create_parse_executor(
+        max_workers: int = None,
+        parser: ParserType = DEFAULT_PARSER,
+) -> ProcessPoolExecutor:
+    """
+    Returns a pool of processes to give as the parse_executor of a scrapper.
+    Each process keeps a scrapper of its own, so the parser is only loaded once.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_parsing_worker,
+        initargs=(parser,),
+    )
+
+
+def _init_parsing_worker(parser: ParserType):
+    global _parsing_worker  # pylint: disable=global-statement
+    _parsing_worker = DealerShipReviewScrapper(parser=parser)
+
+
+def _parse_reviews_records(html: str, page_number: int) -> list:
+    reviews = _parsing_worker._parse_reviews(html, page_number)  # pylint: disable=protected-access
+
+    return [review.to_dict() for review in reviews]
+
+
+def _parse_reviews_records_and_last_page(html: str) -> tuple:
+    # pylint: disable=protected-access
+    reviews, last_page_number = _parsing_worker._parse_reviews_and_last_page(html)
+
+    return [review.to_dict() for review in reviews], last_page_number
+
 
 class DealerShipReviewScrapper:
     """
     Class intended to scrap a limited number of page reviews from the
     DealerRater website for a specific dealership.
+    When a parse_executor is given, see `create_parse_executor`, the pages html
+    is parsed by its processes, which only send back the scrapped review data.
+    When a metrics collector is given, the parsing and extraction time of each
+    page, the pages and reviews scrapped and the errors are recorded into it.
     """
 
-    def __init__(self):
-        self.http_client = HttpClient()
+    def __init__(
+            self,
+            http_client: HttpClient = None,
+            parser: ParserType = DEFAULT_PARSER,
+            lexicon: Lexicon = None,
+            parse_executor: Executor = None,
+            metrics: MetricsCollector = None,
+    ):
+        self.metrics = metrics or DISABLED_METRICS
+        self.http_client = http_client or HttpClient(metrics=self.metrics)
+        self.parser = parser
+        self.lexicon = lexicon
+        self.parse_executor = parse_executor
+        self.async_http_client = AsyncHttpClient(metrics=self.metrics)
         self.logger = Logger()
         self.debug_log = False
 
@@ -35,59 +136,534 @@ class DealerShipReviewScrapper:
             self,
             pages: int,
             dealership_url: str,
-            debug_log: bool = False
+            debug_log: bool = False,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            watermark_store: WatermarkStore = None,
+            discover_pages: bool = False,
+            executor: Executor = None,
+            sink: ReviewSink = None,
+            raise_on_failure: bool = False,
     ) -> list:
         """
         Scraps through a limited number of pages reviews for a specific dealership
-        The returned value is a list of dictionaries containing a score/rating
-        data for each review.
+        The returned value is a list of Reviews built from the score/rating
+        data of each review.
+        When max_workers is greater than one, up to max_workers pages are fetched
+        and processed at the same time; the reviews are still returned in page order.
+        An executor may be given instead, to share its workers with other scrappings.
+        When a watermark store is given, the scrapping stops at the first page with
+        only known reviews, and the new reviews are returned followed by the known ones.
+        When discover_pages is set, the pagination of the first page caps the number
+        of pages, which may then be None to scrap all of them, and the scrapping
+        stops at the first empty page.
+        When a sink is given, the new reviews of each page are written to it as soon
+        as the page is scrapped.
+        A scrapping failing before any review is scrapped returns no reviews, or
+        raises ScrappingFailed with raise_on_failure, to tell it apart from a
+        dealership without new reviews.
+        """
+        known_reviews, known_fingerprints = \
+            self._start_scrapping(dealership_url, debug_log, watermark_store)
+        first_pages_getters, page_numbers = \
+            self._get_pages_to_scrap(dealership_url, pages, discover_pages)
+
+        if executor is not None or max_workers > 1:
+            with self._get_pages_executor(executor, max_workers) as pages_executor:
+                scrapped_reviews = self._scrap_pages_concurrently(
+                    pages_executor,
+                    dealership_url,
+                    first_pages_getters,
+                    page_numbers,
+                    known_fingerprints,
+                    discover_pages,
+                    sink,
+                    raise_on_failure,
+                )
+        else:
+            scrapped_reviews = self._merge_pages_reviews(
+                chain(first_pages_getters, (
+                    partial(self._get_reviews_for_page, dealership_url, page_number)
+                    for page_number in page_numbers
+                )),
+                known_fingerprints,
+                stop_on_empty_page=discover_pages,
+                sink=self._get_page_sink(sink, dealership_url),
+                raise_on_failure=raise_on_failure,
+            )
+
+        self._log('Finished scrapping reviews')
+
+        return self._merge_known_reviews(
+            scrapped_reviews,
+            known_reviews,
+            dealership_url,
+            watermark_store,
+        )
+
+    def scrap_reviews_pipelined(
+            self,
+            pages: int,
+            dealership_url: str,
+            debug_log: bool = False,
+            watermark_store: WatermarkStore = None,
+            discover_pages: bool = False,
+            fetch_workers: int = DEFAULT_FETCH_WORKERS,
+            parse_workers: int = DEFAULT_PARSE_WORKERS,
+            score_workers: int = DEFAULT_SCORE_WORKERS,
+            queue_size: int = DEFAULT_QUEUE_SIZE,
+            sink: ReviewSink = None,
+            keep_reviews: bool = True,
+    ) -> list:
+        """
+        Same as `scrap_reviews`, but the pages are fetched, parsed and their reviews
+        scored by separate stages of a pipeline, each with its own number of workers.
+        The stages are connected by queues of queue_size pages, so a page is parsed
+        while the next ones are fetched, and fetching waits when parsing falls behind.
+        Without keep_reviews, the reviews are only written to the sink, and none are
+        returned nor stored, so the memory used stays the same whatever the number
+        of pages.
+        """
+        known_reviews, known_fingerprints = \
+            self._start_scrapping(dealership_url, debug_log, watermark_store)
+        first_pages_getters, page_numbers = \
+            self._get_pages_to_scrap(dealership_url, pages, discover_pages)
+
+        with Pipeline([
+                PipelineStage(partial(self._fetch_page, dealership_url), fetch_workers),
+                PipelineStage(self._parse_page, parse_workers),
+                PipelineStage(_score_reviews, score_workers),
+        ], queue_size=queue_size) as pipeline:
+            scrapped_reviews = self._merge_pages_reviews(
+                chain(first_pages_getters, pipeline.run(page_numbers)),
+                known_fingerprints,
+                stop_on_empty_page=discover_pages,
+                sink=self._get_page_sink(sink, dealership_url),
+                keep_reviews=keep_reviews,
+            )
+
+        self._log('Finished scrapping reviews')
+
+        if not keep_reviews:
+            return scrapped_reviews
+
+        return self._merge_known_reviews(
+            scrapped_reviews,
+            known_reviews,
+            dealership_url,
+            watermark_store,
+        )
+
+    async def scrap_reviews_async(
+            self,
+            pages: int,
+            dealership_url: str,
+            debug_log: bool = False,
+            max_workers: int = None,
+            watermark_store: WatermarkStore = None,
+            discover_pages: bool = False,
+            sink: ReviewSink = None,
+    ) -> list:
+        """
+        Asynchronous version of `scrap_reviews`. Pages are requested without blocking
+        the event loop, at most max_workers at a time (all of them when not given),
+        and the reviews are returned in page order with the same error handling.
+        The pages are merged as they arrive, in order, and the ones left to fetch
+        are cancelled as soon as the merge stops.
+        """
+        known_reviews, known_fingerprints = \
+            self._start_scrapping(dealership_url, debug_log, watermark_store)
+        first_pages_getters, page_numbers = \
+            await self._get_pages_to_scrap_async(dealership_url, pages, discover_pages)
+
+        import asyncio
+
+        merge = _PagesReviewsMerge(
+            self,
+            known_fingerprints,
+            stop_on_empty_page=discover_pages,
+            sink=self._get_page_sink(sink, dealership_url),
+        )
+
+        for get_page_reviews in first_pages_getters:
+            merge.add_page(get_page_reviews)
+
+        semaphore = asyncio.Semaphore(max_workers or max(len(page_numbers), 1))
+        tasks = [] if merge.done else [
+            asyncio.ensure_future(
+                self._get_reviews_for_page_async(dealership_url, page_number, semaphore)
+            )
+            for page_number in page_numbers
+        ]
+
+        try:
+            for task in tasks:
+                await asyncio.wait([task])
+                merge.add_page(task.result)
+
+                if merge.done:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        scrapped_reviews = merge.reviews
+
+        self._log('Finished scrapping reviews')
+
+        return self._merge_known_reviews(
+            scrapped_reviews,
+            known_reviews,
+            dealership_url,
+            watermark_store,
+        )
+
+    async def close_async(self):
+        """
+        Closes the connections opened by `scrap_reviews_async`
+        """
+        await self.async_http_client.close()
+
+    @staticmethod
+    def _get_pages_executor(executor: Executor, max_workers: int):
+        """
+        Returns a context for the given executor, which is shared and so left open,
+        or for a new one with max_workers workers
+        """
+        if executor is not None:
+            return nullcontext(executor)
+
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    def _scrap_pages_concurrently(
+            self,
+            executor: Executor,
+            dealership_url: str,
+            first_pages_getters: list,
+            page_numbers: range,
+            known_fingerprints: set,
+            stop_on_empty_page: bool,
+            sink: ReviewSink,
+            raise_on_failure: bool,
+    ) -> list:
+        futures = [
+            executor.submit(self._get_reviews_for_page, dealership_url, page_number)
+            for page_number in page_numbers
+        ]
+
+        try:
+            return self._merge_pages_reviews(
+                chain(first_pages_getters, (future.result for future in futures)),
+                known_fingerprints,
+                stop_on_empty_page=stop_on_empty_page,
+                sink=self._get_page_sink(sink, dealership_url),
+                raise_on_failure=raise_on_failure,
+            )
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _start_scrapping(
+            self,
+            dealership_url: str,
+            debug_log: bool,
+            watermark_store: WatermarkStore = None,
+    ) -> tuple:
+        """
+        Returns the reviews already known of the dealership, and their fingerprints
         """
         self.debug_log = debug_log
         self._log('Starting scrapping reviews')
-        scrapped_reviews = []
-
-        for page_number in range(1, pages + 1):
-            try:
-                scrapped_reviews += self._get_reviews_for_page(dealership_url, page_number)
-            except (HttpRequestDidNotReturnOk, HttpRequestConnectionError):
-                if not scrapped_reviews:
-                    self.logger.error('It was not possible to fetch data from DealerRater')
-                    return []
-            except (ElementNotFound, OverallScoreNotFound, UnableToProcessRating) as exception:
-                if not scrapped_reviews:
-                    self.logger.error(str(exception))
-                    return []
+        known_reviews = watermark_store.load(
+            dealership_url,
+            lexicon=self.lexicon,
+            metrics=self.metrics,
+        ) if watermark_store else []
 
-        self._log('Finished scrapping reviews')
+        return known_reviews, {review.fingerprint() for review in known_reviews}
+
+    def _get_pages_to_scrap(self, dealership_url: str, pages: int, discover_pages: bool) -> tuple:
+        """
+        Returns the getters of the reviews of the pages already scrapped, and the
+        numbers of the pages left to scrap
+        """
+        if discover_pages and pages != 0:
+            return self._discover_pages(dealership_url, pages)
+
+        return [], self._get_page_numbers(pages)
+
+    async def _get_pages_to_scrap_async(
+            self,
+            dealership_url: str,
+            pages: int,
+            discover_pages: bool,
+    ) -> tuple:
+        if discover_pages and pages != 0:
+            return await self._discover_pages_async(dealership_url, pages)
+
+        return [], self._get_page_numbers(pages)
+
+    @staticmethod
+    def _get_page_numbers(pages: int) -> range:
+        """
+        Returns the numbers of the given amount of pages, which must be known
+        when the pagination is not discovered
+        """
+        if pages is None:
+            raise ValueError('pages may only be None when discover_pages is set')
+
+        return range(1, pages + 1)
+
+    def _discover_pages(self, dealership_url: str, pages: int) -> tuple:
+        """
+        Scraps the first page and reads its pagination. Returns a getter for the
+        first page reviews, and the numbers of the remaining pages to scrap.
+        """
+        self._log('Fetching review page 1')
 
-        return scrapped_reviews
+        try:
+            html = self.http_client.get_html(f'{dealership_url}/page1/')
+            first_page_reviews, last_page_number = self._get_reviews_and_last_page(html)
+        except SCRAPPING_EXCEPTIONS as exception:
+            return [partial(_raise, exception)], range(0)
 
-    def _get_reviews_for_page(self, dealership_url: str, page_number: int):
-        self._log(f'Fetching review page {page_number}')
+        return self._get_discovered_pages(first_page_reviews, last_page_number, pages)
+
+    async def _discover_pages_async(self, dealership_url: str, pages: int) -> tuple:
+        self._log('Fetching review page 1')
+
+        try:
+            html = await self.async_http_client.get_html(f'{dealership_url}/page1/')
+            first_page_reviews, last_page_number = \
+                await self._get_reviews_and_last_page_async(html)
+        except SCRAPPING_EXCEPTIONS as exception:
+            return [partial(_raise, exception)], range(0)
+
+        return self._get_discovered_pages(first_page_reviews, last_page_number, pages)
+
+    def _get_discovered_pages(
+            self,
+            first_page_reviews: list,
+            last_page_number: int,
+            pages: int,
+    ) -> tuple:
+        self._log('Found %s review pages', last_page_number)
+
+        if pages is not None:
+            last_page_number = min(pages, last_page_number)
+
+        return [lambda: first_page_reviews], range(2, last_page_number + 1)
+
+    def _merge_pages_reviews(
+            self,
+            pages_reviews_getters,
+            known_fingerprints: set = frozenset(),
+            stop_on_empty_page: bool = False,
+            sink=None,
+            keep_reviews: bool = True,
+            raise_on_failure: bool = False,
+    ) -> list:
+        """
+        Joins the reviews returned by each page getter, in order, until the merge
+        is done, see `_PagesReviewsMerge`
+        """
+        merge = _PagesReviewsMerge(
+            self,
+            known_fingerprints,
+            stop_on_empty_page=stop_on_empty_page,
+            sink=sink,
+            keep_reviews=keep_reviews,
+            raise_on_failure=raise_on_failure,
+        )
+
+        for get_page_reviews in pages_reviews_getters:
+            merge.add_page(get_page_reviews)
+
+            if merge.done:
+                break
+
+        return merge.reviews
+
+    @staticmethod
+    def _get_page_sink(sink: ReviewSink, dealership_url: str):
+        """
+        Returns a function writing a page of reviews of the dealership to the sink
+        """
+        return partial(sink.write_reviews, dealership_url) if sink else None
+
+    @staticmethod
+    def _merge_known_reviews(
+            scrapped_reviews: list,
+            known_reviews: list,
+            dealership_url: str,
+            watermark_store: WatermarkStore = None,
+    ) -> list:
+        """
+        Appends the known reviews after the new ones and stores them all
+        """
+        if not watermark_store:
+            return scrapped_reviews
+
+        reviews = scrapped_reviews + known_reviews
+        watermark_store.save(dealership_url, reviews)
+
+        return reviews
+
+    def _get_reviews_for_page(self, dealership_url: str, page_number: int) -> list:
+        self._log('Fetching review page %s', page_number)
 
         html = self.http_client.get_html(f'{dealership_url}/page{page_number}/')
 
-        scrapper = Scrapper(html)
+        return self._get_reviews_from_html(html, page_number)
+
+    def _fetch_page(self, dealership_url: str, page_number: int) -> tuple:
+        self._log('Fetching review page %s', page_number)
+
+        return page_number, self.http_client.get_html(f'{dealership_url}/page{page_number}/')
+
+    def _parse_page(self, fetched_page: tuple) -> list:
+        page_number, html = fetched_page
+
+        return self._get_reviews_from_html(html, page_number)
+
+    async def _get_reviews_for_page_async(
+            self,
+            dealership_url: str,
+            page_number: int,
+            semaphore: asyncio.Semaphore,
+    ) -> list:
+        async with semaphore:
+            self._log('Fetching review page %s', page_number)
+
+            html = await self.async_http_client.get_html(f'{dealership_url}/page{page_number}/')
+
+        return await self._get_reviews_from_html_async(html, page_number)
+
+    def _get_reviews_from_html(self, html: str, page_number: int) -> list:
+        if not self.parse_executor:
+            return self._parse_reviews(html, page_number)
+
+        records = self.parse_executor.submit(_parse_reviews_records, html, page_number).result()
+
+        return self._get_reviews_from_records(records)
+
+    async def _get_reviews_from_html_async(self, html: str, page_number: int) -> list:
+        """
+        Parses the page in the default executor of the event loop, so the loop is not
+        blocked meanwhile, or in the parse executor if any
+        """
+        import asyncio
+
+        if not self.parse_executor:
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                self._get_reviews_from_html,
+                html,
+                page_number,
+            )
+
+        records = await asyncio.get_running_loop().run_in_executor(
+            self.parse_executor,
+            _parse_reviews_records,
+            html,
+            page_number,
+        )
+
+        return self._get_reviews_from_records(records)
+
+    def _get_reviews_and_last_page(self, html: str) -> tuple:
+        if not self.parse_executor:
+            return self._parse_reviews_and_last_page(html)
+
+        records, last_page_number = \
+            self.parse_executor.submit(_parse_reviews_records_and_last_page, html).result()
+
+        return self._get_reviews_from_records(records), last_page_number
 
-        raw_reviews = scrapper.find_all_elements('div', cls='review-entry')
+    async def _get_reviews_and_last_page_async(self, html: str) -> tuple:
+        import asyncio
+
+        if not self.parse_executor:
+            return await asyncio.get_running_loop().run_in_executor(
+                None,
+                self._get_reviews_and_last_page,
+                html,
+            )
+
+        records, last_page_number = await asyncio.get_running_loop().run_in_executor(
+            self.parse_executor,
+            _parse_reviews_records_and_last_page,
+            html,
+        )
 
-        self._log(f'Scrapping reviews on page {page_number}')
+        return self._get_reviews_from_records(records), last_page_number
+
+    def _get_reviews_from_records(self, records: list) -> list:
+        return [
+            Review.from_dict(record, lexicon=self.lexicon, metrics=self.metrics)
+            for record in records
+        ]
+
+    def _parse_reviews(self, html: str, page_number: int) -> list:
+        scrapper = Scrapper(
+            html,
+            self.parser,
+            only_elements=REVIEW_ENTRY_FILTER,
+            metrics=self.metrics,
+        )
+
+        return self._get_reviews_from_scrapper(scrapper, page_number)
+
+    def _parse_reviews_and_last_page(self, html: str) -> tuple:
+        scrapper = Scrapper(
+            html,
+            self.parser,
+            only_elements=FIRST_PAGE_FILTER,
+            metrics=self.metrics,
+        )
 
-        reviews = list(map(self._get_processed_review_from_raw_review, raw_reviews))
+        reviews = self._get_reviews_from_scrapper(scrapper, 1)
+
+        return reviews, self._get_last_page_number(scrapper)
+
+    def _get_reviews_from_scrapper(self, scrapper: Scrapper, page_number: int) -> list:
+        with self.metrics.time('extract'):
+            raw_reviews = scrapper.find_all_elements('div', cls='review-entry')
+
+            self._log('Scrapping reviews on page %s', page_number)
+
+            reviews = list(map(self._get_processed_review_from_raw_review, raw_reviews))
 
         return reviews
 
-    def _get_processed_review_from_raw_review(self, raw_review: ScrapperElement) -> dict:
-        review = {
-            'reviewer': self._get_reviewer_name(raw_review),
-            'overall-score': self._get_overall_score(raw_review),
-            'employees-scores': self._get_employees_score(raw_review),
-            'message': self._get_message(raw_review),
-        }
+    @staticmethod
+    def _get_last_page_number(scrapper: Scrapper) -> int:
+        """
+        Returns the highest page number linked by the pagination, or 1 if there is none
+        """
+        page_numbers = []
+
+        for link_element in scrapper.select_css('div.pagination a[href]'):
+            page_number_match = PAGE_NUMBER_PATTERN.search(link_element.get_attribute('href'))
+
+            if page_number_match:
+                page_numbers.append(int(page_number_match.group(1)))
 
-        review.update(self._get_specific_scores(raw_review))
+        return max(page_numbers, default=1)
 
-        return review
+    def _get_processed_review_from_raw_review(self, raw_review: ScrapperElement) -> Review:
+        reviewer = self._get_reviewer_name(raw_review)
+        overall_score = self._get_overall_score(raw_review)
+        employees_scores = self._get_employees_score(raw_review)
+        message = self._get_message(raw_review)
+        specific_scores, recommend_dealer = self._get_specific_scores(raw_review)
+
+        return Review(
+            reviewer, overall_score, employees_scores, message, recommend_dealer, specific_scores,
+            lexicon=self.lexicon,
+            metrics=self.metrics,
+        )
 
     @staticmethod
     def _get_reviewer_name(raw_review: ScrapperElement) -> str:
@@ -133,8 +709,13 @@ class DealerShipReviewScrapper:
 
         return message
 
-    def _get_specific_scores(self, raw_review: ScrapperElement) -> dict:
-        scores = {'specific-scores': {}}
+    def _get_specific_scores(self, raw_review: ScrapperElement) -> tuple:
+        """
+        Returns the specific scores by their slugified name, and whether the
+        dealer was recommended or not
+        """
+        specific_scores = {}
+        recommend_dealer = None
         specific_scores_table_element = raw_review.find_first_element(
             'div',
             cls='review-ratings-all'
@@ -153,20 +734,19 @@ class DealerShipReviewScrapper:
                 recommend_dealer_score = Slugifier.slugify(
                     specific_score_rating_element.get_value()
                 )
-                scores[Slugifier.slugify(specific_score_name)] = \
-                    recommend_dealer_score == RECOMMEND_DEALER_YES_ANSWER
+                recommend_dealer = recommend_dealer_score == RECOMMEND_DEALER_YES_ANSWER
             else:
                 specific_score_rating_element = specific_score_name_element.find_next_sibling(
                     'div',
                     cls='rating-static-indv',
                 )
-                scores['specific-scores'][Slugifier.slugify(specific_score_name)] = \
+                specific_scores[Slugifier.slugify(specific_score_name)] = \
                     self._get_score_from_element_class(
                         specific_score_rating_element.get_class(),
                         'rating-'
                     )
 
-        return scores
+        return specific_scores, recommend_dealer
 
     @staticmethod
     def _get_score_from_element_class(cls: list, matching_score_string: str) -> int:
@@ -187,6 +767,93 @@ class DealerShipReviewScrapper:
 
         return int(rating_match[0])
 
-    def _log(self, message: str):
+    def _log(self, message: str, *args):
         if self.debug_log:
-            self.logger.debug(message)
+            self.logger.debug(message, *args)
+
+
+class _PagesReviewsMerge:
+    """
+    Joins the reviews of the pages of a scrapping, a page at a time, in order.
+    An error is only fatal when no review has been scrapped yet, leaving no
+    reviews or raising ScrappingFailed with raise_on_failure; otherwise the
+    page is skipped. Known reviews are left out, and the merge is done at the
+    first page where all reviews are known, or that is empty if
+    stop_on_empty_page is set. The new reviews of each page are passed to
+    sink, if any, and only joined if keep_reviews is set.
+    """
+
+    def __init__(
+            self,
+            scrapper: DealerShipReviewScrapper,
+            known_fingerprints: set = frozenset(),
+            stop_on_empty_page: bool = False,
+            sink=None,
+            keep_reviews: bool = True,
+            raise_on_failure: bool = False,
+    ):
+        self.scrapper = scrapper
+        self.known_fingerprints = known_fingerprints
+        self.stop_on_empty_page = stop_on_empty_page
+        self.sink = sink
+        self.keep_reviews = keep_reviews
+        self.raise_on_failure = raise_on_failure
+        self.reviews = []
+        self.done = False
+        self._scrapped_count = 0
+
+    def add_page(self, get_page_reviews):
+        """
+        Joins the reviews returned by the page getter
+        """
+        try:
+            page_reviews = get_page_reviews()
+        except (HttpRequestDidNotReturnOk, HttpRequestConnectionError) as exception:
+            self._fail(exception, 'It was not possible to fetch data from DealerRater')
+            return
+        except (ElementNotFound, OverallScoreNotFound, UnableToProcessRating) as exception:
+            self._fail(exception, str(exception))
+            return
+
+        self.scrapper.metrics.increment('pages-scrapped')
+        self.scrapper.metrics.increment('reviews-scrapped', len(page_reviews))
+
+        if self.stop_on_empty_page and not page_reviews:
+            self._log('Reached an empty page')
+            self.done = True
+            return
+
+        if self.known_fingerprints:
+            new_reviews = [
+                review for review in page_reviews
+                if review.fingerprint() not in self.known_fingerprints
+            ]
+        else:
+            new_reviews = page_reviews
+
+        self._scrapped_count += len(new_reviews)
+
+        if self.sink and new_reviews:
+            self.sink(new_reviews)
+
+        if self.keep_reviews:
+            self.reviews += new_reviews
+
+        if page_reviews and not new_reviews:
+            self._log('Reached the already known reviews')
+            self.done = True
+
+    def _fail(self, exception: Exception, message: str):
+        self.scrapper.metrics.increment('scrapping-errors')
+
+        if self._scrapped_count:
+            return
+
+        self.scrapper.logger.error(message)
+        self.done = True
+
+        if self.raise_on_failure:
+            raise ScrappingFailed() from exception
+
+    def _log(self, message: str):
+        self.scrapper._log(message)  # pylint: disable=protected-access
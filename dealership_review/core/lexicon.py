@@ -0,0 +1,136 @@
+import re
+
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+DEFAULT_NEGATION_WINDOW = 1
+
+POSITIVE = 1
+NEGATIVE = -1
+MODIFIER = 0
+
+_END_OF_PHRASE = ''
+
+
+def tokenize(text: str) -> list:
+    """
+    Splits a text into lowercase words without punctuation, i.e.,
+    "Wasn't good!!" becomes ['wasnt', 'good']
+    """
+    return PUNCTUATION_PATTERN.sub('', text.lower()).split()
+
+
+def read_words(path: str) -> list:
+    """
+    Reads a word list file with one word or phrase per line.
+    Blank lines and lines starting with # are ignored.
+    """
+    with open(path, 'r', encoding='utf8') as file:
+        lines = (line.strip() for line in file)
+
+        return [line for line in lines if line and not line.startswith('#')]
+
+
+class Lexicon:
+    """
+    Positive, negative and modifier words or phrases used to score a message.
+    The entries are indexed once in a trie, so a message is scored in a single
+    pass over its words whatever the size of the lexicon. A positive or negative
+    entry counts the other way around when a modifier ends at most
+    negation_window words before it.
+    """
+
+    def __init__(
+            self,
+            positive_words: list,
+            negative_words: list,
+            modifier_words: list = None,
+            negation_window: int = DEFAULT_NEGATION_WINDOW,
+    ):
+        self.negation_window = negation_window
+        self._trie = {}
+
+        self._add_entries(modifier_words or [], MODIFIER)
+        self._add_entries(negative_words, NEGATIVE)
+        self._add_entries(positive_words, POSITIVE)
+
+    @classmethod
+    def from_files(
+            cls,
+            positive_words_path: str,
+            negative_words_path: str,
+            modifier_words_path: str = None,
+            negation_window: int = DEFAULT_NEGATION_WINDOW,
+    ) -> 'Lexicon':
+        """
+        Builds a lexicon from word list files, see `read_words`
+        """
+        return cls(
+            positive_words=read_words(positive_words_path),
+            negative_words=read_words(negative_words_path),
+            modifier_words=read_words(modifier_words_path) if modifier_words_path else None,
+            negation_window=negation_window,
+        )
+
+    def score(self, message: str) -> int:
+        """
+        Returns the sum of the positive (+1) and negative (-1) entries found in the message
+        """
+        words = tokenize(message)
+        words_count = len(words)
+        score = 0
+        last_modifier_index = -self.negation_window - 1
+        index = 0
+
+        while index < words_count:
+            length, polarity = self._match(words, index)
+
+            if not length:
+                index += 1
+                continue
+
+            if polarity == MODIFIER:
+                last_modifier_index = index + length - 1
+            elif index - last_modifier_index <= self.negation_window:
+                score -= polarity
+            else:
+                score += polarity
+
+            index += length
+
+        return score
+
+    def score_many(self, messages) -> list:
+        """
+        Scores every message of the given iterable
+        """
+        return [self.score(message) for message in messages]
+
+    def _add_entries(self, entries: list, polarity: int):
+        for entry in entries:
+            words = tokenize(entry)
+
+            if not words:
+                continue
+
+            node = self._trie
+            for word in words:
+                node = node.setdefault(word, {})
+            node[_END_OF_PHRASE] = polarity
+
+    def _match(self, words: list, start: int) -> tuple:
+        """
+        Returns the length and polarity of the longest entry starting at words[start],
+        or (0, None) if there is none
+        """
+        node = self._trie
+        match = (0, None)
+
+        for index in range(start, len(words)):
+            node = node.get(words[index])
+
+            if node is None:
+                break
+
+            if _END_OF_PHRASE in node:
+                match = (index - start + 1, node[_END_OF_PHRASE])
+
+        return match
@@ -1,12 +1,29 @@
 # pylint: disable=too-few-public-methods,too-many-arguments
 
-from dealership_review.core.dealership_review_scrapper import DealerShipReviewScrapper
-from dealership_review.core.review import Review
-from dealership_review.core.review_sorter import sort_reviews, SortType
+from concurrent.futures import Executor, ThreadPoolExecutor
 
+from dealership_review.core.dealership_review_scrapper import (
+    DealerShipReviewScrapper,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_FETCH_WORKERS,
+    DEFAULT_PARSE_WORKERS,
+    DEFAULT_SCORE_WORKERS,
+)
+from dealership_review.core.lexicon import Lexicon
+from dealership_review.core.review_sinks import ReviewSink
+from dealership_review.core.review_sorter import select_top_reviews, SortType
+from dealership_review.core.review_store import ReviewStore
+from dealership_review.core.watermark_store import WatermarkStore
+
+from dealership_review.utils.http_client import HttpClient
 from dealership_review.utils.logger import Logger
+from dealership_review.utils.metrics import MetricsCollector, DISABLED_METRICS
+from dealership_review.utils.pipeline import DEFAULT_QUEUE_SIZE
+from dealership_review.utils.scrapper import ParserType, DEFAULT_PARSER
 
+from dealership_review.exceptions.scrapper_exceptions import ScrappingFailed
 
+DEFAULT_MANY_MAX_WORKERS = 10
 DEFAULT_REVIEWED_PAGES = 5
 DEFAULT_RETURNED_REVIEWS = 3
 DEFAULT_DEALERSHIP_URL = 'https://www.dealerrater.com/dealer/' \
@@ -16,11 +33,29 @@ DEFAULT_DEALERSHIP_URL = 'https://www.dealerrater.com/dealer/' \
 class Mediator:
     """
     Responsible for coordinating the review scrapping, the score generation
-    and sort
+    and sort. Every scrapper created by the mediator shares its HTTP client,
+    and so its pool of connections, and its parse_executor if one is given.
+    Given a metrics collector, every stage records its metrics into it, see
+    `MetricsCollector.to_json` and `MetricsCollector.to_prometheus` to export them.
     """
 
-    def __init__(self):
-        self.dealership_review_scrapper = DealerShipReviewScrapper()
+    def __init__(
+            self,
+            http_client: HttpClient = None,
+            parser: ParserType = DEFAULT_PARSER,
+            lexicon: Lexicon = None,
+            parse_executor: Executor = None,
+            metrics: MetricsCollector = None,
+    ):
+        self.metrics = metrics or DISABLED_METRICS
+        self.http_client = http_client or HttpClient(metrics=self.metrics)
+        self.dealership_review_scrapper = DealerShipReviewScrapper(
+            http_client=self.http_client,
+            parser=parser,
+            lexicon=lexicon,
+            parse_executor=parse_executor,
+            metrics=self.metrics,
+        )
         self.logger = Logger()
         self.debug_log = False
 
@@ -30,47 +65,269 @@ class Mediator:
             count: int = DEFAULT_RETURNED_REVIEWS,
             dealership_url: str = DEFAULT_DEALERSHIP_URL,
             sort_type: SortType = SortType.ASC,
-            debug_log: bool = False
+            debug_log: bool = False,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            watermark_store: WatermarkStore = None,
+            discover_pages: bool = False,
+            review_store: ReviewStore = None,
+            sink: ReviewSink = None,
     ) -> list:
         """
         Scraps data from the Dealership review pages, generates Reviews from it,
         calculate their score, sort them and select the desired amount.
+        max_workers bounds how many review pages are fetched at the same time.
+        With a watermark store, only the reviews published since the last call
+        are scrapped, and they are scored along with the stored ones.
+        With discover_pages, pages past the last one of the pagination are never
+        requested, and pages may be None to scrap all of them.
+        With a review store, the scored reviews are saved into it, unless the
+        scrapping failed, and the reviews are selected from it instead while it
+        is fresh.
+        With a sink, every scrapped review is written to it, a page at a time,
+        and the review store is only written to.
         """
         self.debug_log = debug_log
-        self._log(f'Starting getting reviews for {dealership_url}')
 
-        scrapped_reviews = self.dealership_review_scrapper.scrap_reviews(
+        if review_store and not sink and review_store.is_fresh(dealership_url, pages):
+            self._log('Selecting stored reviews for %s', dealership_url)
+            return review_store.get_top_reviews(
+                dealership_url,
+                count,
+                sort_type,
+                self.dealership_review_scrapper.lexicon,
+            )
+
+        self._log('Starting getting reviews for %s', dealership_url)
+
+        try:
+            reviews = self.dealership_review_scrapper.scrap_reviews(
+                pages=pages,
+                dealership_url=dealership_url,
+                debug_log=debug_log,
+                max_workers=max_workers,
+                watermark_store=watermark_store,
+                discover_pages=discover_pages,
+                sink=sink,
+                raise_on_failure=True,
+            )
+        except ScrappingFailed:
+            return []
+
+        self._log('Finished getting reviews for %s', dealership_url)
+
+        if review_store:
+            review_store.save(dealership_url, reviews, pages)
+
+        return self._select_reviews(reviews, count, sort_type)
+
+    def get_scores_pipelined(
+            self,
+            pages: int = DEFAULT_REVIEWED_PAGES,
+            count: int = DEFAULT_RETURNED_REVIEWS,
+            dealership_url: str = DEFAULT_DEALERSHIP_URL,
+            sort_type: SortType = SortType.ASC,
+            debug_log: bool = False,
+            watermark_store: WatermarkStore = None,
+            discover_pages: bool = False,
+            fetch_workers: int = DEFAULT_FETCH_WORKERS,
+            parse_workers: int = DEFAULT_PARSE_WORKERS,
+            score_workers: int = DEFAULT_SCORE_WORKERS,
+            queue_size: int = DEFAULT_QUEUE_SIZE,
+            sink: ReviewSink = None,
+    ) -> list:
+        """
+        Same as `get_scores`, with the pages fetched, parsed and scored by the stages
+        of a pipeline, see `DealerShipReviewScrapper.scrap_reviews_pipelined`.
+        The reviews arrive already scored, so only the top ones are left to select.
+        """
+        self.debug_log = debug_log
+        self._log('Starting getting reviews for %s', dealership_url)
+
+        reviews = self.dealership_review_scrapper.scrap_reviews_pipelined(
             pages=pages,
             dealership_url=dealership_url,
-            debug_log=debug_log
+            debug_log=debug_log,
+            watermark_store=watermark_store,
+            discover_pages=discover_pages,
+            fetch_workers=fetch_workers,
+            parse_workers=parse_workers,
+            score_workers=score_workers,
+            queue_size=queue_size,
+            sink=sink,
         )
 
-        self._log(f'Finished getting reviews for {dealership_url}')
+        self._log('Finished getting reviews for %s', dealership_url)
+
+        return self._select_reviews(reviews, count, sort_type)
 
-        self._log(f'Calculating scores for {len(scrapped_reviews)} reviews')
+    def export_reviews(
+            self,
+            sink: ReviewSink,
+            pages: int = DEFAULT_REVIEWED_PAGES,
+            dealership_url: str = DEFAULT_DEALERSHIP_URL,
+            debug_log: bool = False,
+            discover_pages: bool = False,
+            fetch_workers: int = DEFAULT_FETCH_WORKERS,
+            parse_workers: int = DEFAULT_PARSE_WORKERS,
+            score_workers: int = DEFAULT_SCORE_WORKERS,
+            queue_size: int = DEFAULT_QUEUE_SIZE,
+    ) -> int:
+        """
+        Writes every review scrapped from the dealership, with its score, to the
+        sink, a page at a time. No review is kept once written, so exporting
+        takes the same memory whatever the number of pages.
+        Returns the number of reviews written.
+        """
+        self.debug_log = debug_log
+        self._log('Starting exporting reviews for %s', dealership_url)
+        reviews_count = sink.reviews_count
 
-        reviews = self._map_scrapped_reviews_into_reviews(scrapped_reviews)
+        self.dealership_review_scrapper.scrap_reviews_pipelined(
+            pages=pages,
+            dealership_url=dealership_url,
+            debug_log=debug_log,
+            discover_pages=discover_pages,
+            fetch_workers=fetch_workers,
+            parse_workers=parse_workers,
+            score_workers=score_workers,
+            queue_size=queue_size,
+            sink=sink,
+            keep_reviews=False,
+        )
 
-        sorted_reviews = sort_reviews(reviews, sort_type)
+        self._log('Finished exporting reviews for %s', dealership_url)
 
-        self._log('Finished calculating scores')
+        return sink.reviews_count - reviews_count
 
-        return sorted_reviews[:count]
-
-    @staticmethod
-    def _map_scrapped_reviews_into_reviews(scrapped_reviews: list) -> list:
-        def to_review(scrapped_review: dict) -> Review:
-            return Review(
-                reviewer=scrapped_review['reviewer'],
-                overall_score=scrapped_review['overall-score'],
-                employees_scores=scrapped_review['employees-scores'],
-                message=scrapped_review['message'],
-                recommend_dealer=scrapped_review['recommend-dealer'],
-                specific_scores=scrapped_review['specific-scores'],
+    def get_scores_for_many(
+            self,
+            dealership_urls: list,
+            pages: int = DEFAULT_REVIEWED_PAGES,
+            count: int = DEFAULT_RETURNED_REVIEWS,
+            sort_type: SortType = SortType.ASC,
+            debug_log: bool = False,
+            max_workers: int = DEFAULT_MANY_MAX_WORKERS,
+            watermark_store: WatermarkStore = None,
+            discover_pages: bool = False,
+            sink: ReviewSink = None,
+    ) -> dict:
+        """
+        Same as `get_scores`, for several dealerships at once. The review pages of
+        every dealership are fetched by a single pool of max_workers workers, over
+        the connections of the shared HTTP client, so its pool_size should be at
+        least max_workers.
+        Returns the selected reviews of each dealership by url. A dealership that
+        fails gets no reviews, without affecting the others.
+        """
+        self.debug_log = debug_log
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pages_executor, \
+                ThreadPoolExecutor(max_workers=max_workers) as dealerships_executor:
+            futures = {
+                dealership_url: dealerships_executor.submit(
+                    self._get_scores_for_one_of_many,
+                    pages_executor,
+                    pages,
+                    count,
+                    dealership_url,
+                    sort_type,
+                    watermark_store,
+                    discover_pages,
+                    sink,
+                )
+                for dealership_url in dealership_urls
+            }
+
+            return {
+                dealership_url: future.result()
+                for dealership_url, future in futures.items()
+            }
+
+    def close(self):
+        """
+        Closes the connections opened by `get_scores`
+        """
+        self.http_client.close()
+
+    async def get_scores_async(
+            self,
+            pages: int = DEFAULT_REVIEWED_PAGES,
+            count: int = DEFAULT_RETURNED_REVIEWS,
+            dealership_url: str = DEFAULT_DEALERSHIP_URL,
+            sort_type: SortType = SortType.ASC,
+            debug_log: bool = False,
+            max_workers: int = None,
+            watermark_store: WatermarkStore = None,
+            discover_pages: bool = False,
+            sink: ReviewSink = None,
+    ) -> list:
+        """
+        Asynchronous version of `get_scores`, meant to be awaited from an event loop.
+        Many calls can be gathered together to score several dealerships at once.
+        """
+        self.debug_log = debug_log
+        self._log('Starting getting reviews for %s', dealership_url)
+
+        reviews = await self.dealership_review_scrapper.scrap_reviews_async(
+            pages=pages,
+            dealership_url=dealership_url,
+            debug_log=debug_log,
+            max_workers=max_workers,
+            watermark_store=watermark_store,
+            discover_pages=discover_pages,
+            sink=sink,
+        )
+
+        self._log('Finished getting reviews for %s', dealership_url)
+
+        return self._select_reviews(reviews, count, sort_type)
+
+    async def close_async(self):
+        """
+        Closes the connections opened by `get_scores_async`
+        """
+        await self.dealership_review_scrapper.close_async()
+
+    def _get_scores_for_one_of_many(
+            self,
+            pages_executor: Executor,
+            pages: int,
+            count: int,
+            dealership_url: str,
+            sort_type: SortType,
+            watermark_store: WatermarkStore,
+            discover_pages: bool,
+            sink: ReviewSink,
+    ) -> list:
+        self._log('Starting getting reviews for %s', dealership_url)
+
+        try:
+            reviews = self.dealership_review_scrapper.scrap_reviews(
+                pages=pages,
+                dealership_url=dealership_url,
+                debug_log=self.debug_log,
+                watermark_store=watermark_store,
+                discover_pages=discover_pages,
+                executor=pages_executor,
+                sink=sink,
             )
+        except Exception as exception:  # pylint: disable=broad-except
+            self.logger.error('Failed getting reviews for %s: %r', dealership_url, exception)
+            return []
+
+        self._log('Finished getting reviews for %s', dealership_url)
+
+        return self._select_reviews(reviews, count, sort_type)
+
+    def _select_reviews(self, reviews: list, count: int, sort_type: SortType) -> list:
+        self._log('Calculating scores for %s reviews', len(reviews))
+
+        top_reviews = select_top_reviews(reviews, count, sort_type, self.metrics)
+
+        self._log('Finished calculating scores')
 
-        return list(map(to_review, scrapped_reviews))
+        return top_reviews
 
-    def _log(self, message: str):  # pylint: disable=missing-function-docstring
+    def _log(self, message: str, *args):  # pylint: disable=missing-function-docstring
         if self.debug_log:
-            self.logger.debug(message)
+            self.logger.debug(message, *args)
@@ -1,7 +1,12 @@
-# pylint: disable=missing-function-docstring,too-many-arguments
+# pylint: disable=missing-function-docstring,too-many-arguments,too-many-instance-attributes
 
+import hashlib
+import json
 import math
-import re
+
+from dealership_review.core.lexicon import Lexicon
+
+from dealership_review.utils.metrics import MetricsCollector, DISABLED_METRICS
 
 MODIFIER_WORDS = [
     'not',
@@ -37,14 +42,36 @@ NEGATIVE_WORDS = [
     'horrible',
     'hate',
 ]
+RECOMMEND_DEALER_SCORE = 40
+OVERALL_SCORE_WEIGHT = 0.4
+EMPLOYEES_SCORE_WEIGHT = 0.2
+SPECIFIC_SCORES_WEIGHT = 0.4
+DEFAULT_LEXICON = Lexicon(
+    positive_words=POSITIVE_WORDS,
+    negative_words=NEGATIVE_WORDS,
+    modifier_words=MODIFIER_WORDS,
+)
 
 
 class Review:
     """
     Entity that represents a review. Stores the data scrapped
     from the website and calculates a score for it.
+    The score is only calculated the first time it is read, and then cached.
     """
 
+    __slots__ = (
+        '_reviewer',
+        '_overall_score',
+        '_employees_scores',
+        '_message',
+        '_recommend_dealer',
+        '_specific_scores',
+        '_lexicon',
+        '_metrics',
+        '_score',
+    )
+
     def __init__(
             self,
             reviewer: str,
@@ -52,7 +79,9 @@ class Review:
             employees_scores: list = None,
             message: str = None,
             recommend_dealer: bool = None,
-            specific_scores: dict = None
+            specific_scores: dict = None,
+            lexicon: Lexicon = None,
+            metrics: MetricsCollector = None,
     ):
         self._reviewer = reviewer
         self._overall_score = overall_score
@@ -60,17 +89,85 @@ class Review:
         self._message = message
         self._recommend_dealer = recommend_dealer
         self._specific_scores = specific_scores
-        self._score = self.calculate_score()
+        self._lexicon = lexicon
+        self._metrics = metrics or DISABLED_METRICS
+        self._score = None
 
     def __str__(self):
         return f'{self.reviewer} scored {self.score}'
 
+    @classmethod
+    def from_dict(
+            cls,
+            scrapped_review: dict,
+            lexicon: Lexicon = None,
+            metrics: MetricsCollector = None,
+    ) -> 'Review':
+        """
+        Builds a review from a dictionary in the format returned by `to_dict`
+        """
+        return cls(
+            reviewer=scrapped_review['reviewer'],
+            overall_score=scrapped_review['overall-score'],
+            employees_scores=scrapped_review['employees-scores'],
+            message=scrapped_review['message'],
+            recommend_dealer=scrapped_review['recommend-dealer'],
+            specific_scores=scrapped_review['specific-scores'],
+            lexicon=lexicon,
+            metrics=metrics,
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Returns the scrapped data of the review as a dictionary
+        """
+        return {
+            'reviewer': self._reviewer,
+            'overall-score': self._overall_score,
+            'employees-scores': self._employees_scores,
+            'message': self._message,
+            'recommend-dealer': self._recommend_dealer,
+            'specific-scores': self._specific_scores,
+        }
+
+    def fingerprint(self) -> str:
+        """
+        Returns a hash that identifies the review by its scrapped data
+        """
+        data = json.dumps(self.to_dict(), sort_keys=True)
+
+        return hashlib.sha256(data.encode('utf8')).hexdigest()
+
     @property
     def reviewer(self) -> str:
         return self._reviewer
 
+    @property
+    def overall_score(self) -> int:
+        return self._overall_score
+
+    @property
+    def employees_scores(self) -> list:
+        return self._employees_scores
+
+    @property
+    def message(self) -> str:
+        return self._message
+
+    @property
+    def recommend_dealer(self) -> bool:
+        return self._recommend_dealer
+
+    @property
+    def specific_scores(self) -> dict:
+        return self._specific_scores
+
     @property
     def score(self) -> int:
+        if self._score is None:
+            with self._metrics.time('score'):
+                self._score = self.calculate_score()
+
         return self._score
 
     def calculate_score(self) -> int:
@@ -85,11 +182,11 @@ class Review:
 
     def _calculate_recommend_dealer_score(self) -> int:
         if self._recommend_dealer:
-            return 40
+            return RECOMMEND_DEALER_SCORE
         return 0
 
     def _calculate_overall_score(self) -> int:
-        return math.floor(0.4 * self._overall_score)
+        return math.floor(OVERALL_SCORE_WEIGHT * self._overall_score)
 
     def _calculate_employees_score(self) -> int:
         employees_count = len(self._employees_scores)
@@ -97,29 +194,10 @@ class Review:
         if employees_count == 0:
             return 0
 
-        return math.floor(0.2 * sum(self._employees_scores) / employees_count)
+        return math.floor(EMPLOYEES_SCORE_WEIGHT * sum(self._employees_scores) / employees_count)
 
     def _calculate_score_from_message(self) -> int:
-        score = 0
-
-        lowercase_message = self._message.lower()
-        lowercase_message_without_punctuation = re.sub(r'[^\w\s]', '', lowercase_message)
-        words = lowercase_message_without_punctuation.split()
-
-        for index, _ in enumerate(words):
-            if words[index] in POSITIVE_WORDS:
-                if (words[index - 1] in MODIFIER_WORDS) and index != 0:
-                    score -= 1
-                else:
-                    score += 1
-
-            if words[index] in NEGATIVE_WORDS:
-                if (words[index - 1] in MODIFIER_WORDS) and index != 0:
-                    score += 1
-                else:
-                    score -= 1
-
-        return score
+        return (self._lexicon or DEFAULT_LEXICON).score(self._message)
 
     def _calculate_specific_scores(self) -> int:
         specific_scores_values = list(self._specific_scores.values())
@@ -128,4 +206,6 @@ class Review:
         if specific_scores_count == 0:
             return 0
 
-        return math.floor(0.4 * sum(specific_scores_values) / specific_scores_count)
+        return math.floor(
+            SPECIFIC_SCORES_WEIGHT * sum(specific_scores_values) / specific_scores_count
+        )
@@ -0,0 +1,120 @@
+import csv
+import json
+import threading
+from abc import ABC, abstractmethod
+from typing import TextIO
+
+from dealership_review.core.review import Review
+
+CSV_FIELDS = [
+    'dealership-url',
+    'reviewer',
+    'overall-score',
+    'employees-scores',
+    'message',
+    'recommend-dealer',
+    'specific-scores',
+    'score',
+]
+
+
+class ReviewSink(ABC):
+    """
+    Output the reviews are written to as they are scrapped, a page at a time,
+    instead of all at once at the end. Each page written is flushed, so only
+    the page being written is held in memory.
+    The sink can be shared by many threads. It closes the file when done only
+    if it opened it, see `open_review_sink`.
+    """
+
+    def __init__(self, file: TextIO, close_file: bool = False):
+        self.file = file
+        self.close_file = close_file
+        self.reviews_count = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'ReviewSink':
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def write_reviews(self, dealership_url: str, reviews: list):
+        """
+        Writes the reviews of a dealership, along with their scores, and flushes them
+        """
+        records = [_to_record(dealership_url, review) for review in reviews]
+
+        with self._lock:
+            for record in records:
+                self._write_record(record)
+
+            self.file.flush()
+            self.reviews_count += len(records)
+
+    def close(self):
+        """
+        Flushes the written reviews, and closes the file if the sink opened it
+        """
+        with self._lock:
+            if self.close_file:
+                self.file.close()
+            else:
+                self.file.flush()
+
+    @abstractmethod
+    def _write_record(self, record: dict):
+        """
+        Writes a single review record to the file
+        """
+
+
+class JsonLinesSink(ReviewSink):
+    """
+    Writes each review as a JSON object on its own line
+    """
+
+    def _write_record(self, record: dict):
+        self.file.write(json.dumps(record) + '\n')
+
+
+class CsvSink(ReviewSink):
+    """
+    Writes each review as a CSV row, under a header written first. The
+    employees and specific scores are written as JSON.
+    """
+
+    def __init__(self, file: TextIO, close_file: bool = False):
+        super().__init__(file, close_file)
+        self._writer = csv.DictWriter(file, fieldnames=CSV_FIELDS)
+        self._writer.writeheader()
+
+    def _write_record(self, record: dict):
+        self._writer.writerow({
+            **record,
+            'employees-scores': json.dumps(record['employees-scores']),
+            'specific-scores': json.dumps(record['specific-scores']),
+        })
+
+
+def open_review_sink(path: str) -> ReviewSink:
+    """
+    Opens a sink writing to the file at path, as CSV if it ends with .csv,
+    or as JSON lines otherwise
+    """
+    if path.endswith('.csv'):
+        file = open(path, 'w', encoding='utf8', newline='')  # pylint: disable=consider-using-with
+
+        return CsvSink(file, close_file=True)
+
+    file = open(path, 'w', encoding='utf8')  # pylint: disable=consider-using-with
+
+    return JsonLinesSink(file, close_file=True)
+
+
+def _to_record(dealership_url: str, review: Review) -> dict:
+    return {
+        'dealership-url': dealership_url,
+        **review.to_dict(),
+        'score': review.score,
+    }
@@ -1,5 +1,9 @@
+import heapq
+import itertools
 from enum import Enum
 
+from dealership_review.utils.metrics import MetricsCollector, DISABLED_METRICS
+
 
 class SortType(Enum):
     """
@@ -9,13 +13,38 @@ class SortType(Enum):
     DESC = 'desc'
 
 
-def sort_reviews(reviews: list, sort_type: SortType = SortType.ASC) -> list:
+def sort_reviews(
+        reviews: list,
+        sort_type: SortType = SortType.ASC,
+        metrics: MetricsCollector = DISABLED_METRICS,
+) -> list:
     """
     Method that sorts a list of reviews with the given sort type
     """
-    if sort_type is SortType.ASC:
-        reviews.sort(key=(lambda review: review.score))
-    elif sort_type is SortType.DESC:
-        reviews.sort(reverse=True, key=(lambda review: review.score))
+    with metrics.time('sort'):
+        if sort_type is SortType.ASC:
+            reviews.sort(key=(lambda review: review.score))
+        elif sort_type is SortType.DESC:
+            reviews.sort(reverse=True, key=(lambda review: review.score))
 
     return reviews
+
+
+def select_top_reviews(
+        reviews,
+        count: int,
+        sort_type: SortType = SortType.ASC,
+        metrics: MetricsCollector = DISABLED_METRICS,
+) -> list:
+    """
+    Method that selects the first `count` reviews of the given iterable as if it
+    had been sorted with `sort_reviews`, keeping only `count` reviews in memory.
+    Reviews with the same score keep their original order.
+    """
+    with metrics.time('sort'):
+        if sort_type is SortType.ASC:
+            return heapq.nsmallest(count, reviews, key=(lambda review: review.score))
+        if sort_type is SortType.DESC:
+            return heapq.nlargest(count, reviews, key=(lambda review: review.score))
+
+        return list(itertools.islice(reviews, count))
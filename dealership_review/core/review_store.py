@@ -0,0 +1,138 @@
+# pylint: disable=import-outside-toplevel
+
+import json
+import threading
+import time
+
+from dealership_review.core.lexicon import Lexicon
+from dealership_review.core.review import Review
+from dealership_review.core.review_sorter import SortType
+
+DEFAULT_MAX_AGE = 60 * 60
+
+_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS reviews (
+        dealership_url TEXT NOT NULL,
+        fingerprint TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        score INTEGER NOT NULL,
+        scrapped_at REAL NOT NULL,
+        data TEXT NOT NULL,
+        PRIMARY KEY (dealership_url, fingerprint)
+    );
+    CREATE INDEX IF NOT EXISTS reviews_score_index
+        ON reviews (dealership_url, score, position);
+    CREATE TABLE IF NOT EXISTS scrappings (
+        dealership_url TEXT PRIMARY KEY,
+        pages INTEGER,
+        scrapped_at REAL NOT NULL
+    );
+'''
+_ORDER_BY_SCORE = {
+    SortType.ASC: 'score ASC, position ASC',
+    SortType.DESC: 'score DESC, position ASC',
+}
+
+
+class ReviewStore:
+    """
+    Persists the scored reviews of each dealership in a SQLite database, so
+    the top reviews of a dealership scrapped recently are read from an index
+    instead of scrapped again. A scrapping is fresh for max_age seconds.
+    The database is written ahead of a log (WAL), so reading it does not
+    wait on a scrapping being saved, and each scrapping is saved in a single
+    transaction. A store can be shared by many threads.
+    """
+
+    def __init__(self, path: str, max_age: float = DEFAULT_MAX_AGE):
+        import sqlite3
+
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            self._connection.executescript(_SCHEMA)
+
+    def save(self, dealership_url: str, reviews: list, pages: int = None):
+        """
+        Replaces the reviews stored for the dealership, scrapped from the given
+        amount of pages, None standing for all of them
+        """
+        scrapped_at = time.time()
+        rows = [
+            (
+                dealership_url,
+                review.fingerprint(),
+                position,
+                review.score,
+                scrapped_at,
+                json.dumps(review.to_dict()),
+            )
+            for position, review in enumerate(reviews)
+        ]
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                'DELETE FROM reviews WHERE dealership_url = ?',
+                (dealership_url,),
+            )
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO reviews VALUES (?, ?, ?, ?, ?, ?)',
+                rows,
+            )
+            self._connection.execute(
+                'INSERT OR REPLACE INTO scrappings VALUES (?, ?, ?)',
+                (dealership_url, pages, scrapped_at),
+            )
+
+    def is_fresh(self, dealership_url: str, pages: int = None) -> bool:
+        """
+        Whether the dealership was scrapped less than max_age seconds ago,
+        from at least the given amount of pages
+        """
+        with self._lock:
+            scrapping = self._connection.execute(
+                'SELECT pages, scrapped_at FROM scrappings WHERE dealership_url = ?',
+                (dealership_url,),
+            ).fetchone()
+
+        if scrapping is None:
+            return False
+
+        stored_pages, scrapped_at = scrapping
+
+        if time.time() - scrapped_at > self.max_age:
+            return False
+
+        return stored_pages is None or (pages is not None and stored_pages >= pages)
+
+    def get_top_reviews(
+            self,
+            dealership_url: str,
+            count: int,
+            sort_type: SortType = SortType.ASC,
+            lexicon: Lexicon = None,
+    ) -> list:
+        """
+        Returns the first `count` reviews stored for the dealership, as
+        `select_top_reviews` would select them
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                f'SELECT data FROM reviews WHERE dealership_url = ? '
+                f'ORDER BY {_ORDER_BY_SCORE[sort_type]} LIMIT ?',
+                (dealership_url, count),
+            ).fetchall()
+
+        return [Review.from_dict(json.loads(data), lexicon=lexicon) for data, in rows]
+
+    def close(self):
+        """
+        Closes the connection to the database
+        """
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,54 @@
+import json
+import os
+
+from dealership_review.core.lexicon import Lexicon
+from dealership_review.core.review import Review
+from dealership_review.utils.metrics import MetricsCollector
+from dealership_review.utils.slugifier import Slugifier
+
+
+class WatermarkStore:
+    """
+    Persists the reviews already scrapped for each dealership, so later
+    scrappings only have to fetch the reviews published since then.
+    Each dealership is stored as a JSON file in the given directory.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+        os.makedirs(directory, exist_ok=True)
+
+    def load(
+            self,
+            dealership_url: str,
+            lexicon: Lexicon = None,
+            metrics: MetricsCollector = None,
+    ) -> list:
+        """
+        Returns the reviews stored for the dealership, newest first, scored
+        with the given lexicon
+        """
+        try:
+            with open(self._get_path(dealership_url), 'r', encoding='utf8') as file:
+                return [
+                    Review.from_dict(scrapped_review, lexicon=lexicon, metrics=metrics)
+                    for scrapped_review in json.load(file)
+                ]
+        except FileNotFoundError:
+            return []
+
+    def save(self, dealership_url: str, reviews: list):
+        """
+        Replaces the reviews stored for the dealership
+        """
+        path = self._get_path(dealership_url)
+        temporary_path = f'{path}.tmp'
+
+        with open(temporary_path, 'w', encoding='utf8') as file:
+            json.dump([review.to_dict() for review in reviews], file)
+
+        os.replace(temporary_path, path)
+
+    def _get_path(self, dealership_url: str) -> str:
+        return os.path.join(self.directory, f'{Slugifier.slugify(dealership_url)}.json')
@@ -10,6 +10,9 @@ class HttpRequestDidNotReturnOk(Exception):
     def __str__(self):
         return self.message
 
+    def __reduce__(self):
+        return self.__class__, ()
+
 
 class HttpRequestConnectionError(Exception):
     """
@@ -22,3 +25,6 @@ class HttpRequestConnectionError(Exception):
 
     def __str__(self):
         return self.message
+
+    def __reduce__(self):
+        return self.__class__, ()
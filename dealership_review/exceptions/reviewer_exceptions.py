@@ -10,6 +10,9 @@ class OverallScoreNotFound(Exception):
     def __str__(self):
         return self.message
 
+    def __reduce__(self):
+        return self.__class__, ()
+
 
 class UnableToProcessRating(Exception):
     """
@@ -22,3 +25,6 @@ class UnableToProcessRating(Exception):
 
     def __str__(self):
         return self.message
+
+    def __reduce__(self):
+        return self.__class__, ()
@@ -4,8 +4,30 @@ class ElementNotFound(Exception):
     """
 
     def __init__(self, name: str = None, cls: str = None, value: str = None):
+        self.name = name
+        self.cls = cls
+        self.value = value
         self.message = f'Element was not found in the document: <{name} class={cls}>{value}<{name}>'
         super().__init__(self.message)
 
     def __str__(self):
         return self.message
+
+    def __reduce__(self):
+        return self.__class__, (self.name, self.cls, self.value)
+
+
+class ScrappingFailed(Exception):
+    """
+    Exception raised when the scrapping fails before any review is scrapped
+    """
+
+    def __init__(self):
+        self.message = 'No review could be scrapped'
+        super().__init__(self.message)
+
+    def __str__(self):
+        return self.message
+
+    def __reduce__(self):
+        return self.__class__, ()
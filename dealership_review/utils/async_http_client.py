@@ -0,0 +1,86 @@
+# pylint: disable=import-outside-toplevel
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from dealership_review.utils.logger import Logger
+from dealership_review.utils.metrics import MetricsCollector, DISABLED_METRICS
+
+from dealership_review.exceptions.http_client_exceptions import (
+    HttpRequestConnectionError, HttpRequestDidNotReturnOk
+)
+
+if TYPE_CHECKING:
+    import aiohttp
+
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+class AsyncHttpClient:
+    """
+    Wrapper for an asynchronous HTTP client package, only imported on the first
+    request. The underlying session is created on the first request and must be closed
+    with `close()` from the same event loop.
+    """
+
+    def __init__(
+            self,
+            max_connections: int = DEFAULT_MAX_CONNECTIONS,
+            metrics: MetricsCollector = None,
+    ):
+        self.logger = Logger()
+        self.max_connections = max_connections
+        self.metrics = metrics or DISABLED_METRICS
+        self._session = None
+
+    async def get_html(self, url: str) -> str:
+        """
+        Makes an HTTP GET request without blocking the event loop and return the html
+        """
+        import asyncio
+        import aiohttp
+
+        try:
+            with self.metrics.time('http-request'):
+                async with self._get_session().get(url) as response:
+                    self._validate_response_status_code(response)
+
+                    html = await response.text()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exception:
+            self.metrics.increment('http-errors')
+            raise HttpRequestConnectionError() from exception
+
+        self.metrics.increment('http-requests')
+
+        if self.metrics.enabled:
+            self.metrics.increment('http-bytes-downloaded', len(html.encode('utf8')))
+
+        return html
+
+    async def close(self):
+        """
+        Closes the underlying session and its connections
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections)
+            )
+
+        return self._session
+
+    def _validate_response_status_code(self, response: aiohttp.ClientResponse):
+        """
+        Runs a validation on the response status code and raise exceptions if needed
+        """
+        if response.status != 200:
+            self.metrics.increment('http-errors')
+            self.logger.error('Request made to %s returned %s', response.url, response.status)
+            raise HttpRequestDidNotReturnOk
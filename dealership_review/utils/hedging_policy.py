@@ -0,0 +1,67 @@
+import math
+import threading
+from collections import deque
+
+DEFAULT_PERCENTILE = 0.95
+DEFAULT_MIN_SAMPLES = 10
+DEFAULT_WINDOW_SIZE = 100
+DEFAULT_BUDGET = 0.05
+
+
+class HedgingPolicy:
+    """
+    When to hedge a request, i.e., send a duplicate of it and use whichever
+    response arrives first. A request is hedged once it takes longer than the
+    given percentile of the latencies recently observed, so only the slowest
+    few requests are duplicated. Nothing is hedged before min_samples latencies
+    are observed, and the hedges never outnumber budget times the requests
+    observed, so a slowdown of the whole host does not double its load.
+    """
+
+    def __init__(
+            self,
+            percentile: float = DEFAULT_PERCENTILE,
+            min_samples: int = DEFAULT_MIN_SAMPLES,
+            window_size: int = DEFAULT_WINDOW_SIZE,
+            budget: float = DEFAULT_BUDGET,
+    ):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.budget = budget
+        self._latencies = deque(maxlen=window_size)
+        self._requests_count = 0
+        self._hedges_count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, latency: float):
+        """
+        Records the latency of a request
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            self._requests_count += 1
+
+    def acquire_hedge(self) -> bool:
+        """
+        Whether a hedge may be sent within the budget, counting it if so
+        """
+        with self._lock:
+            if self._hedges_count >= self.budget * self._requests_count:
+                return False
+
+            self._hedges_count += 1
+
+        return True
+
+    def get_hedge_delay(self) -> float:
+        """
+        Returns how long to wait on a request before hedging it, or None when
+        too few latencies were observed yet
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+
+            latencies = sorted(self._latencies)
+
+        return latencies[max(0, math.ceil(self.percentile * len(latencies)) - 1)]
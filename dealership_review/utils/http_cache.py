@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_TTL = 60 * 60
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+CACHE_FILE_EXTENSION = '.json'
+
+
+class CachedResponse:
+    """
+    A response body stored in the HTTP cache, along with the validators
+    needed to revalidate it
+    """
+
+    def __init__(
+            self,
+            body: str,
+            etag: str = None,
+            last_modified: str = None,
+            stored_at: float = None,
+    ):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = time.time() if stored_at is None else stored_at
+
+    def is_fresh(self, ttl: float) -> bool:
+        """
+        Returns True if the response was stored less than ttl seconds ago
+        """
+        return time.time() - self.stored_at < ttl
+
+    def get_conditional_headers(self) -> dict:
+        """
+        Returns the headers that make a request conditional on this response
+        having changed
+        """
+        headers = {}
+
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+
+class HttpCache:
+    """
+    Persistent cache of HTTP responses keyed by URL. Each response is stored
+    as a file in the given directory; the least recently used files are
+    evicted once their total size goes over max_bytes.
+    """
+
+    def __init__(
+            self,
+            directory: str,
+            ttl: float = DEFAULT_TTL,
+            max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._sizes = self._load_sizes()
+
+    def get(self, url: str) -> CachedResponse:
+        """
+        Returns the cached response for the url, or None if there is none
+        """
+        path = self._get_path(url)
+
+        with self._lock:
+            try:
+                with open(path, 'r', encoding='utf8') as file:
+                    data = json.load(file)
+            except (OSError, ValueError):
+                return None
+
+            os.utime(path)
+
+            if path in self._sizes:
+                self._sizes.move_to_end(path)
+
+        return CachedResponse(
+            body=data['body'],
+            etag=data['etag'],
+            last_modified=data['last-modified'],
+            stored_at=data['stored-at'],
+        )
+
+    def put(self, url: str, cached_response: CachedResponse):
+        """
+        Stores the response for the url, evicting old entries if needed
+        """
+        path = self._get_path(url)
+        data = json.dumps({
+            'url': url,
+            'body': cached_response.body,
+            'etag': cached_response.etag,
+            'last-modified': cached_response.last_modified,
+            'stored-at': cached_response.stored_at,
+        })
+
+        with self._lock:
+            temporary_path = f'{path}.{threading.get_ident()}.tmp'
+
+            with open(temporary_path, 'w', encoding='utf8') as file:
+                file.write(data)
+
+            os.replace(temporary_path, path)
+
+            self._sizes[path] = os.path.getsize(path)
+            self._sizes.move_to_end(path)
+            self._evict()
+
+    def refresh(self, url: str, cached_response: CachedResponse):
+        """
+        Marks a revalidated response as fresh again
+        """
+        cached_response.stored_at = time.time()
+        self.put(url, cached_response)
+
+    def _get_path(self, url: str) -> str:
+        key = hashlib.sha256(url.encode('utf8')).hexdigest()
+
+        return os.path.join(self.directory, f'{key}{CACHE_FILE_EXTENSION}')
+
+    def _load_sizes(self) -> OrderedDict:
+        """
+        Returns the size of every stored file, from the least to the most recently used
+        """
+        paths = [
+            os.path.join(self.directory, file_name)
+            for file_name in os.listdir(self.directory)
+            if file_name.endswith(CACHE_FILE_EXTENSION)
+        ]
+        paths.sort(key=os.path.getmtime)
+
+        return OrderedDict((path, os.path.getsize(path)) for path in paths)
+
+    def _evict(self):
+        total_bytes = sum(self._sizes.values())
+
+        while total_bytes > self.max_bytes and self._sizes:
+            path, size = self._sizes.popitem(last=False)
+            total_bytes -= size
+            os.remove(path)
@@ -1,41 +1,326 @@
-# pylint: disable=too-few-public-methods
+# pylint: disable=too-many-arguments,too-many-instance-attributes,import-outside-toplevel
 
-import requests
+from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import TYPE_CHECKING
+
+from dealership_review.utils.hedging_policy import HedgingPolicy
+from dealership_review.utils.http_cache import HttpCache, CachedResponse
 from dealership_review.utils.logger import Logger
+from dealership_review.utils.metrics import MetricsCollector, DISABLED_METRICS
+from dealership_review.utils.rate_limiter import RateLimiter, RequestPermit
+from dealership_review.utils.retry_policy import RetryPolicy
 
 from dealership_review.exceptions.http_client_exceptions import (
     HttpRequestConnectionError, HttpRequestDidNotReturnOk
 )
 
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 3.05
+DEFAULT_READ_TIMEOUT = 27
+CHUNK_SIZE = 8 * 1024
+DEFAULT_HEADERS = {
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
 
 class HttpClient:
     """
-    Wrapper for an HTTP client package
+    Wrapper for an HTTP client package.
+    Requests go through a persistent session, so connections are kept alive
+    and reused by every page fetched with the same client. The session, and
+    the HTTP client package, are only loaded on the first request. When a cache is
+    given, fresh responses are served from it and stale ones are revalidated
+    with conditional requests. When a rate limiter is given, every request
+    waits for it, so all the threads sharing the client share its limits.
+    Failed requests are retried as the retry policy says, within its deadline,
+    and, when a hedging policy is given, the slowest requests are hedged from
+    a pool of threads of their own.
     """
 
-    def __init__(self):
+    def __init__(
+            self,
+            pool_size: int = DEFAULT_POOL_SIZE,
+            connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+            read_timeout: float = DEFAULT_READ_TIMEOUT,
+            cache: HttpCache = None,
+            metrics: MetricsCollector = None,
+            rate_limiter: RateLimiter = None,
+            retry_policy: RetryPolicy = None,
+            hedging_policy: HedgingPolicy = None,
+    ):
         self.logger = Logger()
+        self.cache = cache
+        self.metrics = metrics or DISABLED_METRICS
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.hedging_policy = hedging_policy
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.pool_size = pool_size
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._hedging_executor = ThreadPoolExecutor(pool_size) if hedging_policy else None
 
     def get_html(self, url: str) -> str:
         """
         Makes an HTTP GET request and return the html
         """
-        try:
-            response = requests.get(url)
-        except requests.exceptions.ConnectionError as exception:
-            raise HttpRequestConnectionError() from exception
+        cached_response = self.cache.get(url) if self.cache else None
+
+        if cached_response and cached_response.is_fresh(self.cache.ttl):
+            self.metrics.increment('http-cache-hits')
+            return cached_response.body
+
+        headers = cached_response.get_conditional_headers() if cached_response else {}
+
+        response = self._get_with_retries(url, headers)
+
+        if cached_response and response.status_code == 304:
+            self.metrics.increment('http-cache-revalidations')
+            self.cache.refresh(url, cached_response)
+            return cached_response.body
 
         self._validate_response_status_code(response)
 
+        if self.cache:
+            self.cache.put(url, CachedResponse(
+                body=response.text,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+            ))
+
         return response.text
 
+    @property
+    def session(self) -> requests.Session:
+        """
+        The session shared by every request, created on first use
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session(self.pool_size)
+
+        return self._session
+
+    def close(self):
+        """
+        Closes the session and all its pooled connections
+        """
+        if self._hedging_executor:
+            self._hedging_executor.shutdown(wait=False)
+
+        if self._session is not None:
+            self._session.close()
+
+    def _get_with_retries(self, url: str, headers: dict) -> requests.Response:
+        """
+        Sends the request until it gets a response not worth retrying, the
+        retries run out, or the deadline would pass while waiting to retry
+        """
+        deadline = self.retry_policy.get_deadline()
+        attempt = 0
+
+        while True:
+            try:
+                response = self._get_hedged(url, headers, deadline)
+            except HttpRequestConnectionError:
+                if attempt >= self.retry_policy.max_retries:
+                    raise
+                response = None
+                delay = self.retry_policy.get_delay(attempt)
+            else:
+                if attempt >= self.retry_policy.max_retries \
+                        or not self.retry_policy.is_retryable(response.status_code):
+                    return response
+                delay = self.retry_policy.get_delay(attempt, response.headers.get('Retry-After'))
+
+            if time.monotonic() + delay >= deadline:
+                if response is None:
+                    raise HttpRequestConnectionError()
+                return response
+
+            self.metrics.increment('http-retries')
+            self.logger.warning('Retrying request to %s in %.2fs', url, delay)
+            time.sleep(delay)
+            attempt += 1
+
+    def _get_hedged(self, url: str, headers: dict, deadline: float) -> requests.Response:
+        """
+        Sends the request from the calling thread and, when a hedging policy is
+        given, a duplicate of it from the hedging executor once the request has
+        been on the wire for longer than the policy allows, within its budget.
+        Returns the request response unless it failed or is worth retrying, in
+        which case the duplicate response is preferred, if it is not.
+        """
+        if not self.hedging_policy:
+            return self._get(url, headers, deadline)
+
+        request_done = threading.Event()
+        hedges = []
+
+        def schedule_hedge():
+            hedge_delay = self.hedging_policy.get_hedge_delay()
+
+            if hedge_delay is not None:
+                hedges.append(self._hedging_executor.submit(
+                    self._hedge,
+                    url,
+                    headers,
+                    deadline,
+                    request_done,
+                    time.monotonic() + hedge_delay,
+                ))
+
+        error = None
+
+        try:
+            response = self._get(url, headers, deadline, on_sending=schedule_hedge)
+        except HttpRequestConnectionError as exception:
+            response, error = None, exception
+
+        request_done.set()
+
+        if hedges and not hedges[0].cancel() and not self._is_final(response):
+            try:
+                hedge_response = hedges[0].result()
+            except HttpRequestConnectionError:
+                hedge_response = None
+
+            if self._is_final(hedge_response) or response is None and hedge_response is not None:
+                return hedge_response
+
+        if error is not None:
+            raise error
+
+        return response
+
+    def _is_final(self, response: requests.Response) -> bool:
+        """
+        Whether the request got a response not worth retrying
+        """
+        return response is not None and not self.retry_policy.is_retryable(response.status_code)
+
+    def _hedge(
+            self,
+            url: str,
+            headers: dict,
+            deadline: float,
+            request_done: threading.Event,
+            hedge_time: float,
+    ) -> requests.Response:
+        """
+        Sends a duplicate of a request still not done by hedge_time, within the
+        hedging budget, returning None when none is sent
+        """
+        if request_done.wait(hedge_time - time.monotonic()) \
+                or not self.hedging_policy.acquire_hedge():
+            return None
+
+        self.metrics.increment('http-hedged-requests')
+
+        return self._get(url, headers, deadline)
+
+    def _get(
+            self,
+            url: str,
+            headers: dict,
+            deadline: float,
+            on_sending=None,
+    ) -> requests.Response:
+        """
+        Sends the request once, timing out by the deadline at the latest.
+        on_sending is called once the rate limiter lets the request be sent.
+        """
+        import requests
+
+        remaining_time = deadline - time.monotonic()
+
+        if remaining_time <= 0:
+            raise HttpRequestConnectionError()
+
+        timeout = (
+            min(self.connect_timeout, remaining_time),
+            min(self.read_timeout, remaining_time),
+        )
+
+        try:
+            with self._limit(url) as permit, self.metrics.time('http-request'):
+                if on_sending:
+                    on_sending()
+
+                start = time.monotonic()
+                response = self.session.get(url, timeout=timeout, headers=headers, stream=True)
+                self._read_content(response, deadline)
+                latency = time.monotonic() - start
+                permit.report(response.status_code, response.headers.get('Retry-After'))
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exception:
+            self.metrics.increment('http-errors')
+            raise HttpRequestConnectionError() from exception
+
+        if self.hedging_policy:
+            self.hedging_policy.observe(latency)
+
+        self.metrics.increment('http-requests')
+        self.metrics.increment('http-bytes-downloaded', len(response.content))
+
+        return response
+
+    def _read_content(self, response: requests.Response, deadline: float):
+        """
+        Reads the body of a streamed response a chunk at a time, giving up once
+        the deadline passes, as the read timeout only bounds each chunk
+        """
+        chunks = []
+
+        for chunk in response.iter_content(CHUNK_SIZE):
+            if time.monotonic() > deadline:
+                response.close()
+                self.metrics.increment('http-errors')
+                raise HttpRequestConnectionError()
+
+            chunks.append(chunk)
+
+        response._content = b''.join(chunks)  # pylint: disable=protected-access
+
+    def _limit(self, url: str):
+        if not self.rate_limiter:
+            return nullcontext(RequestPermit())
+
+        return self.rate_limiter.limit(url)
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        return session
+
     def _validate_response_status_code(self, response: requests.Response):
         """
         Runs a validation on the response status code and raise exceptions if needed
         """
         if response.status_code != 200:
+            self.metrics.increment('http-errors')
             self.logger.error(
-                f'Request made to {response.request.url} returned {response.status_code}'
+                'Request made to %s returned %s',
+                response.request.url,
+                response.status_code,
             )
             raise HttpRequestDidNotReturnOk
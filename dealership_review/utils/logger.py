@@ -1,37 +1,138 @@
 # pylint: disable=missing-function-docstring,no-self-use
 
+import atexit
 import os
+import queue
+import threading
+from enum import IntEnum
 
 
-def avoid_log_on_test(function):
-    def wrapper(*args, **kwargs):
-        if os.getenv('ENV') == 'test':
-            return None
-        return function(*args, **kwargs)
-    return wrapper
+class LogLevel(IntEnum):
+    """
+    Enum class to define the severity of a log message. A logger only writes
+    the messages at or above its level.
+    """
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+    CRITICAL = 50
+
+
+DEFAULT_LOG_LEVEL = LogLevel.DEBUG
+DISABLED_LOG_LEVEL = LogLevel.CRITICAL + 1
+
+
+class PrintHandler:
+    """
+    Writes every log line right away, in the calling thread
+    """
+
+    def emit(self, line: str):
+        print(line)
+
+    def flush(self):
+        pass
+
+
+class BackgroundHandler:
+    """
+    Writes the log lines from a background thread, so the threads logging
+    only put them in a queue instead of waiting on each other for the output.
+    The lines waiting in the queue are written all at once. Lines that cannot
+    be written, e.g., to a closed standard output, are dropped.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def emit(self, line: str):
+        if self._thread is None:
+            self._start()
+
+        self._queue.put(line)
+
+    def flush(self):
+        """
+        Waits until every line emitted so far is written
+        """
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._write_lines, daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _write_lines(self):
+        while True:
+            lines = [self._queue.get()]
+
+            try:
+                while True:
+                    lines.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            try:
+                print('\n'.join(lines))
+            except (OSError, ValueError):
+                pass
+            finally:
+                for _ in lines:
+                    self._queue.task_done()
+
+
+_DEFAULT_HANDLER = BackgroundHandler()
 
 
 class Logger:
     """
-    Wrapper for a logger class
+    Wrapper for a logger class.
+    Messages below the logger level are dropped before being formatted, and
+    messages may take %-style arguments, only formatted when written, i.e.,
+    logger.debug('Fetching review page %s', page_number). Nothing is written
+    when the ENV environment variable is test at the logger creation.
+    By default, the lines are written by a background thread shared by every
+    logger; `flush` waits until they are written.
     """
 
-    @avoid_log_on_test
-    def debug(self, message):
-        print(f'### DEBUG /// {message}')
+    def __init__(self, level: LogLevel = DEFAULT_LOG_LEVEL, handler=None):
+        self.level = DISABLED_LOG_LEVEL if os.getenv('ENV') == 'test' else level
+        self.handler = handler or _DEFAULT_HANDLER
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        return level >= self.level
+
+    def debug(self, message, *args):
+        if self.is_enabled_for(LogLevel.DEBUG):
+            self._emit(LogLevel.DEBUG, message, args)
+
+    def info(self, message, *args):
+        if self.is_enabled_for(LogLevel.INFO):
+            self._emit(LogLevel.INFO, message, args)
+
+    def warning(self, message, *args):
+        if self.is_enabled_for(LogLevel.WARNING):
+            self._emit(LogLevel.WARNING, message, args)
+
+    def error(self, message, *args):
+        if self.is_enabled_for(LogLevel.ERROR):
+            self._emit(LogLevel.ERROR, message, args)
 
-    @avoid_log_on_test
-    def info(self, message):
-        print(f'### INFO /// {message}')
+    def critical(self, message, *args):
+        if self.is_enabled_for(LogLevel.CRITICAL):
+            self._emit(LogLevel.CRITICAL, message, args)
 
-    @avoid_log_on_test
-    def warning(self, message):
-        print(f'### WARNING /// {message}')
+    def flush(self):
+        self.handler.flush()
 
-    @avoid_log_on_test
-    def error(self, message):
-        print(f'### ERROR /// {message}')
+    def _emit(self, level: LogLevel, message, args: tuple):
+        if args:
+            message = message % args
 
-    @avoid_log_on_test
-    def critical(self, message):
-        print(f'### CRITICAL /// {message}')
+        self.handler.emit(f'### {level.name} /// {message}')
@@ -0,0 +1,165 @@
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+DEFAULT_LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10)
+DEFAULT_PROMETHEUS_PREFIX = 'dealership_review'
+
+_DISABLED_TIMER = nullcontext()
+
+
+class Histogram:
+    """
+    Count of the observed values falling under each bucket upper bound,
+    along with their sum and total count
+    """
+
+    def __init__(self, buckets: tuple = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        """
+        Adds a value to the histogram
+        """
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def to_dict(self) -> dict:
+        """
+        Returns the cumulative count of each bucket by its upper bound, with the
+        sum and the count of the values
+        """
+        cumulative_counts = []
+        count = 0
+
+        for bucket_count in self.bucket_counts:
+            count += bucket_count
+            cumulative_counts.append(count)
+
+        return {
+            'buckets': dict(zip([*map(str, self.buckets), '+Inf'], cumulative_counts)),
+            'sum': self.sum,
+            'count': self.count,
+        }
+
+
+class MetricsCollector:
+    """
+    Collects counters and latency histograms of the scrapping stages.
+    A disabled collector records nothing, and its methods return right away,
+    so it can be used unconditionally. See `DISABLED_METRICS`.
+    """
+
+    def __init__(self, enabled: bool = True, buckets: tuple = DEFAULT_LATENCY_BUCKETS):
+        self.enabled = enabled
+        self.buckets = buckets
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: int = 1):
+        """
+        Adds value to the counter with the given name
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float):
+        """
+        Records a duration in the histogram with the given name
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            histogram = self._histograms.get(name)
+
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram(self.buckets)
+
+            histogram.observe(seconds)
+
+    def time(self, name: str):
+        """
+        Returns a context manager recording how long its block takes in the
+        histogram with the given name
+        """
+        if not self.enabled:
+            return _DISABLED_TIMER
+
+        return self._time(name)
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current value of every counter and histogram
+        """
+        with self._lock:
+            return {
+                'counters': dict(self._counters),
+                'histograms': {
+                    name: histogram.to_dict()
+                    for name, histogram in self._histograms.items()
+                },
+            }
+
+    def to_json(self) -> str:
+        """
+        Returns the snapshot as JSON
+        """
+        return json.dumps(self.snapshot(), sort_keys=True)
+
+    def to_prometheus(self, prefix: str = DEFAULT_PROMETHEUS_PREFIX) -> str:
+        """
+        Returns the snapshot in the Prometheus text exposition format. Counters
+        are suffixed with _total, and histograms with _seconds.
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        for name, value in sorted(snapshot['counters'].items()):
+            metric_name = f'{_to_metric_name(prefix, name)}_total'
+            lines.append(f'# TYPE {metric_name} counter')
+            lines.append(f'{metric_name} {value}')
+
+        for name, histogram in sorted(snapshot['histograms'].items()):
+            metric_name = f'{_to_metric_name(prefix, name)}_seconds'
+            lines.append(f'# TYPE {metric_name} histogram')
+            for bucket, count in histogram['buckets'].items():
+                lines.append(f'{metric_name}_bucket{{le="{bucket}"}} {count}')
+            lines.append(f'{metric_name}_sum {histogram["sum"]}')
+            lines.append(f'{metric_name}_count {histogram["count"]}')
+
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        """
+        Clears every counter and histogram
+        """
+        with self._lock:
+            self._counters = {}
+            self._histograms = {}
+
+    @contextmanager
+    def _time(self, name: str):
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+
+def _to_metric_name(prefix: str, name: str) -> str:
+    return f'{prefix}_{name}'.replace('-', '_').replace('.', '_')
+
+
+DISABLED_METRICS = MetricsCollector(enabled=False)
@@ -0,0 +1,204 @@
+# pylint: disable=too-few-public-methods
+
+import queue
+import threading
+from functools import partial
+
+DEFAULT_QUEUE_SIZE = 4
+POLL_INTERVAL = 0.1
+
+_END = object()
+
+
+class _Failure:
+    """
+    An exception raised by a stage, carried through the next stages instead of a value
+    """
+
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+
+def _get_result(result):
+    if isinstance(result, _Failure):
+        raise result.exception
+
+    return result
+
+
+class PipelineStage:
+    """
+    A function applied to every item going through a pipeline, by a number
+    of threads of its own
+    """
+
+    def __init__(self, function, workers: int = 1):
+        self.function = function
+        self.workers = workers
+
+
+class Pipeline:
+    """
+    Runs items through a sequence of stages connected by bounded queues, so every
+    stage works on different items at the same time. A stage waits when the next
+    one falls behind, and no more items than the queues and the workers can hold
+    are in the pipeline at once, however fast the first stages are.
+    An exception raised by a stage skips the next ones, and is raised again when
+    the item's result is got. Meant to be used as a context manager, which stops
+    the remaining work on exit.
+    """
+
+    def __init__(self, stages: list, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.stages = stages
+        self.queue_size = queue_size
+        self._stopped = threading.Event()
+        self._threads = []
+
+    def __enter__(self) -> 'Pipeline':
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def run(self, items):
+        """
+        Starts running the items through the stages. Returns an iterator over
+        a getter of each item's result, in the order of the items.
+        """
+        items = list(items)
+        window = threading.Semaphore(
+            self.queue_size * (len(self.stages) + 1) +
+            sum(stage.workers for stage in self.stages)
+        )
+        input_queue = queue.Queue(maxsize=self.queue_size)
+
+        self._start_thread(self._feed, enumerate(items), window, input_queue)
+
+        for stage in self.stages:
+            output_queue = queue.Queue(maxsize=self.queue_size)
+            finished_workers = _Counter(stage.workers)
+
+            for _ in range(stage.workers):
+                self._start_thread(
+                    self._work,
+                    stage,
+                    input_queue,
+                    output_queue,
+                    finished_workers,
+                )
+
+            input_queue = output_queue
+
+        return self._get_results(len(items), window, input_queue)
+
+    def stop(self):
+        """
+        Stops the stages threads, dropping the items still in the pipeline
+        """
+        self._stopped.set()
+
+        for thread in self._threads:
+            thread.join()
+
+        self._threads = []
+
+    def _start_thread(self, target, *args):
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _feed(self, indexed_items, window: threading.Semaphore, input_queue: queue.Queue):
+        for indexed_item in indexed_items:
+            if not self._acquire(window) or not self._put(input_queue, indexed_item):
+                return
+
+        self._put(input_queue, _END)
+
+    def _work(
+            self,
+            stage: PipelineStage,
+            input_queue: queue.Queue,
+            output_queue: queue.Queue,
+            finished_workers: '_Counter',
+    ):
+        while True:
+            entry = self._get(input_queue)
+
+            if entry is None:
+                return
+
+            if entry is _END:
+                self._put(input_queue, _END)
+                break
+
+            index, value = entry
+
+            if not isinstance(value, _Failure):
+                try:
+                    value = stage.function(value)
+                except Exception as exception:  # pylint: disable=broad-except
+                    value = _Failure(exception)
+
+            if not self._put(output_queue, (index, value)):
+                return
+
+        if finished_workers.decrement() == 0:
+            self._put(output_queue, _END)
+
+    @staticmethod
+    def _get_results(items_count: int, window: threading.Semaphore, output_queue: queue.Queue):
+        buffered_results = {}
+
+        for next_index in range(items_count):
+            while next_index not in buffered_results:
+                index, result = output_queue.get()
+                buffered_results[index] = result
+
+            yield partial(_get_result, buffered_results.pop(next_index))
+
+            window.release()
+
+    def _acquire(self, window: threading.Semaphore) -> bool:
+        while not self._stopped.is_set():
+            if window.acquire(timeout=POLL_INTERVAL):
+                return True
+
+        return False
+
+    def _put(self, output_queue: queue.Queue, entry) -> bool:
+        while not self._stopped.is_set():
+            try:
+                output_queue.put(entry, timeout=POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    def _get(self, input_queue: queue.Queue):
+        while not self._stopped.is_set():
+            try:
+                return input_queue.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+        return None
+
+
+class _Counter:
+    """
+    Thread safe count down of the workers of a stage still running
+    """
+
+    def __init__(self, value: int):
+        self.value = value
+        self._lock = threading.Lock()
+
+    def decrement(self) -> int:
+        """
+        Counts one more finished worker and returns how many are still running
+        """
+        with self._lock:
+            self.value -= 1
+
+            return self.value
@@ -0,0 +1,147 @@
+# pylint: disable=too-many-instance-attributes
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+
+from dealership_review.utils.metrics import MetricsCollector
+
+DEFAULT_PRINTED_FUNCTIONS = 20
+STAGES = ['http-request', 'parse', 'extract', 'score', 'sort']
+THREADS_PROFILED = sys.version_info < (3, 12)
+
+
+class Profiler:
+    """
+    Profiles the code run in its block with cProfile, in the current thread and
+    in every thread started meanwhile, e.g., by the page executors, and measures
+    its wall-clock time and peak memory with tracemalloc.
+    A profile can only be stopped from its own thread, so the stats only cover
+    the threads done by the end of the block, the others being counted apart.
+    Python 3.12+ runs a single profiler at a time, so it only profiles the
+    current thread.
+    Paired with the metrics collector the run recorded into, it also sums up
+    the time taken by each scrapping stage.
+    """
+
+    def __init__(self, metrics: MetricsCollector = None):
+        self.metrics = metrics
+        self.wall_clock = None
+        self.peak_memory = None
+        self.running_threads = 0
+        self._profiles = []
+        self._threads_profiles = []
+        self._lock = threading.Lock()
+        self._start = None
+
+    def __enter__(self) -> 'Profiler':
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def start(self):
+        """
+        Starts profiling
+        """
+        tracemalloc.start()
+
+        if THREADS_PROFILED:
+            threading.setprofile(self._profile_thread)
+
+        self._start = time.perf_counter()
+        self._profiles = [self._create_profile()]
+
+    def stop(self):
+        """
+        Stops profiling, in the current thread, and keeps the profiles of the
+        threads done meanwhile
+        """
+        self._profiles[0].disable()
+        self.wall_clock = time.perf_counter() - self._start
+        threading.setprofile(None)
+        self.peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        with self._lock:
+            threads_profiles, self._threads_profiles = self._threads_profiles, []
+
+        for thread, profile in threads_profiles:
+            if thread.is_alive():
+                self.running_threads += 1
+            else:
+                profile.create_stats()
+                self._profiles.append(profile)
+
+    def get_stats(self) -> pstats.Stats:
+        """
+        Returns the stats of every profiled thread, merged together
+        """
+        stats = pstats.Stats(self._profiles[0])
+
+        for profile in self._profiles[1:]:
+            stats.add(profile)
+
+        return stats
+
+    def dump_stats(self, path: str):
+        """
+        Writes the merged stats to path, to be read with `pstats` or snakeviz
+        """
+        self.get_stats().dump_stats(path)
+
+    def get_summary(self, printed_functions: int = DEFAULT_PRINTED_FUNCTIONS) -> str:
+        """
+        Returns the wall-clock time and peak memory of the run, the time taken by
+        each scrapping stage, and the functions taking the most cumulative time
+        """
+        lines = [
+            f'Wall-clock time: {self.wall_clock:.3f}s',
+            f'Peak memory: {self.peak_memory / 1024 / 1024:.2f} MiB',
+        ]
+
+        if self.metrics:
+            histograms = self.metrics.snapshot()['histograms']
+            lines.append(f'{"Stage":<14}{"Calls":>8}{"Total (s)":>12}{"Mean (s)":>12}')
+
+            for stage in STAGES:
+                histogram = histograms.get(stage, {'count': 0, 'sum': 0.0})
+                mean = histogram['sum'] / histogram['count'] if histogram['count'] else 0.0
+                lines.append(
+                    f'{stage:<14}{histogram["count"]:>8}'
+                    f'{histogram["sum"]:>12.3f}{mean:>12.6f}'
+                )
+
+        if not THREADS_PROFILED:
+            lines.append('Only the main thread was profiled, Python 3.12+ profiles one at a time')
+        elif self.running_threads:
+            lines.append(f'Threads still running, and so not profiled: {self.running_threads}')
+
+        stream = io.StringIO()
+        stats = self.get_stats()
+        stats.stream = stream
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(printed_functions)
+        lines.append(stream.getvalue())
+
+        return '\n'.join(lines)
+
+    @staticmethod
+    def _create_profile() -> cProfile.Profile:
+        profile = cProfile.Profile()
+        profile.enable()
+
+        return profile
+
+    def _profile_thread(self, *_):
+        """
+        Profiles a thread from its first call on
+        """
+        profile = self._create_profile()
+
+        with self._lock:
+            self._threads_profiles.append((threading.current_thread(), profile))
@@ -0,0 +1,201 @@
+# pylint: disable=too-few-public-methods,too-many-instance-attributes,too-many-arguments
+
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+DEFAULT_INITIAL_RATE = 5.0
+DEFAULT_MIN_RATE = 0.5
+DEFAULT_MAX_RATE = 100.0
+DEFAULT_INITIAL_CONCURRENCY = 2.0
+DEFAULT_MAX_CONCURRENCY = 32.0
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_LATENCY_TOLERANCE = 3.0
+LATENCY_SMOOTHING = 0.2
+MIN_SLOW_LATENCY = 0.05
+THROTTLING_STATUS_CODES = (429, 503)
+
+
+class RequestPermit:
+    """
+    Permission to send one request, on which its outcome is reported
+    """
+
+    def __init__(self):
+        self.status_code = None
+        self.retry_after = None
+
+    def report(self, status_code: int, retry_after: str = None):
+        """
+        Reports the response status code, and its Retry-After header if any
+        """
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class HostLimits:
+    """
+    Token bucket and concurrency limit of the requests to a single host,
+    adapted to its responses by additive increase and multiplicative decrease
+    """
+
+    def __init__(self, rate_limiter: 'RateLimiter'):
+        self.settings = rate_limiter
+        self.rate = rate_limiter.initial_rate
+        self.concurrency = rate_limiter.initial_concurrency
+        self.tokens = 1.0
+        self.in_flight = 0
+        self.latency = None
+        self._refilled_at = time.monotonic()
+        self._decreased_at = 0.0
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """
+        Waits until a request can be sent without going over the rate and the
+        concurrency limits, then takes a token for it
+        """
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._paused_until:
+                    wait_time = self._paused_until - now
+                elif self.in_flight >= int(self.concurrency):
+                    wait_time = None
+                elif self.tokens < 1:
+                    wait_time = (1 - self.tokens) / self.rate
+                else:
+                    self.tokens -= 1
+                    self.in_flight += 1
+                    return
+
+                self._condition.wait(wait_time)
+
+    def release(self, status_code: int, retry_after: str, latency: float):
+        """
+        Ends a request and adapts the limits to its outcome: a failed, throttled
+        or much slower than usual request decreases them, otherwise they increase
+        """
+        with self._condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+
+            if status_code is None or status_code in THROTTLING_STATUS_CODES:
+                self._decrease(now)
+                self._pause(now, retry_after)
+            elif self._is_slow(latency):
+                self._decrease(now)
+            else:
+                self._increase()
+                self.latency = latency if self.latency is None else \
+                    (1 - LATENCY_SMOOTHING) * self.latency + LATENCY_SMOOTHING * latency
+
+            self._condition.notify_all()
+
+    def _is_slow(self, latency: float) -> bool:
+        """
+        Whether the latency is latency_tolerance times the usual one, ignoring
+        latencies too short for their variation to mean anything
+        """
+        return self.latency is not None and latency > max(
+            MIN_SLOW_LATENCY,
+            self.settings.latency_tolerance * self.latency,
+        )
+
+    def _refill(self, now: float):
+        self.tokens = min(
+            max(self.concurrency, 1),
+            self.tokens + (now - self._refilled_at) * self.rate,
+        )
+        self._refilled_at = now
+
+    def _increase(self):
+        self.rate = min(self.settings.max_rate, self.rate + 1 / self.rate)
+        self.concurrency = min(
+            self.settings.max_concurrency,
+            self.concurrency + 1 / self.concurrency,
+        )
+
+    def _decrease(self, now: float):
+        """
+        Decreases the limits once for the requests that were already in flight
+        when the first of them failed
+        """
+        if now - self._decreased_at < (self.latency or 0):
+            return
+
+        self._decreased_at = now
+        self.rate = max(self.settings.min_rate, self.rate * self.settings.decrease_factor)
+        self.concurrency = max(1.0, self.concurrency * self.settings.decrease_factor)
+        self.tokens = min(self.tokens, 1.0)
+
+    def _pause(self, now: float, retry_after: str):
+        if retry_after and retry_after.isdigit():
+            self._paused_until = max(self._paused_until, now + int(retry_after))
+
+
+class RateLimiter:
+    """
+    Limits the requests sent to each host by rate and by concurrency, finding
+    the highest ones the host tolerates: both grow while the responses stay
+    healthy, and are cut by decrease_factor when the host throttles (429, 503),
+    fails, or answers latency_tolerance times slower than usual. A Retry-After
+    header also pauses the requests to the host.
+    Shared by every thread requesting through the same HTTP client.
+    """
+
+    def __init__(
+            self,
+            initial_rate: float = DEFAULT_INITIAL_RATE,
+            min_rate: float = DEFAULT_MIN_RATE,
+            max_rate: float = DEFAULT_MAX_RATE,
+            initial_concurrency: float = DEFAULT_INITIAL_CONCURRENCY,
+            max_concurrency: float = DEFAULT_MAX_CONCURRENCY,
+            decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+            latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+    ):
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self._hosts_limits = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def limit(self, url: str):
+        """
+        Waits until a request to the url can be sent, and yields a permit to
+        report its outcome on. A request leaving the block without a report,
+        i.e., raising, counts as failed.
+        """
+        host_limits = self.get_host_limits(url)
+        permit = RequestPermit()
+
+        host_limits.acquire()
+        start = time.monotonic()
+
+        try:
+            yield permit
+        finally:
+            host_limits.release(permit.status_code, permit.retry_after, time.monotonic() - start)
+
+    def get_host_limits(self, url: str) -> HostLimits:
+        """
+        Returns the limits of the url host
+        """
+        host = urlsplit(url).netloc
+
+        with self._lock:
+            host_limits = self._hosts_limits.get(host)
+
+            if host_limits is None:
+                host_limits = self._hosts_limits[host] = HostLimits(self)
+
+            return host_limits
@@ -0,0 +1,60 @@
+import random
+import time
+
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_BACKOFF = 0.5
+DEFAULT_MAX_BACKOFF = 8.0
+DEFAULT_DEADLINE = 60.0
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy:
+    """
+    How many times, and after how long, a failed request is sent again.
+    Requests failing to connect, timing out, or answered with a retryable
+    status code are retried after an exponential backoff with full jitter,
+    i.e., a random delay up to backoff * 2 ** attempt, so the clients failing
+    together do not retry together. A Retry-After header sets the least delay.
+    No attempt starts, nor lasts, past `deadline` seconds after the first one.
+    """
+
+    def __init__(
+            self,
+            max_retries: int = DEFAULT_MAX_RETRIES,
+            backoff: float = DEFAULT_BACKOFF,
+            max_backoff: float = DEFAULT_MAX_BACKOFF,
+            deadline: float = DEFAULT_DEADLINE,
+            retryable_status_codes: tuple = RETRYABLE_STATUS_CODES,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.retryable_status_codes = retryable_status_codes
+
+    def get_deadline(self) -> float:
+        """
+        Returns the monotonic time past which a request started now must give up
+        """
+        return time.monotonic() + self.deadline if self.deadline else float('inf')
+
+    def get_delay(self, attempt: int, retry_after: str = None) -> float:
+        """
+        Returns how long to wait before retrying the given failed attempt,
+        counted from 0
+        """
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+
+        return delay
+
+    def is_retryable(self, status_code: int) -> bool:
+        """
+        Whether a response with the given status code is worth retrying
+        """
+        return status_code in self.retryable_status_codes
+
+
+NO_RETRIES = RetryPolicy(max_retries=0)
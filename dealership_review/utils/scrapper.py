@@ -1,9 +1,29 @@
+# pylint: disable=import-outside-toplevel
+
 from __future__ import annotations
 
-from bs4 import BeautifulSoup, element as beautiful_soup_element
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from dealership_review.utils.metrics import MetricsCollector, DISABLED_METRICS
 
 from dealership_review.exceptions.scrapper_exceptions import ElementNotFound
 
+if TYPE_CHECKING:
+    from bs4 import SoupStrainer, element as beautiful_soup_element
+
+
+class ParserType(Enum):
+    """
+    Enum class to define the HTML parsers the scrapper may build its tree with.
+    LXML is backed by a C library and is much faster than the pure Python HTML_PARSER.
+    """
+    HTML_PARSER = 'html.parser'
+    LXML = 'lxml'
+
+
+DEFAULT_PARSER = ParserType.HTML_PARSER
+
 
 def to_scrapper_element(  # pylint: disable=missing-function-docstring
         element: beautiful_soup_element
@@ -136,13 +156,72 @@ class ScrapperElement(ScrapperSearchable):
         """
         return self.element['class']
 
+    def get_attribute(self, name: str) -> str:
+        """
+        Returns the value of the given attribute of the element, or None if
+        it is not set, i.e., if the element is <a href="/wow">, the returned
+        value for href is /wow
+        """
+        return self.element.get(name)
+
+
+class ScrapperFilter:  # pylint: disable=too-few-public-methods
+    """
+    Conditions an element must match to be kept when the scrapper parses a
+    document partially, i.e., ScrapperFilter('div', cls='review') keeps only
+    the <div class="review"> elements and everything inside them.
+    cls may also be a list, to keep elements having any of the given classes.
+    """
+
+    def __init__(self, name: str, cls=None, attrs: dict = None):
+        self.name = name
+        self.classes = [cls] if isinstance(cls, str) else cls
+        self.attrs = attrs
+
+    def to_strainer(self) -> SoupStrainer:
+        """
+        Returns the equivalent strainer of the scrapper package
+        """
+        from bs4 import SoupStrainer
+
+        if not self.classes:
+            return SoupStrainer(self.name, attrs=self.attrs or {})
+
+        return SoupStrainer(self.name, attrs=self.attrs or {}, class_=self._matches_classes)
+
+    def _matches_classes(self, value) -> bool:
+        """
+        While parsing, the class attribute may not be split into a list yet
+        """
+        if not value:
+            return False
+
+        element_classes = value.split() if isinstance(value, str) else value
+
+        return any(cls in element_classes for cls in self.classes)
+
 
 class Scrapper(ScrapperSearchable):
     """
-    Wrapper for an HTML scrapper package
+    Wrapper for an HTML scrapper package, only imported when the first
+    scrapper is built.
+    When only_elements is given, the tree is built only for the elements matching
+    it; the rest of the document is skipped, which is faster and uses less memory.
     """
 
-    def __init__(self, html: str):
+    def __init__(
+            self,
+            html: str,
+            parser: ParserType = DEFAULT_PARSER,
+            only_elements: ScrapperFilter = None,
+            metrics: MetricsCollector = None,
+    ):
+        from bs4 import BeautifulSoup
+
         self.html = html
-        base_element = BeautifulSoup(html, 'html.parser')
+        parse_only = only_elements.to_strainer() if only_elements else None
+
+        with (metrics or DISABLED_METRICS).time('parse'):
+            base_element = BeautifulSoup(html, parser.value, parse_only=parse_only)
+
         super().__init__(base_element)
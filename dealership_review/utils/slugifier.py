@@ -1,13 +1,13 @@
-# pylint: disable=missing-function-docstring,too-few-public-methods
-
-from slugify import slugify as slg
+# pylint: disable=missing-function-docstring,too-few-public-methods,import-outside-toplevel
 
 
 class Slugifier:
     """
-    Wrapper for a slugifier package
+    Wrapper for a slugifier package, only imported on the first call
     """
 
     @staticmethod
     def slugify(text: str) -> str:
+        from slugify import slugify as slg
+
         return slg(text)
@@ -0,0 +1,29 @@
+# pylint: disable=missing-function-docstring
+
+import json
+import unittest
+
+from benchmarks.benchmark_suite import run_benchmarks, GeneratedPagesHttpClient
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """
+    Tests for the benchmark_suite module
+    """
+
+    def test_run_benchmarks(self):
+        results = run_benchmarks(pages=2, reviews_count=3, repeat=1)
+
+        self.assertEqual(json.loads(json.dumps(results)), results)
+        self.assertEqual(
+            set(results['results']),
+            {'scrapper-parse', 'review-extraction', 'review-scoring', 'batch-scoring',
+             'get-scores'},
+        )
+        self.assertGreater(results['results']['get-scores']['peak-memory-bytes'], 0)
+
+    def test_generated_pages_http_client(self):
+        http_client = GeneratedPagesHttpClient(2, reviews_count=1)
+
+        self.assertIn('review-entry', http_client.get_html('https://www.wow.such.url/page2/'))
+        self.assertNotIn('review-entry', http_client.get_html('https://www.wow.such.url/page3/'))
@@ -0,0 +1,51 @@
+# pylint: disable=missing-function-docstring,protected-access
+
+import unittest
+
+from benchmarks.page_generator import generate_reviews, generate_review_page, render_review_page
+
+from dealership_review.core.dealership_review_scrapper import DealerShipReviewScrapper
+from dealership_review.utils.scrapper import ParserType
+
+
+class TestPageGenerator(unittest.TestCase):
+    """
+    Tests for the page_generator module
+    """
+
+    def test_generated_page_is_scrapped_into_the_generated_reviews(self):
+        scrapped_reviews = generate_reviews(
+            reviews_count=4,
+            message_words=20,
+            employees_count=3,
+            specific_ratings_count=7,
+        )
+        page_html = render_review_page(scrapped_reviews, page_number=2, last_page_number=6)
+
+        for parser in ParserType:
+            with self.subTest(parser=parser):
+                reviews, last_page_number = DealerShipReviewScrapper(parser=parser) \
+                    ._parse_reviews_and_last_page(page_html)
+
+                self.assertEqual([review.to_dict() for review in reviews], scrapped_reviews)
+                self.assertEqual(last_page_number, 6)
+
+    def test_generate_review_page_is_deterministic(self):
+        self.assertEqual(generate_review_page(page_number=3), generate_review_page(page_number=3))
+        self.assertNotEqual(
+            generate_review_page(page_number=3),
+            generate_review_page(page_number=4),
+        )
+
+    def test_generate_reviews_options(self):
+        scrapped_reviews = generate_reviews(
+            reviews_count=2,
+            message_words=15,
+            employees_count=1,
+            specific_ratings_count=0,
+        )
+
+        self.assertEqual(len(scrapped_reviews), 2)
+        self.assertEqual(len(scrapped_reviews[0]['message'].split()), 15)
+        self.assertEqual(len(scrapped_reviews[0]['employees-scores']), 1)
+        self.assertEqual(scrapped_reviews[0]['specific-scores'], {})
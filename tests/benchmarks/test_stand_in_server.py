@@ -0,0 +1,70 @@
+# pylint: disable=missing-function-docstring
+
+import time
+import unittest
+
+from benchmarks.stand_in_server import StandInServer, StandInServerOptions
+
+from dealership_review.core.mediator import Mediator
+from dealership_review.utils.http_client import HttpClient
+from dealership_review.utils.retry_policy import NO_RETRIES
+
+from dealership_review.exceptions.http_client_exceptions import (
+    HttpRequestDidNotReturnOk, HttpRequestConnectionError,
+)
+
+
+class TestStandInServer(unittest.TestCase):
+    """
+    Tests for the StandInServer class
+    """
+
+    def setUp(self) -> None:
+        self.http_client = HttpClient(retry_policy=NO_RETRIES)
+
+    def tearDown(self) -> None:
+        self.http_client.close()
+
+    def test_get_scores_from_stand_in_server(self):
+        with StandInServer(StandInServerOptions(pages=3, reviews_count=4)) as stand_in_server:
+            reviews = Mediator(http_client=self.http_client).get_scores(
+                pages=5,
+                count=20,
+                dealership_url=stand_in_server.url,
+                max_workers=3,
+            )
+
+        self.assertEqual(len(reviews), 12)
+        self.assertEqual(stand_in_server.requests_count, 5)
+
+    def test_latency(self):
+        with StandInServer(StandInServerOptions(latency=0.05)) as stand_in_server:
+            start = time.perf_counter()
+            self.http_client.get_html(f'{stand_in_server.url}/page1/')
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+
+    def test_throttled_requests(self):
+        with StandInServer(StandInServerOptions(throttle_rate=1)) as stand_in_server:
+            with self.assertRaises(HttpRequestDidNotReturnOk):
+                self.http_client.get_html(f'{stand_in_server.url}/page1/')
+
+    def test_server_errors(self):
+        with StandInServer(StandInServerOptions(server_error_rate=1)) as stand_in_server:
+            with self.assertRaises(HttpRequestDidNotReturnOk):
+                self.http_client.get_html(f'{stand_in_server.url}/page1/')
+
+    def test_reset_connections(self):
+        with StandInServer(StandInServerOptions(reset_rate=1)) as stand_in_server:
+            with self.assertRaises(HttpRequestConnectionError):
+                self.http_client.get_html(f'{stand_in_server.url}/page1/')
+
+    def test_slow_drip_body(self):
+        options = StandInServerOptions(reviews_count=1, drip_chunk_size=1024, drip_interval=0.01)
+
+        with StandInServer(options) as stand_in_server:
+            start = time.perf_counter()
+            html = self.http_client.get_html(f'{stand_in_server.url}/page1/')
+
+        self.assertIn('review-entry', html)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.01 * (len(html) // 1024))
@@ -0,0 +1,54 @@
+# pylint: disable=missing-function-docstring
+
+import random
+import unittest
+
+from dealership_review.core.batch_scorer import calculate_scores
+from dealership_review.core.review import Review, POSITIVE_WORDS, NEGATIVE_WORDS, MODIFIER_WORDS
+
+
+def generate_scrapped_review(generator: random.Random) -> dict:
+    words = POSITIVE_WORDS + NEGATIVE_WORDS + MODIFIER_WORDS + ['wow', 'such', 'car']
+
+    return {
+        'reviewer': 'Doge',
+        'overall-score': generator.randrange(0, 51),
+        'employees-scores': [generator.randrange(0, 51) for _ in range(generator.randrange(4))],
+        'message': ' '.join(generator.choice(words) for _ in range(generator.randrange(30))),
+        'recommend-dealer': generator.random() < 0.5,
+        'specific-scores': {
+            f'rating-{index}': generator.randrange(0, 51)
+            for index in range(generator.randrange(6))
+        },
+    }
+
+
+class TestCalculateScores(unittest.TestCase):
+    """
+    Tests for the calculate_scores function
+    """
+
+    def test_calculate_scores_matches_review_score(self):
+        generator = random.Random(42)
+        scrapped_reviews = [generate_scrapped_review(generator) for _ in range(5000)]
+
+        scores = calculate_scores(scrapped_reviews)
+
+        reviews = map(Review.from_dict, scrapped_reviews)
+
+        self.assertEqual(scores.tolist(), [review.score for review in reviews])
+
+    def test_calculate_scores_without_ratings(self):
+        scrapped_review = {
+            'reviewer': 'Doge',
+            'overall-score': 0,
+            'employees-scores': [],
+            'message': 'Bad bad bad',
+            'recommend-dealer': False,
+            'specific-scores': {},
+        }
+
+        self.assertEqual(calculate_scores([scrapped_review]).tolist(), [0])
+
+    def test_calculate_scores_without_reviews(self):
+        self.assertEqual(calculate_scores([]).tolist(), [])
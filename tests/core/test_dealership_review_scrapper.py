@@ -1,17 +1,42 @@
 # pylint: disable=missing-function-docstring,too-many-locals
 
+import asyncio
+import io
+import json
+import os
+import tempfile
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
-from dealership_review.core.dealership_review_scrapper import DealerShipReviewScrapper
+from dealership_review.core.dealership_review_scrapper import (
+    DealerShipReviewScrapper, create_parse_executor,
+)
+from dealership_review.core.review import Review
+from dealership_review.core.review_sinks import JsonLinesSink
+from dealership_review.core.watermark_store import WatermarkStore
 
 from dealership_review.exceptions.http_client_exceptions import (
     HttpRequestDidNotReturnOk, HttpRequestConnectionError,
 )
 from dealership_review.exceptions.scrapper_exceptions import ElementNotFound
+from dealership_review.utils.metrics import MetricsCollector
+from dealership_review.utils.scrapper import ParserType
 
 PAGES = 5
 URL = 'https://www.wow.such.url'
+RESOURCES_PATH = os.path.join(os.path.dirname(__file__), '../resources')
+PARSER_CORPUS = [
+    'dealerrater_page.html',
+    'dealerrater_page_sloppy.html',
+]
+
+
+def read_resource(file_name: str) -> str:
+    with open(os.path.join(RESOURCES_PATH, file_name), 'r', encoding='utf8') as file:
+        return file.read()
 
 
 class TestDealerShipReviewScrapper(unittest.TestCase):
@@ -100,7 +125,7 @@ class TestDealerShipReviewScrapper(unittest.TestCase):
         result = self.dealership_review_scrapper.scrap_reviews(PAGES, URL)
 
         self.assertEqual(len(result), 1)
-        self.assertEqual(result, [{
+        self.assertEqual([review.to_dict() for review in result], [{
             'reviewer': 'Wow such name',
             'overall-score': 12,
             'employees-scores': [34],
@@ -207,3 +232,532 @@ class TestDealerShipReviewScrapper(unittest.TestCase):
 
         self.assertFalse(result)
         mocked_log_error.assert_called_with('Rating could not be processed')
+
+    @patch(
+        'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper'
+        '._get_reviews_for_page'
+    )
+    def test_scrap_reviews_concurrently_keeps_page_order(self, mocked_get_reviews_for_page):
+        def get_reviews_for_page(_, page_number):
+            time.sleep(0.01 * (PAGES - page_number))
+            return [{'reviewer': f'Reviewer {page_number}'}]
+
+        mocked_get_reviews_for_page.side_effect = get_reviews_for_page
+
+        result = self.dealership_review_scrapper.scrap_reviews(PAGES, URL, max_workers=PAGES)
+
+        self.assertEqual(
+            [review['reviewer'] for review in result],
+            [f'Reviewer {page_number}' for page_number in range(1, PAGES + 1)],
+        )
+
+    @patch(
+        'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper'
+        '._get_reviews_for_page'
+    )
+    def test_scrap_reviews_concurrently_skips_failing_page(self, mocked_get_reviews_for_page):
+        def get_reviews_for_page(_, page_number):
+            if page_number == 2:
+                raise HttpRequestDidNotReturnOk()
+            return [{'reviewer': f'Reviewer {page_number}'}]
+
+        mocked_get_reviews_for_page.side_effect = get_reviews_for_page
+
+        result = self.dealership_review_scrapper.scrap_reviews(PAGES, URL, max_workers=PAGES)
+
+        self.assertEqual(len(result), PAGES - 1)
+
+    @patch(
+        'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper'
+        '._get_reviews_for_page'
+    )
+    def test_scrap_reviews_with_shared_executor(self, mocked_get_reviews_for_page):
+        mocked_get_reviews_for_page.side_effect = \
+            lambda _, page_number: [{'reviewer': f'Reviewer {page_number}'}]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = self.dealership_review_scrapper.scrap_reviews(PAGES, URL, executor=executor)
+            still_running = executor.submit(lambda: True).result()
+
+        self.assertEqual(
+            [review['reviewer'] for review in result],
+            [f'Reviewer {page_number}' for page_number in range(1, PAGES + 1)],
+        )
+        self.assertTrue(still_running)
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    @patch('dealership_review.utils.logger.Logger.error')
+    def test_scrap_reviews_concurrently_with_failing_first_page(
+            self,
+            mocked_log_error,
+            mocked_get_html,
+    ):
+        mocked_get_html.side_effect = MagicMock(side_effect=HttpRequestConnectionError())
+
+        result = self.dealership_review_scrapper.scrap_reviews(PAGES, URL, max_workers=PAGES)
+
+        self.assertFalse(result)
+        mocked_log_error.assert_called_with('It was not possible to fetch data from DealerRater')
+
+    @patch(
+        'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper'
+        '._get_reviews_for_page'
+    )
+    def test_scrap_reviews_incrementally(self, mocked_get_reviews_for_page):
+        pages_reviewers = {
+            1: ['Doge', 'Cate'],
+            2: ['Birb', 'Snek'],
+            3: ['Frog'],
+        }
+        mocked_get_reviews_for_page.side_effect = lambda _, page_number: [
+            Review(reviewer, 40, [], 'Wow', True, {})
+            for reviewer in pages_reviewers.get(page_number, [])
+        ]
+
+        with tempfile.TemporaryDirectory() as directory:
+            watermark_store = WatermarkStore(directory)
+
+            self.dealership_review_scrapper.scrap_reviews(
+                3,
+                URL,
+                watermark_store=watermark_store,
+            )
+
+            pages_reviewers = {
+                1: ['New Doge', 'Doge'],
+                2: ['Cate', 'Birb'],
+                3: ['Snek', 'Frog'],
+            }
+            mocked_get_reviews_for_page.reset_mock()
+
+            result = self.dealership_review_scrapper.scrap_reviews(
+                PAGES,
+                URL,
+                watermark_store=watermark_store,
+            )
+            stored_reviews = watermark_store.load(URL)
+
+        self.assertEqual(
+            [review.reviewer for review in result],
+            ['New Doge', 'Doge', 'Cate', 'Birb', 'Snek', 'Frog'],
+        )
+        self.assertEqual(mocked_get_reviews_for_page.call_count, 2)
+        self.assertEqual(len(stored_reviews), 6)
+
+
+class TestDealerShipReviewScrapperAsync(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the asynchronous scrapping of the DealerShipReviewScrapper class
+    """
+
+    def setUp(self) -> None:
+        self.dealership_review_scrapper = DealerShipReviewScrapper()
+
+    @patch('dealership_review.utils.async_http_client.AsyncHttpClient.get_html')
+    @patch(
+        'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper'
+        '._get_reviews_from_html'
+    )
+    async def test_scrap_reviews_async_keeps_page_order(
+            self,
+            mocked_get_reviews_from_html,
+            mocked_get_html,
+    ):
+        mocked_get_html.side_effect = lambda url: url
+        mocked_get_reviews_from_html.side_effect = lambda html, _: [{'reviewer': html}]
+
+        result = await self.dealership_review_scrapper.scrap_reviews_async(
+            PAGES,
+            URL,
+            max_workers=2,
+        )
+
+        self.assertEqual(
+            [review['reviewer'] for review in result],
+            [f'{URL}/page{page_number}/' for page_number in range(1, PAGES + 1)],
+        )
+
+    @patch('dealership_review.utils.async_http_client.AsyncHttpClient.get_html')
+    @patch(
+        'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper'
+        '._get_reviews_from_html'
+    )
+    async def test_scrap_reviews_async_parses_off_the_event_loop(
+            self,
+            mocked_get_reviews_from_html,
+            mocked_get_html,
+    ):
+        mocked_get_html.return_value = '<html></html>'
+        mocked_get_reviews_from_html.side_effect = lambda html, _: [threading.current_thread()]
+
+        result = await self.dealership_review_scrapper.scrap_reviews_async(PAGES, URL)
+
+        self.assertNotIn(threading.current_thread(), result)
+
+    @patch('dealership_review.utils.async_http_client.AsyncHttpClient.get_html')
+    @patch('dealership_review.utils.logger.Logger.error')
+    async def test_scrap_reviews_async_with_failing_request(
+            self,
+            mocked_log_error,
+            mocked_get_html,
+    ):
+        mocked_get_html.side_effect = HttpRequestConnectionError()
+
+        result = await self.dealership_review_scrapper.scrap_reviews_async(PAGES, URL)
+
+        self.assertFalse(result)
+        mocked_log_error.assert_called_with('It was not possible to fetch data from DealerRater')
+
+    @patch('dealership_review.utils.async_http_client.AsyncHttpClient.get_html')
+    async def test_scrap_reviews_async_discovering_pages(self, mocked_get_html):
+        mocked_get_html.return_value = read_resource('dealerrater_page.html')
+
+        result = await self.dealership_review_scrapper.scrap_reviews_async(
+            10,
+            URL,
+            discover_pages=True,
+        )
+
+        self.assertEqual(len(result), 9)
+        self.assertEqual(mocked_get_html.call_count, 3)
+
+    @patch('dealership_review.utils.async_http_client.AsyncHttpClient.get_html')
+    @patch(
+        'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper'
+        '._get_reviews_from_html'
+    )
+    async def test_scrap_reviews_async_incrementally(
+            self,
+            mocked_get_reviews_from_html,
+            mocked_get_html,
+    ):
+        async def get_html(url):
+            await asyncio.sleep(0.01)
+            return url
+
+        mocked_get_html.side_effect = get_html
+        mocked_get_reviews_from_html.return_value = [Review('Doge', 40, [], 'Wow', True, {})]
+
+        with tempfile.TemporaryDirectory() as directory:
+            watermark_store = WatermarkStore(directory)
+            watermark_store.save(URL, mocked_get_reviews_from_html.return_value)
+
+            result = await self.dealership_review_scrapper.scrap_reviews_async(
+                20,
+                URL,
+                max_workers=1,
+                watermark_store=watermark_store,
+            )
+
+        self.assertEqual([review.reviewer for review in result], ['Doge'])
+        self.assertLess(mocked_get_html.call_count, 5)
+
+    async def test_scrap_reviews_async_without_pages_nor_discovering_them(self):
+        with self.assertRaises(ValueError):
+            await self.dealership_review_scrapper.scrap_reviews_async(None, URL)
+
+
+class TestDealerShipReviewScrapperParsers(unittest.TestCase):
+    """
+    Parity tests of the DealerShipReviewScrapper class over real pages, for every parser
+    """
+
+    @staticmethod
+    def _scrap_page(file_name: str, parser: ParserType) -> list:
+        html = read_resource(file_name)
+        dealership_review_scrapper = DealerShipReviewScrapper(parser=parser)
+
+        with patch.object(dealership_review_scrapper.http_client, 'get_html', return_value=html):
+            reviews = dealership_review_scrapper.scrap_reviews(1, URL)
+
+        return [review.to_dict() for review in reviews]
+
+    def test_scrap_reviews_from_page(self):
+        for parser in ParserType:
+            with self.subTest(parser=parser):
+                result = self._scrap_page('dealerrater_page.html', parser)
+
+                self.assertEqual(len(result), 3)
+                self.assertEqual(result[0], {
+                    'reviewer': 'Doge Shibe',
+                    'overall-score': 50,
+                    'employees-scores': [50, 40],
+                    'message': '"Amazing experience!" Everyone was friendly & helpful. '
+                               "It wasn't slow at all, thank you Freddie!",
+                    'recommend-dealer': True,
+                    'specific-scores': {
+                        'customer-service': 50,
+                        'quality-of-work': 40,
+                        'friendliness': 50,
+                        'pricing': 30,
+                        'overall-experience': 50,
+                    },
+                })
+                self.assertEqual(result[1]['reviewer'], 'José Núñez')
+                self.assertEqual(result[1]['employees-scores'], [])
+                self.assertFalse(result[1]['recommend-dealer'])
+                self.assertEqual(
+                    result[2]['message'],
+                    "It's ok Nice people, but the <financing> part was hard and slow.",
+                )
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    def test_scrap_reviews_discovering_pages(self, mocked_get_html):
+        mocked_get_html.return_value = read_resource('dealerrater_page.html')
+
+        result = DealerShipReviewScrapper().scrap_reviews(10, URL, discover_pages=True)
+
+        self.assertEqual(len(result), 9)
+        self.assertEqual(
+            [call.args[0] for call in mocked_get_html.call_args_list],
+            [f'{URL}/page{page_number}/' for page_number in range(1, 4)],
+        )
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    def test_scrap_reviews_discovering_pages_stops_on_empty_page(self, mocked_get_html):
+        mocked_get_html.side_effect = [
+            read_resource('dealerrater_page.html'),
+            '<html><body></body></html>',
+            read_resource('dealerrater_page.html'),
+        ]
+
+        result = DealerShipReviewScrapper().scrap_reviews(None, URL, discover_pages=True)
+
+        self.assertEqual(len(result), 3)
+        self.assertEqual(mocked_get_html.call_count, 2)
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    def test_scrap_reviews_discovering_pages_without_pagination(self, mocked_get_html):
+        mocked_get_html.return_value = read_resource('dealerrater_page_sloppy.html')
+
+        result = DealerShipReviewScrapper().scrap_reviews(PAGES, URL, discover_pages=True)
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(mocked_get_html.call_count, 1)
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    def test_scrap_reviews_discovering_no_pages(self, mocked_get_html):
+        result = DealerShipReviewScrapper().scrap_reviews(0, URL, discover_pages=True)
+
+        self.assertEqual(result, [])
+        mocked_get_html.assert_not_called()
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    def test_scrap_reviews_without_pages_nor_discovering_them(self, mocked_get_html):
+        dealership_review_scrapper = DealerShipReviewScrapper()
+
+        with self.assertRaises(ValueError):
+            dealership_review_scrapper.scrap_reviews(None, URL)
+
+        with self.assertRaises(ValueError):
+            dealership_review_scrapper.scrap_reviews_pipelined(None, URL)
+
+        mocked_get_html.assert_not_called()
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    @patch('dealership_review.utils.logger.Logger.error')
+    def test_scrap_reviews_discovering_pages_with_failing_request(
+            self,
+            mocked_log_error,
+            mocked_get_html,
+    ):
+        mocked_get_html.side_effect = HttpRequestConnectionError()
+
+        result = DealerShipReviewScrapper().scrap_reviews(PAGES, URL, discover_pages=True)
+
+        self.assertFalse(result)
+        self.assertEqual(mocked_get_html.call_count, 1)
+        mocked_log_error.assert_called_with('It was not possible to fetch data from DealerRater')
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    def test_scrap_reviews_pipelined(self, mocked_get_html):
+        mocked_get_html.return_value = read_resource('dealerrater_page.html')
+
+        result = DealerShipReviewScrapper().scrap_reviews_pipelined(
+            PAGES,
+            URL,
+            fetch_workers=3,
+            parse_workers=2,
+            queue_size=1,
+        )
+        expected_result = DealerShipReviewScrapper().scrap_reviews(PAGES, URL)
+
+        self.assertEqual(
+            [review.to_dict() for review in result],
+            [review.to_dict() for review in expected_result],
+        )
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    def test_scrap_reviews_writes_each_page_to_sink(self, mocked_get_html):
+        mocked_get_html.side_effect = [
+            read_resource('dealerrater_page.html'),
+            HttpRequestConnectionError(),
+            read_resource('dealerrater_page.html'),
+        ]
+        sink = JsonLinesSink(io.StringIO())
+        sink.write_reviews = MagicMock(wraps=sink.write_reviews)
+
+        result = DealerShipReviewScrapper().scrap_reviews(3, URL, max_workers=1, sink=sink)
+        records = [json.loads(line) for line in sink.file.getvalue().splitlines()]
+
+        self.assertEqual(sink.write_reviews.call_count, 2)
+        self.assertEqual(
+            [{key: record[key] for key in record if key not in ('dealership-url', 'score')}
+             for record in records],
+            [review.to_dict() for review in result],
+        )
+        self.assertEqual(
+            [record['score'] for record in records],
+            [review.score for review in result],
+        )
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    def test_scrap_reviews_pipelined_without_keeping_reviews(self, mocked_get_html):
+        mocked_get_html.return_value = read_resource('dealerrater_page.html')
+        sink = JsonLinesSink(io.StringIO())
+
+        result = DealerShipReviewScrapper().scrap_reviews_pipelined(
+            PAGES,
+            URL,
+            sink=sink,
+            keep_reviews=False,
+        )
+
+        self.assertEqual(result, [])
+        self.assertEqual(sink.reviews_count, 3 * PAGES)
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    def test_scrap_reviews_pipelined_discovering_pages(self, mocked_get_html):
+        mocked_get_html.side_effect = [
+            read_resource('dealerrater_page.html'),
+            '<html><body></body></html>',
+            read_resource('dealerrater_page.html'),
+        ]
+
+        result = DealerShipReviewScrapper().scrap_reviews_pipelined(
+            None,
+            URL,
+            discover_pages=True,
+        )
+
+        self.assertEqual(len(result), 3)
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    @patch('dealership_review.utils.logger.Logger.error')
+    def test_scrap_reviews_pipelined_with_failing_request(
+            self,
+            mocked_log_error,
+            mocked_get_html,
+    ):
+        mocked_get_html.side_effect = HttpRequestConnectionError()
+
+        result = DealerShipReviewScrapper().scrap_reviews_pipelined(PAGES, URL)
+
+        self.assertFalse(result)
+        mocked_log_error.assert_called_with('It was not possible to fetch data from DealerRater')
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    def test_scrap_reviews_records_metrics(self, mocked_get_html):
+        mocked_get_html.side_effect = [
+            read_resource('dealerrater_page.html'),
+            HttpRequestConnectionError(),
+        ]
+        metrics = MetricsCollector()
+
+        reviews = DealerShipReviewScrapper(metrics=metrics).scrap_reviews(2, URL)
+        for review in reviews:
+            _ = review.score
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['counters'], {
+            'pages-scrapped': 1,
+            'reviews-scrapped': 3,
+            'scrapping-errors': 1,
+        })
+        self.assertEqual(snapshot['histograms']['parse']['count'], 1)
+        self.assertEqual(snapshot['histograms']['extract']['count'], 1)
+        self.assertEqual(snapshot['histograms']['score']['count'], 3)
+
+    def test_parsers_extract_the_same_reviews(self):
+        for file_name in PARSER_CORPUS:
+            with self.subTest(file_name=file_name):
+                results = [self._scrap_page(file_name, parser) for parser in ParserType]
+
+                self.assertTrue(results[0])
+                for result in results[1:]:
+                    self.assertEqual(result, results[0])
+
+
+class TestDealerShipReviewScrapperProcesses(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests of the DealerShipReviewScrapper class parsing pages in other processes
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.parse_executor = create_parse_executor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.parse_executor.shutdown()
+
+    def setUp(self) -> None:
+        self.dealership_review_scrapper = DealerShipReviewScrapper(
+            parse_executor=self.parse_executor,
+        )
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    def test_scrap_reviews_with_parse_executor(self, mocked_get_html):
+        mocked_get_html.return_value = read_resource('dealerrater_page.html')
+
+        result = self.dealership_review_scrapper.scrap_reviews(
+            PAGES,
+            URL,
+            max_workers=3,
+            discover_pages=True,
+        )
+        expected_result = DealerShipReviewScrapper().scrap_reviews(
+            PAGES,
+            URL,
+            discover_pages=True,
+        )
+
+        self.assertEqual(len(result), 9)
+        self.assertEqual(
+            [review.to_dict() for review in result],
+            [review.to_dict() for review in expected_result],
+        )
+        self.assertEqual(
+            [review.score for review in result],
+            [review.score for review in expected_result],
+        )
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    @patch('dealership_review.utils.logger.Logger.error')
+    def test_scrap_reviews_with_parse_executor_failing_to_parse(
+            self,
+            mocked_log_error,
+            mocked_get_html,
+    ):
+        mocked_get_html.return_value = '<html><div class="review-entry"></div></html>'
+
+        result = self.dealership_review_scrapper.scrap_reviews(PAGES, URL)
+
+        self.assertFalse(result)
+        mocked_log_error.assert_called_with(
+            'Element was not found in the document: '
+            '<span class=italic font-16 bolder notranslate>None<span>'
+        )
+
+    @patch('dealership_review.utils.async_http_client.AsyncHttpClient.get_html')
+    async def test_scrap_reviews_async_with_parse_executor(self, mocked_get_html):
+        mocked_get_html.return_value = read_resource('dealerrater_page.html')
+
+        result = await self.dealership_review_scrapper.scrap_reviews_async(
+            PAGES,
+            URL,
+            discover_pages=True,
+        )
+
+        self.assertEqual(len(result), 9)
+        self.assertEqual(result[0].reviewer, 'Doge Shibe')
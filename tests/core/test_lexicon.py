@@ -0,0 +1,75 @@
+# pylint: disable=missing-function-docstring
+
+import os
+import tempfile
+import unittest
+
+from dealership_review.core.lexicon import Lexicon, tokenize
+
+
+class TestTokenize(unittest.TestCase):
+    """
+    Tests for the tokenize function
+    """
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("Wasn't GOOD!! Such, wow."), ['wasnt', 'good', 'such', 'wow'])
+
+
+class TestLexicon(unittest.TestCase):
+    """
+    Tests for the Lexicon class
+    """
+
+    def setUp(self) -> None:
+        self.lexicon = Lexicon(
+            positive_words=['good', 'happy', 'top notch'],
+            negative_words=['bad', 'slow', 'waste of time'],
+            modifier_words=['not', 'wasnt', 'far from'],
+        )
+
+    def test_score(self):
+        self.assertEqual(self.lexicon.score('Good car, happy doge. Bad coffee.'), 1)
+
+    def test_score_with_a_modifier_word(self):
+        self.assertEqual(self.lexicon.score("Not bad at all, wasn't slow"), 2)
+
+    def test_score_with_a_modifier_at_the_end(self):
+        self.assertEqual(self.lexicon.score('Good, not'), 1)
+
+    def test_score_with_phrases(self):
+        self.assertEqual(self.lexicon.score('Top notch service, not a waste of time'), 0)
+        self.assertEqual(self.lexicon.score('Top notch service, not waste of time'), 2)
+        self.assertEqual(self.lexicon.score('It was far from good'), -1)
+
+    def test_score_with_a_wider_negation_window(self):
+        message = 'Not very good'
+        lexicon = Lexicon(['good'], ['bad'], ['not'], negation_window=2)
+
+        self.assertEqual(self.lexicon.score(message), 1)
+        self.assertEqual(lexicon.score(message), -1)
+
+    def test_score_many(self):
+        self.assertEqual(self.lexicon.score_many(['good', 'bad', 'not good', '']), [1, -1, -1, 0])
+
+    def test_from_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            positive_words_path = os.path.join(directory, 'positive.txt')
+            negative_words_path = os.path.join(directory, 'negative.txt')
+
+            with open(positive_words_path, 'w', encoding='utf8') as file:
+                file.write('# positive words\ngood\n\nvery nice\n')
+            with open(negative_words_path, 'w', encoding='utf8') as file:
+                file.write('bad\n')
+
+            lexicon = Lexicon.from_files(positive_words_path, negative_words_path)
+
+        self.assertEqual(lexicon.score('Good and very nice, not bad'), 1)
+
+    def test_score_with_a_large_lexicon(self):
+        lexicon = Lexicon(
+            positive_words=[f'good{index}' for index in range(10000)],
+            negative_words=[f'bad{index}' for index in range(10000)],
+        )
+
+        self.assertEqual(lexicon.score('good1 good9999 bad42 wow'), 1)
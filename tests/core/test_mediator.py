@@ -1,9 +1,42 @@
 # pylint: disable=missing-function-docstring
 
+import io
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
-from dealership_review.core.mediator import Mediator
+from dealership_review.core.mediator import Mediator, DEFAULT_DEALERSHIP_URL
+from dealership_review.core.review import Review
+from dealership_review.core.review_sinks import CsvSink
+from dealership_review.core.review_sorter import SortType
+from dealership_review.core.review_store import ReviewStore
+from dealership_review.utils.metrics import MetricsCollector
+
+from dealership_review.exceptions.http_client_exceptions import HttpRequestConnectionError
+
+SCRAPPED_REVIEWS = [
+    {
+        'reviewer': 'First Reviewer',
+        'overall-score': 21,
+        'employees-scores': [43],
+        'message': 'First Message',
+        'recommend-dealer': True,
+        'specific-scores': {
+            'pricing': 56,
+        },
+    },
+    {
+        'reviewer': 'Second Reviewer',
+        'overall-score': 98,
+        'employees-scores': [76, 54],
+        'message': 'Second Message',
+        'recommend-dealer': False,
+        'specific-scores': {
+            'customer-service': 32,
+        },
+    },
+]
 
 
 class TestMediator(unittest.TestCase):
@@ -18,30 +51,155 @@ class TestMediator(unittest.TestCase):
         'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper.scrap_reviews'
     )
     def test_get_scores(self, mocked_scrap_reviews):
-        mocked_scrap_reviews.return_value = [
-            {
-                'reviewer': 'First Reviewer',
-                'overall-score': 21,
-                'employees-scores': [43],
-                'message': 'First Message',
-                'recommend-dealer': True,
-                'specific-scores': {
-                    'pricing': 56,
-                },
-            },
+        mocked_scrap_reviews.return_value = list(map(Review.from_dict, SCRAPPED_REVIEWS))
+
+        scores = self.mediator.get_scores()
+        reviewers_names = list(map(lambda review: review.reviewer, scores))
+
+        self.assertEqual(reviewers_names, ['Second Reviewer', 'First Reviewer'])
+
+    @patch(
+        'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper'
+        '.scrap_reviews_pipelined'
+    )
+    def test_get_scores_pipelined(self, mocked_scrap_reviews_pipelined):
+        mocked_scrap_reviews_pipelined.return_value = \
+            list(map(Review.from_dict, SCRAPPED_REVIEWS))
+
+        scores = self.mediator.get_scores_pipelined(count=1, sort_type=SortType.DESC)
+
+        self.assertEqual([review.reviewer for review in scores], ['First Reviewer'])
+
+    @patch(
+        'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper.scrap_reviews'
+    )
+    def test_get_scores_for_many(self, mocked_scrap_reviews):
+        executors = set()
+
+        def scrap_reviews(dealership_url, executor, **_):
+            executors.add(executor)
+            if dealership_url == 'https://www.failing.url':
+                raise RuntimeError()
+            return list(map(Review.from_dict, SCRAPPED_REVIEWS))
+
+        mocked_scrap_reviews.side_effect = scrap_reviews
+
+        with patch('dealership_review.utils.logger.Logger.error') as mocked_log_error:
+            scores = self.mediator.get_scores_for_many(
+                ['https://www.wow.such.url', 'https://www.failing.url', 'https://www.much.url'],
+                count=1,
+            )
+
+        self.assertEqual(
+            {url: [review.reviewer for review in reviews] for url, reviews in scores.items()},
             {
-                'reviewer': 'Second Reviewer',
-                'overall-score': 98,
-                'employees-scores': [76, 54],
-                'message': 'Second Message',
-                'recommend-dealer': False,
-                'specific-scores': {
-                    'customer-service': 32,
-                },
+                'https://www.wow.such.url': ['Second Reviewer'],
+                'https://www.failing.url': [],
+                'https://www.much.url': ['Second Reviewer'],
             },
+        )
+        self.assertEqual(len(executors), 1)
+        mocked_log_error.assert_called_once()
+
+    @patch(
+        'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper.scrap_reviews'
+    )
+    def test_get_scores_records_metrics(self, mocked_scrap_reviews):
+        metrics = MetricsCollector()
+        mediator = Mediator(metrics=metrics)
+        mocked_scrap_reviews.return_value = [
+            Review.from_dict(scrapped_review, metrics=metrics)
+            for scrapped_review in SCRAPPED_REVIEWS
         ]
 
-        scores = self.mediator.get_scores()
+        mediator.get_scores()
+
+        histograms = metrics.snapshot()['histograms']
+        self.assertEqual(histograms['sort']['count'], 1)
+        self.assertEqual(histograms['score']['count'], 2)
+        self.assertIs(mediator.http_client.metrics, metrics)
+        self.assertIs(mediator.dealership_review_scrapper.metrics, metrics)
+
+    @patch(
+        'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper.scrap_reviews'
+    )
+    def test_get_scores_with_review_store(self, mocked_scrap_reviews):
+        mocked_scrap_reviews.return_value = list(map(Review.from_dict, SCRAPPED_REVIEWS))
+
+        with tempfile.TemporaryDirectory() as directory:
+            review_store = ReviewStore(os.path.join(directory, 'reviews.db'))
+
+            scores = self.mediator.get_scores(review_store=review_store)
+            stored_scores = self.mediator.get_scores(pages=3, review_store=review_store)
+            self.mediator.get_scores(pages=10, review_store=review_store)
+
+            review_store.close()
+
+        self.assertEqual(
+            [review.reviewer for review in stored_scores],
+            [review.reviewer for review in scores],
+        )
+        self.assertEqual(mocked_scrap_reviews.call_count, 2)
+
+    @patch('dealership_review.utils.http_client.HttpClient.get_html')
+    def test_get_scores_with_review_store_after_failed_scrapping(self, mocked_get_html):
+        mocked_get_html.side_effect = HttpRequestConnectionError()
+
+        with tempfile.TemporaryDirectory() as directory:
+            review_store = ReviewStore(os.path.join(directory, 'reviews.db'))
+
+            self.assertEqual(self.mediator.get_scores(review_store=review_store), [])
+            self.assertFalse(review_store.is_fresh(DEFAULT_DEALERSHIP_URL))
+            self.assertEqual(self.mediator.get_scores(review_store=review_store), [])
+
+            review_store.close()
+
+        self.assertEqual(mocked_get_html.call_count, 2)
+
+    @patch(
+        'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper'
+        '.scrap_reviews_pipelined'
+    )
+    def test_export_reviews(self, mocked_scrap_reviews_pipelined):
+        def scrap_reviews_pipelined(dealership_url, sink, keep_reviews, **_):
+            self.assertFalse(keep_reviews)
+            sink.write_reviews(dealership_url, list(map(Review.from_dict, SCRAPPED_REVIEWS)))
+            return []
+
+        mocked_scrap_reviews_pipelined.side_effect = scrap_reviews_pipelined
+        sink = CsvSink(io.StringIO())
+
+        exported_count = self.mediator.export_reviews(
+            sink,
+            dealership_url='https://www.wow.such.url',
+        )
+
+        self.assertEqual(exported_count, 2)
+        self.assertEqual(len(sink.file.getvalue().splitlines()), 3)
+
+    def test_scrapper_shares_http_client(self):
+        self.assertIs(
+            self.mediator.dealership_review_scrapper.http_client,
+            self.mediator.http_client,
+        )
+
+
+class TestMediatorAsync(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the asynchronous methods of the Mediator class
+    """
+
+    def setUp(self) -> None:
+        self.mediator = Mediator()
+
+    @patch(
+        'dealership_review.core.dealership_review_scrapper.DealerShipReviewScrapper'
+        '.scrap_reviews_async'
+    )
+    async def test_get_scores_async(self, mocked_scrap_reviews_async):
+        mocked_scrap_reviews_async.return_value = list(map(Review.from_dict, SCRAPPED_REVIEWS))
+
+        scores = await self.mediator.get_scores_async()
         reviewers_names = list(map(lambda review: review.reviewer, scores))
 
         self.assertEqual(reviewers_names, ['Second Reviewer', 'First Reviewer'])
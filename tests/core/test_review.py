@@ -1,6 +1,7 @@
 # pylint: disable=missing-function-docstring
 
 import unittest
+from unittest.mock import patch
 
 from dealership_review.core.review import Review
 
@@ -76,3 +77,38 @@ class TestReview(unittest.TestCase):
         )
 
         self.assertEqual(review.score, 77)
+
+    def test_score_is_calculated_once(self):
+        with patch.object(Review, 'calculate_score', return_value=42) as mocked_calculate_score:
+            review = Review(reviewer='Doge', overall_score=40)
+
+            mocked_calculate_score.assert_not_called()
+            self.assertEqual(review.score, 42)
+            self.assertEqual(review.score, 42)
+            mocked_calculate_score.assert_called_once()
+
+    def test_review_has_no_instance_dict(self):
+        self.assertFalse(hasattr(self.review, '__dict__'))
+
+    def test_from_dict_and_to_dict(self):
+        review = Review.from_dict(self.review.to_dict())
+
+        self.assertEqual(review.to_dict(), {
+            'reviewer': 'Doge',
+            'overall-score': 40,
+            'employees-scores': [50, 30],
+            'message': 'Amazing experience!! Wow such happy!!',
+            'recommend-dealer': True,
+            'specific-scores': {
+                'pricing': 50,
+                'customer-service': 10
+            },
+        })
+        self.assertEqual(review.score, 78)
+
+    def test_fingerprint(self):
+        same_review = Review.from_dict(self.review.to_dict())
+        another_review = Review('Doge', 40, [50, 30], 'Wow', True, {})
+
+        self.assertEqual(self.review.fingerprint(), same_review.fingerprint())
+        self.assertNotEqual(self.review.fingerprint(), another_review.fingerprint())
@@ -0,0 +1,90 @@
+# pylint: disable=missing-function-docstring
+
+import csv
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from dealership_review.core.review import Review
+from dealership_review.core.review_sinks import (
+    ReviewSink, JsonLinesSink, CsvSink, open_review_sink, CSV_FIELDS,
+)
+
+URL = 'https://www.wow.such.url/dealer/such-dealer'
+REVIEWS = [
+    Review('Doge', 40, [50], 'Such good', True, {'pricing': 50}),
+    Review('Cate', 10, [], 'Bad, "really"', False, {}),
+]
+
+
+class TestReviewSinks(unittest.TestCase):
+    """
+    Tests for the JsonLinesSink and CsvSink classes
+    """
+
+    def test_json_lines_sink(self):
+        sink = JsonLinesSink(io.StringIO())
+
+        sink.write_reviews(URL, REVIEWS)
+
+        records = [json.loads(line) for line in sink.file.getvalue().splitlines()]
+        self.assertEqual(records, [
+            {'dealership-url': URL, **review.to_dict(), 'score': review.score}
+            for review in REVIEWS
+        ])
+        self.assertEqual(sink.reviews_count, 2)
+
+    def test_csv_sink(self):
+        sink = CsvSink(io.StringIO())
+
+        sink.write_reviews(URL, REVIEWS)
+        sink.write_reviews(URL, REVIEWS[:1])
+
+        rows = list(csv.DictReader(io.StringIO(sink.file.getvalue())))
+        self.assertEqual(list(rows[0]), CSV_FIELDS)
+        self.assertEqual([row['reviewer'] for row in rows], ['Doge', 'Cate', 'Doge'])
+        self.assertEqual(rows[1]['message'], 'Bad, "really"')
+        self.assertEqual(json.loads(rows[0]['specific-scores']), {'pricing': 50})
+        self.assertEqual(int(rows[0]['score']), REVIEWS[0].score)
+
+    def test_write_reviews_flushes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'reviews.jsonl')
+
+            with open_review_sink(path) as sink:
+                sink.write_reviews(URL, REVIEWS)
+
+                with open(path, 'r', encoding='utf8') as file:
+                    self.assertEqual(len(file.readlines()), 2)
+
+            self.assertTrue(sink.file.closed)
+
+    def test_open_review_sink(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with open_review_sink(os.path.join(directory, 'reviews.csv')) as csv_sink, \
+                    open_review_sink(os.path.join(directory, 'reviews.jsonl')) as json_lines_sink:
+                self.assertIsInstance(csv_sink, CsvSink)
+                self.assertIsInstance(json_lines_sink, JsonLinesSink)
+
+    def test_review_sink_is_abstract(self):
+        with self.assertRaises(TypeError):
+            ReviewSink(io.StringIO())  # pylint: disable=abstract-class-instantiated
+
+    def test_write_reviews_from_many_threads(self):
+        sink = JsonLinesSink(io.StringIO())
+        threads = [
+            threading.Thread(target=sink.write_reviews, args=(URL, REVIEWS * 50))
+            for _ in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        lines = sink.file.getvalue().splitlines()
+        self.assertEqual(len(lines), 400)
+        self.assertTrue(all(json.loads(line) for line in lines))
@@ -3,7 +3,7 @@
 import unittest
 from unittest.mock import MagicMock
 
-from dealership_review.core.review_sorter import sort_reviews, SortType
+from dealership_review.core.review_sorter import select_top_reviews, sort_reviews, SortType
 
 
 class TestSortReviews(unittest.TestCase):
@@ -44,3 +44,38 @@ class TestSortReviews(unittest.TestCase):
             sort_reviews(self.reviews, sort_type=SortType.DESC),
             expected_result
         )
+
+
+class TestSelectTopReviews(unittest.TestCase):
+    """
+    Tests for the select_top_reviews function
+    """
+
+    def setUp(self) -> None:
+        self.reviews = [
+            MagicMock(score=5, name='first five'),
+            MagicMock(score=10),
+            MagicMock(score=0),
+            MagicMock(score=5, name='second five'),
+            MagicMock(score=10),
+        ]
+
+    def test_select_top_reviews_ascending(self):
+        self.assertEqual(
+            select_top_reviews(self.reviews, 3, sort_type=SortType.ASC),
+            [self.reviews[2], self.reviews[0], self.reviews[3]],
+        )
+
+    def test_select_top_reviews_descending(self):
+        self.assertEqual(
+            select_top_reviews(self.reviews, 3, sort_type=SortType.DESC),
+            [self.reviews[1], self.reviews[4], self.reviews[0]],
+        )
+
+    def test_select_top_reviews_matches_sort_reviews(self):
+        for sort_type in SortType:
+            for count in range(len(self.reviews) + 2):
+                self.assertEqual(
+                    select_top_reviews(iter(self.reviews), count, sort_type),
+                    sort_reviews(list(self.reviews), sort_type)[:count],
+                )
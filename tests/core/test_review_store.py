@@ -0,0 +1,86 @@
+# pylint: disable=missing-function-docstring
+
+import os
+import tempfile
+import time
+import unittest
+
+from dealership_review.core.review import Review
+from dealership_review.core.review_sorter import select_top_reviews, SortType
+from dealership_review.core.review_store import ReviewStore
+
+URL = 'https://www.wow.such.url/dealer/such-dealer'
+REVIEWS = [
+    Review('Doge', 40, [50], 'Such good', True, {'pricing': 50}),
+    Review('Cate', 10, [], 'Bad', False, {}),
+    Review('Shibe', 40, [50], 'Such good', True, {'pricing': 50}),
+    Review('Birb', 90, [100], 'Excellent', True, {'pricing': 100}),
+]
+
+
+class TestReviewStore(unittest.TestCase):
+    """
+    Tests for the ReviewStore class
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.directory.name, 'reviews.db')
+        self.review_store = ReviewStore(self.path)
+
+    def test_get_top_reviews(self):
+        self.review_store.save(URL, REVIEWS, pages=1)
+
+        for sort_type in SortType:
+            top_reviews = self.review_store.get_top_reviews(URL, 3, sort_type)
+
+            self.assertEqual(
+                [review.reviewer for review in top_reviews],
+                [review.reviewer for review in select_top_reviews(REVIEWS, 3, sort_type)],
+            )
+
+        self.assertEqual(self.review_store.get_top_reviews(f'{URL}-another', 3), [])
+
+    def test_save_replaces_stored_reviews(self):
+        self.review_store.save(URL, REVIEWS, pages=1)
+        self.review_store.save(URL, REVIEWS[:1], pages=1)
+
+        reviews = ReviewStore(self.path).get_top_reviews(URL, 3)
+
+        self.assertEqual([review.to_dict() for review in reviews], [REVIEWS[0].to_dict()])
+
+    def test_is_fresh(self):
+        self.assertFalse(self.review_store.is_fresh(URL, 1))
+
+        self.review_store.save(URL, REVIEWS, pages=2)
+
+        self.assertTrue(self.review_store.is_fresh(URL, 1))
+        self.assertTrue(self.review_store.is_fresh(URL, 2))
+        self.assertFalse(self.review_store.is_fresh(URL, 3))
+        self.assertFalse(self.review_store.is_fresh(URL, None))
+
+    def test_is_fresh_after_scrapping_all_pages(self):
+        self.review_store.save(URL, REVIEWS, pages=None)
+
+        self.assertTrue(self.review_store.is_fresh(URL, 50))
+        self.assertTrue(self.review_store.is_fresh(URL, None))
+
+    def test_is_fresh_after_max_age(self):
+        review_store = ReviewStore(self.path, max_age=0.01)
+        review_store.save(URL, REVIEWS, pages=1)
+
+        time.sleep(0.02)
+
+        self.assertFalse(review_store.is_fresh(URL, 1))
+        review_store.close()
+
+    def test_journal_mode(self):
+        journal_mode = self.review_store._connection.execute(  # pylint: disable=protected-access
+            'PRAGMA journal_mode'
+        ).fetchone()[0]
+
+        self.assertEqual(journal_mode, 'wal')
+
+    def tearDown(self) -> None:
+        self.review_store.close()
+        self.directory.cleanup()
@@ -0,0 +1,57 @@
+# pylint: disable=missing-function-docstring
+
+import tempfile
+import unittest
+
+from dealership_review.core.lexicon import Lexicon
+from dealership_review.core.review import Review
+from dealership_review.core.watermark_store import WatermarkStore
+
+URL = 'https://www.wow.such.url/dealer/such-dealer'
+
+
+class TestWatermarkStore(unittest.TestCase):
+    """
+    Tests for the WatermarkStore class
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.watermark_store = WatermarkStore(self.directory.name)
+
+    def test_load_unknown_dealership(self):
+        self.assertEqual(self.watermark_store.load(URL), [])
+
+    def test_save_and_load(self):
+        reviews = [
+            Review('Doge', 40, [50], 'Such good', True, {'pricing': 50}),
+            Review('Cate', 10, [], 'Bad', False, {}),
+        ]
+
+        self.watermark_store.save(URL, reviews)
+        loaded_reviews = WatermarkStore(self.directory.name).load(URL)
+
+        self.assertEqual(
+            [review.to_dict() for review in loaded_reviews],
+            [review.to_dict() for review in reviews],
+        )
+        self.assertEqual(self.watermark_store.load(f'{URL}-another'), [])
+
+    def test_load_with_lexicon(self):
+        lexicon = Lexicon(
+            positive_words=['bad'],
+            negative_words=['good'],
+            modifier_words=['not'],
+        )
+        self.watermark_store.save(URL, [Review('Doge', 40, [50], 'Such good', True, {})])
+
+        review, = self.watermark_store.load(URL, lexicon=lexicon)
+
+        self.assertEqual(
+            review.score,
+            Review('Doge', 40, [50], 'Such good', True, {}, lexicon=lexicon).score,
+        )
+        self.assertNotEqual(review.score, self.watermark_store.load(URL)[0].score)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
@@ -0,0 +1,99 @@
+# pylint: disable=missing-function-docstring
+
+import io
+import os
+import pstats
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from unittest.mock import patch
+
+from benchmarks.stand_in_server import StandInServer, StandInServerOptions
+
+from dealership_review.cli import build_argument_parser, main
+from dealership_review.core.mediator import DEFAULT_DEALERSHIP_URL, DEFAULT_REVIEWED_PAGES
+
+
+class TestCli(unittest.TestCase):
+    """
+    Tests for the command-line entry point, against a stand-in server
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stand_in_server = StandInServer(StandInServerOptions(pages=3, reviews_count=4))
+        cls.stand_in_server.start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.stand_in_server.stop()
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def test_default_arguments(self):
+        arguments = build_argument_parser().parse_args([])
+
+        self.assertIsNone(arguments.urls)
+        self.assertEqual(arguments.pages, DEFAULT_REVIEWED_PAGES)
+        self.assertIsNone(arguments.profile)
+        self.assertTrue(DEFAULT_DEALERSHIP_URL)
+
+    def test_main(self):
+        stdout = self._run_main('--url', self.stand_in_server.url, '--pages', '3', '--count', '2')
+
+        lines = stdout.splitlines()
+        self.assertEqual(lines[0], '###')
+        self.assertEqual(len(lines), 4)
+        self.assertRegex(lines[1], r'^Reviewer \d+ scored \d+$')
+
+    def test_main_with_many_urls(self):
+        stdout = self._run_main(
+            '--url', self.stand_in_server.url,
+            '--url', f'{self.stand_in_server.url}-again',
+            '--all-pages',
+            '--count', '1',
+            '--sort', 'desc',
+        )
+
+        self.assertIn(f'{self.stand_in_server.url}-again\n###\n', stdout)
+        self.assertEqual(stdout.count('###'), 4)
+
+    @patch('dealership_review.cli.Logger')
+    def test_main_flushes_logs(self, mocked_logger):
+        self._run_main('--url', self.stand_in_server.url, '--pages', '1', '--debug')
+
+        mocked_logger.return_value.flush.assert_called_once()
+
+    def test_main_with_output(self):
+        output_path = os.path.join(self.directory.name, 'reviews.jsonl')
+
+        self._run_main('--url', self.stand_in_server.url, '--all-pages', '--output', output_path)
+
+        with open(output_path, 'r', encoding='utf8') as file:
+            self.assertEqual(len(file.readlines()), 12)
+
+    def test_main_with_profile(self):
+        profile_path = os.path.join(self.directory.name, 'run.pstats')
+        stderr = io.StringIO()
+
+        with redirect_stderr(stderr):
+            self._run_main('--url', self.stand_in_server.url, '--profile', profile_path)
+
+        summary = stderr.getvalue()
+        self.assertIn('Wall-clock time', summary)
+        self.assertIn('Peak memory', summary)
+        self.assertRegex(summary, r'http-request\s+5 ')
+        self.assertRegex(summary, r'parse\s+5 ')
+        self.assertTrue(pstats.Stats(profile_path).total_calls)
+
+    def _run_main(self, *argv) -> str:
+        stdout = io.StringIO()
+
+        with redirect_stdout(stdout):
+            self.assertEqual(main(list(argv)), 0)
+
+        return stdout.getvalue()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
@@ -0,0 +1,67 @@
+# pylint: disable=missing-function-docstring
+
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT_PATH = os.path.join(os.path.dirname(__file__), '..')
+IMPORTED_MODULE = 'dealership_review.core.mediator'
+IMPORT_TIME_BUDGET = 0.15
+LAZY_MODULES = [
+    'requests',
+    'bs4',
+    'slugify',
+    'aiohttp',
+    'sqlite3',
+    'asyncio',
+    'multiprocessing',
+]
+COLD_START_CODE = f'''
+import sys
+modules_before = set(sys.modules)
+import {IMPORTED_MODULE} as mediator
+mediator.Mediator()
+print(','.join(sorted(set(sys.modules) - modules_before)))
+'''
+
+
+class TestImportTime(unittest.TestCase):
+    """
+    Tests for the cold start of a worker importing the Mediator, measured in
+    a new interpreter with -X importtime
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        completed_process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', COLD_START_CODE],
+            cwd=ROOT_PATH,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        cls.imported_modules = completed_process.stdout.strip().split(',')
+        cls.import_times = dict(
+            _parse_import_time_line(line)
+            for line in completed_process.stderr.splitlines()
+            if line.startswith('import time:') and not line.endswith('package')
+        )
+
+    def test_heavy_dependencies_are_not_imported(self):
+        for module in LAZY_MODULES:
+            with self.subTest(module=module):
+                self.assertNotIn(module, self.imported_modules)
+
+    def test_import_time_budget(self):
+        self.assertLess(self.import_times[IMPORTED_MODULE], IMPORT_TIME_BUDGET)
+
+
+def _parse_import_time_line(line: str) -> tuple:
+    """
+    Returns the module and its cumulative import time in seconds, from a line as
+    `import time:  self [us] | cumulative | imported package`
+    """
+    _, cumulative, module = line.split('|')
+
+    return module.strip(), int(cumulative) / 1000000
@@ -0,0 +1,74 @@
+# pylint: disable=missing-function-docstring
+
+import asyncio
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+import aiohttp
+
+from dealership_review.exceptions.http_client_exceptions import (
+    HttpRequestConnectionError, HttpRequestDidNotReturnOk
+)
+from dealership_review.utils.async_http_client import AsyncHttpClient
+from dealership_review.utils.metrics import MetricsCollector
+
+
+class TestAsyncHttpClient(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the AsyncHttpClient wrapper
+    """
+
+    def setUp(self) -> None:
+        self.async_http_client = AsyncHttpClient()
+
+    @patch('aiohttp.ClientSession.get')
+    async def test_get_html(self, mocked_get):
+        html = '<!DOCTYPE html><html lang="en"></html>'
+        mocked_get.return_value.__aenter__.return_value = MagicMock(
+            status=200,
+            text=AsyncMock(return_value=html),
+        )
+
+        response = await self.async_http_client.get_html('http://www.wow.such.url')
+
+        self.assertEqual(response, html)
+
+    @patch('aiohttp.ClientSession.get')
+    async def test_get_html_records_metrics(self, mocked_get):
+        metrics = MetricsCollector()
+        self.async_http_client.metrics = metrics
+        mocked_get.return_value.__aenter__.return_value = MagicMock(
+            status=200,
+            text=AsyncMock(return_value='<html>ç</html>'),
+        )
+
+        await self.async_http_client.get_html('http://www.wow.such.url')
+
+        self.assertEqual(metrics.snapshot()['counters'], {
+            'http-requests': 1,
+            'http-bytes-downloaded': 15,
+        })
+
+    @patch('aiohttp.ClientSession.get')
+    async def test_get_html_with_failing_request(self, mocked_get):
+        mocked_get.return_value.__aenter__.side_effect = aiohttp.ClientConnectionError()
+
+        with self.assertRaises(HttpRequestConnectionError):
+            await self.async_http_client.get_html('http://www.wow.such.url')
+
+    @patch('aiohttp.ClientSession.get')
+    async def test_get_html_with_timing_out_request(self, mocked_get):
+        mocked_get.return_value.__aenter__.side_effect = asyncio.TimeoutError()
+
+        with self.assertRaises(HttpRequestConnectionError):
+            await self.async_http_client.get_html('http://www.wow.such.url')
+
+    @patch('aiohttp.ClientSession.get')
+    async def test_get_html_with_invalid_status_code(self, mocked_get):
+        mocked_get.return_value.__aenter__.return_value = MagicMock(status=500)
+
+        with self.assertRaises(HttpRequestDidNotReturnOk):
+            await self.async_http_client.get_html('http://www.wow.such.url')
+
+    async def asyncTearDown(self) -> None:
+        await self.async_http_client.close()
@@ -0,0 +1,43 @@
+# pylint: disable=missing-function-docstring
+
+import unittest
+
+from dealership_review.utils.hedging_policy import HedgingPolicy
+
+
+class TestHedgingPolicy(unittest.TestCase):
+    """
+    Tests for the HedgingPolicy class
+    """
+
+    def test_get_hedge_delay(self):
+        hedging_policy = HedgingPolicy(percentile=0.95, min_samples=10)
+
+        for latency in range(1, 101):
+            hedging_policy.observe(latency / 100)
+
+        self.assertEqual(hedging_policy.get_hedge_delay(), 0.95)
+
+    def test_get_hedge_delay_with_too_few_samples(self):
+        hedging_policy = HedgingPolicy(min_samples=10)
+        hedging_policy.observe(0.1)
+
+        self.assertIsNone(hedging_policy.get_hedge_delay())
+
+    def test_get_hedge_delay_over_recent_latencies(self):
+        hedging_policy = HedgingPolicy(percentile=0.5, min_samples=1, window_size=3)
+
+        for latency in [10, 10, 10, 1, 1, 1]:
+            hedging_policy.observe(latency)
+
+        self.assertEqual(hedging_policy.get_hedge_delay(), 1)
+
+    def test_acquire_hedge_within_budget(self):
+        hedging_policy = HedgingPolicy(budget=0.05)
+
+        self.assertFalse(hedging_policy.acquire_hedge())
+
+        for _ in range(40):
+            hedging_policy.observe(0.1)
+
+        self.assertEqual([hedging_policy.acquire_hedge() for _ in range(3)], [True, True, False])
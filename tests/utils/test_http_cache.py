@@ -0,0 +1,78 @@
+# pylint: disable=missing-function-docstring
+
+import os
+import tempfile
+import time
+import unittest
+
+from dealership_review.utils.http_cache import HttpCache, CachedResponse
+
+URL = 'http://www.wow.such.url'
+
+
+class TestHttpCache(unittest.TestCase):
+    """
+    Tests for the HttpCache class
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.http_cache = HttpCache(self.directory.name)
+
+    def test_get_missing_url(self):
+        self.assertIsNone(self.http_cache.get(URL))
+
+    def test_put_and_get(self):
+        self.http_cache.put(URL, CachedResponse('<html></html>', etag='"wow"'))
+
+        cached_response = self.http_cache.get(URL)
+
+        self.assertEqual(cached_response.body, '<html></html>')
+        self.assertEqual(cached_response.etag, '"wow"')
+        self.assertTrue(cached_response.is_fresh(self.http_cache.ttl))
+
+    def test_entries_persist_between_instances(self):
+        self.http_cache.put(URL, CachedResponse('<html></html>'))
+
+        self.assertEqual(HttpCache(self.directory.name).get(URL).body, '<html></html>')
+
+    def test_stale_entry(self):
+        self.http_cache.put(URL, CachedResponse('<html></html>', stored_at=time.time() - 10))
+
+        self.assertFalse(self.http_cache.get(URL).is_fresh(ttl=5))
+
+    def test_refresh(self):
+        self.http_cache.put(URL, CachedResponse('<html></html>', stored_at=time.time() - 10))
+
+        self.http_cache.refresh(URL, self.http_cache.get(URL))
+
+        self.assertTrue(self.http_cache.get(URL).is_fresh(ttl=5))
+
+    def test_evicts_least_recently_used_entries(self):
+        http_cache = HttpCache(self.directory.name, max_bytes=2500)
+        body = 'a' * 1000
+
+        http_cache.put(f'{URL}/1', CachedResponse(body))
+        http_cache.put(f'{URL}/2', CachedResponse(body))
+        http_cache.get(f'{URL}/1')
+        http_cache.put(f'{URL}/3', CachedResponse(body))
+
+        self.assertIsNotNone(http_cache.get(f'{URL}/1'))
+        self.assertIsNone(http_cache.get(f'{URL}/2'))
+        self.assertIsNotNone(http_cache.get(f'{URL}/3'))
+        self.assertEqual(len(os.listdir(self.directory.name)), 2)
+
+    def test_conditional_headers(self):
+        cached_response = CachedResponse(
+            '<html></html>',
+            etag='"wow"',
+            last_modified='Wed, 21 Oct 2015 07:28:00 GMT',
+        )
+
+        self.assertEqual(cached_response.get_conditional_headers(), {
+            'If-None-Match': '"wow"',
+            'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT',
+        })
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
@@ -1,14 +1,29 @@
 # pylint: disable=missing-function-docstring
 
+import math
+import random
+import tempfile
+import threading
+import time
 import unittest
+from contextlib import contextmanager
 from unittest.mock import patch, MagicMock
 
 import requests
 
+from benchmarks.stand_in_server import StandInServer, StandInServerOptions
+
 from dealership_review.exceptions.http_client_exceptions import (
     HttpRequestConnectionError, HttpRequestDidNotReturnOk
 )
-from dealership_review.utils.http_client import HttpClient
+from dealership_review.utils.hedging_policy import HedgingPolicy
+from dealership_review.utils.http_cache import HttpCache, CachedResponse
+from dealership_review.utils.http_client import (
+    HttpClient, DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT,
+)
+from dealership_review.utils.metrics import MetricsCollector
+from dealership_review.utils.rate_limiter import RateLimiter, RequestPermit
+from dealership_review.utils.retry_policy import RetryPolicy, NO_RETRIES
 
 
 class TestHttpClient(unittest.TestCase):
@@ -17,9 +32,9 @@ class TestHttpClient(unittest.TestCase):
     """
 
     def setUp(self) -> None:
-        self.http_client = HttpClient()
+        self.http_client = HttpClient(retry_policy=NO_RETRIES)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_html(self, mocked_get):
         html = '<!DOCTYPE html><html lang="en"></html>'
         mocked_get.return_value = MagicMock(
@@ -30,15 +45,70 @@ class TestHttpClient(unittest.TestCase):
         response = self.http_client.get_html('http://www.wow.such.url')
 
         self.assertEqual(response, html)
+        mocked_get.assert_called_with(
+            'http://www.wow.such.url',
+            timeout=(DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT),
+            headers={},
+            stream=True,
+        )
+
+    @patch('requests.Session.get')
+    def test_get_html_with_timed_out_request(self, mocked_get):
+        mocked_get.side_effect = requests.exceptions.ReadTimeout()
+
+        with self.assertRaises(HttpRequestConnectionError):
+            self.http_client.get_html('http://www.wow.such.url')
+
+    @patch('requests.Session.get')
+    def test_get_html_records_metrics(self, mocked_get):
+        metrics = MetricsCollector()
+        http_client = HttpClient(metrics=metrics, retry_policy=NO_RETRIES)
+        mocked_get.side_effect = [
+            MagicMock(status_code=200, text='<html></html>', content=b'<html></html>'),
+            MagicMock(status_code=503, content=b''),
+            requests.exceptions.ConnectionError(),
+        ]
+
+        url = 'http://www.wow.such.url'
+
+        http_client.get_html(url)
+        self.assertRaises(HttpRequestDidNotReturnOk, http_client.get_html, url)
+        self.assertRaises(HttpRequestConnectionError, http_client.get_html, url)
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['counters'], {
+            'http-requests': 2,
+            'http-bytes-downloaded': 13,
+            'http-errors': 2,
+        })
+        self.assertEqual(snapshot['histograms']['http-request']['count'], 3)
+
+    @patch('requests.Session.get')
+    def test_get_html_reports_to_rate_limiter(self, mocked_get):
+        rate_limiter = RateLimiter(initial_concurrency=8)
+        http_client = HttpClient(rate_limiter=rate_limiter, retry_policy=NO_RETRIES)
+        mocked_get.return_value = MagicMock(status_code=429, headers={})
 
-    @patch('requests.get')
+        with self.assertRaises(HttpRequestDidNotReturnOk):
+            http_client.get_html('http://www.wow.such.url')
+
+        self.assertEqual(rate_limiter.get_host_limits('http://www.wow.such.url').concurrency, 4)
+
+    def test_session_pool_size(self):
+        http_client = HttpClient(pool_size=32)
+        adapter = http_client.session.get_adapter('https://www.wow.such.url')
+
+        self.assertEqual(adapter.poolmanager.connection_pool_kw['maxsize'], 32)
+        self.assertEqual(http_client.session.headers['Connection'], 'keep-alive')
+
+    @patch('requests.Session.get')
     def test_get_html_with_failing_request(self, mocked_get):
         mocked_get.side_effect = requests.exceptions.ConnectionError()
 
         with self.assertRaises(HttpRequestConnectionError):
             self.http_client.get_html('http://www.wow.such.url')
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_html_with_invalid_status_code(self, mocked_get):
         mocked_get.return_value = MagicMock(
             status_code=500,
@@ -46,3 +116,220 @@ class TestHttpClient(unittest.TestCase):
 
         with self.assertRaises(HttpRequestDidNotReturnOk):
             self.http_client.get_html('http://www.wow.such.url')
+
+    def tearDown(self) -> None:
+        self.http_client.close()
+
+
+class TestHttpClientRetries(unittest.TestCase):
+    """
+    Tests for the retries and the hedged requests of the HttpClient wrapper
+    """
+
+    def setUp(self) -> None:
+        self.metrics = MetricsCollector()
+        self.http_client = HttpClient(metrics=self.metrics, retry_policy=RetryPolicy(backoff=0))
+
+    @patch('requests.Session.get')
+    def test_get_html_retries_failed_request(self, mocked_get):
+        mocked_get.side_effect = [
+            requests.exceptions.ConnectionError(),
+            MagicMock(status_code=200, text='<html></html>'),
+        ]
+
+        response = self.http_client.get_html('http://www.wow.such.url')
+
+        self.assertEqual(response, '<html></html>')
+        self.assertEqual(mocked_get.call_count, 2)
+        self.assertEqual(self.metrics.snapshot()['counters']['http-retries'], 1)
+
+    @patch('requests.Session.get')
+    def test_get_html_retries_server_errors_until_retries_run_out(self, mocked_get):
+        mocked_get.return_value = MagicMock(status_code=503, headers={})
+
+        with self.assertRaises(HttpRequestDidNotReturnOk):
+            self.http_client.get_html('http://www.wow.such.url')
+
+        self.assertEqual(mocked_get.call_count, 3)
+
+    @patch('requests.Session.get')
+    def test_get_html_does_not_retry_client_errors(self, mocked_get):
+        mocked_get.return_value = MagicMock(status_code=404, headers={})
+
+        with self.assertRaises(HttpRequestDidNotReturnOk):
+            self.http_client.get_html('http://www.wow.such.url')
+
+        self.assertEqual(mocked_get.call_count, 1)
+
+    @patch('requests.Session.get')
+    def test_get_html_does_not_retry_past_deadline(self, mocked_get):
+        http_client = HttpClient(retry_policy=RetryPolicy(deadline=0.5))
+        mocked_get.return_value = MagicMock(status_code=429, headers={'Retry-After': '1'})
+
+        with self.assertRaises(HttpRequestDidNotReturnOk):
+            http_client.get_html('http://www.wow.such.url')
+
+        self.assertEqual(mocked_get.call_count, 1)
+        self.assertLessEqual(mocked_get.call_args.kwargs['timeout'][1], 0.5)
+
+    def test_get_html_gives_up_on_slow_body_past_deadline(self):
+        http_client = HttpClient(retry_policy=RetryPolicy(deadline=0.5))
+        options = StandInServerOptions(drip_chunk_size=1024, drip_interval=0.05)
+
+        with StandInServer(options) as stand_in_server:
+            start = time.monotonic()
+
+            with self.assertRaises(HttpRequestConnectionError):
+                http_client.get_html(f'{stand_in_server.url}/page1/')
+
+            self.assertLess(time.monotonic() - start, 1.5)
+            http_client.close()
+
+    @patch('requests.Session.get')
+    def test_get_html_hedges_slow_request(self, mocked_get):
+        hedging_policy = HedgingPolicy(min_samples=1)
+        hedging_policy.observe(0.01)
+        http_client = HttpClient(
+            metrics=self.metrics,
+            retry_policy=NO_RETRIES,
+            hedging_policy=hedging_policy,
+        )
+        slow_request_sent = threading.Event()
+
+        def get(*_, **__):
+            if not slow_request_sent.is_set():
+                slow_request_sent.set()
+                time.sleep(0.2)
+                return MagicMock(status_code=503, headers={})
+            return MagicMock(status_code=200, text='fast')
+
+        mocked_get.side_effect = get
+
+        self.assertEqual(http_client.get_html('http://www.wow.such.url'), 'fast')
+        self.assertEqual(mocked_get.call_count, 2)
+        self.assertEqual(self.metrics.snapshot()['counters']['http-hedged-requests'], 1)
+        http_client.close()
+
+    @patch('requests.Session.get')
+    def test_get_html_hedges_within_budget(self, mocked_get):
+        hedging_policy = HedgingPolicy(budget=0.05)
+        http_client = HttpClient(
+            pool_size=4,
+            metrics=self.metrics,
+            retry_policy=NO_RETRIES,
+            hedging_policy=hedging_policy,
+        )
+
+        def get(*_, **__):
+            time.sleep(random.uniform(0.04, 0.06))
+            return MagicMock(status_code=200, text='<html></html>')
+
+        mocked_get.side_effect = get
+
+        def get_pages():
+            for _ in range(10):
+                http_client.get_html('http://www.wow.such.url')
+
+        threads = [threading.Thread(target=get_pages) for _ in range(10)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        http_client.close()
+
+        hedged_requests = self.metrics.snapshot()['counters'].get('http-hedged-requests', 0)
+        self.assertEqual(mocked_get.call_count, 100 + hedged_requests)
+        self.assertLessEqual(hedged_requests, math.ceil(0.05 * mocked_get.call_count))
+
+    @patch('requests.Session.get')
+    def test_get_html_hedging_leaves_out_rate_limiter_waits(self, mocked_get):
+        hedging_policy = HedgingPolicy(percentile=1, min_samples=1)
+        http_client = HttpClient(retry_policy=NO_RETRIES, hedging_policy=hedging_policy)
+        mocked_get.return_value = MagicMock(status_code=200, text='<html></html>')
+
+        @contextmanager
+        def limit(_):
+            time.sleep(0.1)
+            yield RequestPermit()
+
+        with patch.object(http_client, '_limit', limit):
+            http_client.get_html('http://www.wow.such.url')
+
+        self.assertLess(hedging_policy.get_hedge_delay(), 0.1)
+        http_client.close()
+
+    @patch('requests.Session.get')
+    def test_get_html_hedged_prefers_non_retryable_response(self, mocked_get):
+        hedging_policy = HedgingPolicy(min_samples=1)
+        hedging_policy.observe(0.01)
+        http_client = HttpClient(retry_policy=NO_RETRIES, hedging_policy=hedging_policy)
+        slow_request_sent = threading.Event()
+
+        def get(*_, **__):
+            if not slow_request_sent.is_set():
+                slow_request_sent.set()
+                time.sleep(0.2)
+                return MagicMock(status_code=200, text='slow')
+            return MagicMock(status_code=503, headers={})
+
+        mocked_get.side_effect = get
+
+        self.assertEqual(http_client.get_html('http://www.wow.such.url'), 'slow')
+        http_client.close()
+
+    def tearDown(self) -> None:
+        self.http_client.close()
+
+
+class TestHttpClientWithCache(unittest.TestCase):
+    """
+    Tests for the HttpClient wrapper backed by an HttpCache
+    """
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.http_cache = HttpCache(self.directory.name, ttl=60)
+        self.http_client = HttpClient(cache=self.http_cache)
+
+    @patch('requests.Session.get')
+    def test_get_html_stores_response(self, mocked_get):
+        mocked_get.return_value = MagicMock(
+            status_code=200,
+            text='<html></html>',
+            headers={'ETag': '"wow"'},
+        )
+
+        self.http_client.get_html('http://www.wow.such.url')
+
+        self.assertEqual(self.http_cache.get('http://www.wow.such.url').etag, '"wow"')
+
+    @patch('requests.Session.get')
+    def test_get_html_with_fresh_cached_response(self, mocked_get):
+        self.http_cache.put('http://www.wow.such.url', CachedResponse('<html></html>'))
+
+        response = self.http_client.get_html('http://www.wow.such.url')
+
+        self.assertEqual(response, '<html></html>')
+        mocked_get.assert_not_called()
+
+    @patch('requests.Session.get')
+    def test_get_html_with_revalidated_cached_response(self, mocked_get):
+        self.http_cache.put('http://www.wow.such.url', CachedResponse(
+            '<html></html>',
+            etag='"wow"',
+            stored_at=time.time() - 120,
+        ))
+        mocked_get.return_value = MagicMock(status_code=304)
+
+        response = self.http_client.get_html('http://www.wow.such.url')
+
+        self.assertEqual(response, '<html></html>')
+        self.assertEqual(mocked_get.call_args.kwargs['headers'], {'If-None-Match': '"wow"'})
+        self.assertTrue(self.http_cache.get('http://www.wow.such.url').is_fresh(60))
+
+    def tearDown(self) -> None:
+        self.http_client.close()
+        self.directory.cleanup()
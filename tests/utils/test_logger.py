@@ -1,11 +1,33 @@
-# pylint: disable=missing-function-docstring,no-self-use
+# pylint: disable=missing-function-docstring,no-self-use,too-few-public-methods
 
+import subprocess
+import sys
+import threading
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 import os
 
+from dealership_review.utils.logger import Logger, LogLevel, PrintHandler, BackgroundHandler
+
+CLOSED_STDOUT_CODE = '''
+import sys
 from dealership_review.utils.logger import Logger
+logger = Logger()
+sys.stdout.close()
+logger.info('first')
+logger.flush()
+logger.info('second')
+'''
+
+
+class Unformattable:
+    """
+    Log argument failing the test when formatted
+    """
+
+    def __str__(self):
+        raise AssertionError('Filtered message was formatted')
 
 
 class TestLogger(unittest.TestCase):
@@ -18,33 +40,130 @@ class TestLogger(unittest.TestCase):
 
     @patch('builtins.print')
     def test_debug(self, mocked_print):
-        Logger().debug('debug')
+        logger = Logger()
+        logger.debug('debug')
+        logger.flush()
 
         mocked_print.assert_called_with('### DEBUG /// debug')
 
     @patch('builtins.print')
     def test_info(self, mocked_print):
-        Logger().info('info')
+        logger = Logger()
+        logger.info('info')
+        logger.flush()
 
         mocked_print.assert_called_with('### INFO /// info')
 
     @patch('builtins.print')
     def test_warning(self, mocked_print):
-        Logger().warning('warning')
+        logger = Logger()
+        logger.warning('warning')
+        logger.flush()
 
         mocked_print.assert_called_with('### WARNING /// warning')
 
     @patch('builtins.print')
     def test_error(self, mocked_print):
-        Logger().error('error')
+        logger = Logger()
+        logger.error('error')
+        logger.flush()
 
         mocked_print.assert_called_with('### ERROR /// error')
 
     @patch('builtins.print')
     def test_critical(self, mocked_print):
-        Logger().critical('critical')
+        logger = Logger()
+        logger.critical('critical')
+        logger.flush()
 
         mocked_print.assert_called_with('### CRITICAL /// critical')
 
+    @patch('builtins.print')
+    def test_lazy_arguments(self, mocked_print):
+        logger = Logger()
+        logger.info('page %s of %s', 1, 5)
+        logger.flush()
+
+        mocked_print.assert_called_with('### INFO /// page 1 of 5')
+
+    def test_level_filters_before_formatting(self):
+        handler = MagicMock()
+        argument = Unformattable()
+        logger = Logger(level=LogLevel.WARNING, handler=handler)
+
+        logger.debug('wow %s', argument)
+        logger.info('wow %s', argument)
+        logger.warning('such %s', 'warning')
+
+        handler.emit.assert_called_once_with('### WARNING /// such warning')
+        self.assertTrue(logger.is_enabled_for(LogLevel.ERROR))
+        self.assertFalse(logger.is_enabled_for(LogLevel.INFO))
+
+    def test_disabled_on_test_environment(self):
+        os.environ['ENV'] = 'test'
+        handler = MagicMock()
+
+        Logger(handler=handler).critical('critical')
+
+        handler.emit.assert_not_called()
+
+    @patch('builtins.print')
+    def test_print_handler(self, mocked_print):
+        Logger(handler=PrintHandler()).error('error')
+
+        mocked_print.assert_called_once_with('### ERROR /// error')
+
+    @patch('builtins.print')
+    def test_many_threads(self, mocked_print):
+        logger = Logger()
+
+        def log_lines(thread_number):
+            for line_number in range(100):
+                logger.info('%s-%s', thread_number, line_number)
+
+        threads = [threading.Thread(target=log_lines, args=(number,)) for number in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        logger.flush()
+
+        written_lines = [
+            line
+            for call in mocked_print.call_args_list
+            for line in call.args[0].split('\n')
+        ]
+        self.assertEqual(len(written_lines), 800)
+        self.assertEqual(
+            [line for line in written_lines if line.startswith('### INFO /// 3-')],
+            [f'### INFO /// 3-{line_number}' for line_number in range(100)],
+        )
+
+    def test_background_handler_survives_write_errors(self):
+        handler = BackgroundHandler()
+        logger = Logger(handler=handler)
+
+        with patch('builtins.print', side_effect=BrokenPipeError()):
+            logger.info('dropped')
+            logger.flush()
+
+        with patch('builtins.print') as mocked_print:
+            logger.info('written')
+            logger.flush()
+
+        mocked_print.assert_called_once_with('### INFO /// written')
+
+    def test_exits_with_closed_stdout(self):
+        completed_process = subprocess.run(
+            [sys.executable, '-c', CLOSED_STDOUT_CODE],
+            cwd=os.path.join(os.path.dirname(__file__), '../..'),
+            env={**os.environ, 'ENV': 'test_logger'},
+            capture_output=True,
+            timeout=10,
+            check=False,
+        )
+
+        self.assertEqual(completed_process.returncode, 0)
+
     def tearDown(self) -> None:
         os.environ['ENV'] = 'test'
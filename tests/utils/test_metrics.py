@@ -0,0 +1,98 @@
+# pylint: disable=missing-function-docstring
+
+import json
+import unittest
+
+from dealership_review.utils.metrics import MetricsCollector, Histogram, DISABLED_METRICS
+
+
+class TestHistogram(unittest.TestCase):
+    """
+    Tests for the Histogram class
+    """
+
+    def test_observe(self):
+        histogram = Histogram(buckets=(0.1, 1))
+
+        for value in (0.05, 0.1, 0.5, 2):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.to_dict(), {
+            'buckets': {'0.1': 2, '1': 3, '+Inf': 4},
+            'sum': 2.65,
+            'count': 4,
+        })
+
+
+class TestMetricsCollector(unittest.TestCase):
+    """
+    Tests for the MetricsCollector class
+    """
+
+    def setUp(self) -> None:
+        self.metrics = MetricsCollector(buckets=(0.1, 1))
+
+    def test_increment(self):
+        self.metrics.increment('pages')
+        self.metrics.increment('pages', 2)
+
+        self.assertEqual(self.metrics.snapshot()['counters'], {'pages': 3})
+
+    def test_time(self):
+        with self.metrics.time('parse'):
+            pass
+
+        histogram = self.metrics.snapshot()['histograms']['parse']
+
+        self.assertEqual(histogram['count'], 1)
+        self.assertEqual(histogram['buckets']['0.1'], 1)
+
+    def test_time_records_failing_block(self):
+        with self.assertRaises(ValueError):
+            with self.metrics.time('parse'):
+                raise ValueError()
+
+        self.assertEqual(self.metrics.snapshot()['histograms']['parse']['count'], 1)
+
+    def test_disabled_collector_records_nothing(self):
+        metrics = MetricsCollector(enabled=False)
+
+        metrics.increment('pages')
+        metrics.observe('parse', 0.5)
+        with metrics.time('parse'):
+            pass
+
+        self.assertEqual(metrics.snapshot(), {'counters': {}, 'histograms': {}})
+        self.assertFalse(DISABLED_METRICS.enabled)
+
+    def test_to_json(self):
+        self.metrics.increment('pages')
+        self.metrics.observe('parse', 0.5)
+
+        self.assertEqual(json.loads(self.metrics.to_json()), {
+            'counters': {'pages': 1},
+            'histograms': {
+                'parse': {'buckets': {'0.1': 0, '1': 1, '+Inf': 1}, 'sum': 0.5, 'count': 1},
+            },
+        })
+
+    def test_to_prometheus(self):
+        self.metrics.increment('http-bytes-downloaded', 1024)
+        self.metrics.observe('http-request', 0.5)
+
+        self.assertEqual(self.metrics.to_prometheus(), '\n'.join([
+            '# TYPE dealership_review_http_bytes_downloaded_total counter',
+            'dealership_review_http_bytes_downloaded_total 1024',
+            '# TYPE dealership_review_http_request_seconds histogram',
+            'dealership_review_http_request_seconds_bucket{le="0.1"} 0',
+            'dealership_review_http_request_seconds_bucket{le="1"} 1',
+            'dealership_review_http_request_seconds_bucket{le="+Inf"} 1',
+            'dealership_review_http_request_seconds_sum 0.5',
+            'dealership_review_http_request_seconds_count 1',
+        ]) + '\n')
+
+    def test_reset(self):
+        self.metrics.increment('pages')
+        self.metrics.reset()
+
+        self.assertEqual(self.metrics.snapshot(), {'counters': {}, 'histograms': {}})
@@ -0,0 +1,89 @@
+# pylint: disable=missing-function-docstring
+
+import threading
+import time
+import unittest
+
+from dealership_review.utils.pipeline import Pipeline, PipelineStage
+
+ITEMS_COUNT = 20
+
+
+class TestPipeline(unittest.TestCase):
+    """
+    Tests for the Pipeline class
+    """
+
+    def test_run_keeps_items_order(self):
+        def wait_and_double(item):
+            time.sleep(0.001 * (ITEMS_COUNT - item))
+            return item * 2
+
+        with Pipeline([
+                PipelineStage(wait_and_double, workers=4),
+                PipelineStage(str, workers=2),
+        ]) as pipeline:
+            results = [get_result() for get_result in pipeline.run(range(ITEMS_COUNT))]
+
+        self.assertEqual(results, [str(item * 2) for item in range(ITEMS_COUNT)])
+
+    def test_run_without_items(self):
+        with Pipeline([PipelineStage(str)]) as pipeline:
+            self.assertEqual(list(pipeline.run([])), [])
+
+    def test_exception_skips_next_stages(self):
+        later_stage_items = []
+
+        def fail_on_odd(item):
+            if item % 2:
+                raise ValueError(item)
+            return item
+
+        def record(item):
+            later_stage_items.append(item)
+            return item
+
+        with Pipeline([PipelineStage(fail_on_odd), PipelineStage(record)]) as pipeline:
+            getters = list(pipeline.run(range(4)))
+
+            self.assertEqual(getters[0](), 0)
+            self.assertRaises(ValueError, getters[1])
+            self.assertEqual(getters[2](), 2)
+            self.assertRaises(ValueError, getters[3])
+
+        self.assertEqual(sorted(later_stage_items), [0, 2])
+
+    def test_backpressure_bounds_items_in_flight(self):
+        lock = threading.Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+
+        def start(item):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            return item
+
+        with Pipeline([
+                PipelineStage(start, workers=4),
+                PipelineStage(lambda item: item, workers=1),
+        ], queue_size=2) as pipeline:
+            for get_result in pipeline.run(range(ITEMS_COUNT * 5)):
+                get_result()
+                time.sleep(0.001)
+                with lock:
+                    in_flight[0] -= 1
+
+        self.assertLessEqual(max_in_flight[0], 2 * 3 + 4 + 1)
+
+    def test_stop_before_all_items_are_processed(self):
+        processed_items = []
+
+        with Pipeline([PipelineStage(processed_items.append, workers=2)]) as pipeline:
+            next(iter(pipeline.run(range(ITEMS_COUNT * 5))))
+
+        processed_count = len(processed_items)
+        time.sleep(0.05)
+
+        self.assertLess(processed_count, ITEMS_COUNT * 5)
+        self.assertEqual(len(processed_items), processed_count)
@@ -0,0 +1,66 @@
+# pylint: disable=missing-function-docstring
+
+import threading
+import unittest
+
+from dealership_review.utils.metrics import MetricsCollector
+from dealership_review.utils.profiler import Profiler, THREADS_PROFILED
+
+
+def build_list(size: int) -> list:
+    return list(range(size))
+
+
+class TestProfiler(unittest.TestCase):
+    """
+    Tests for the Profiler class
+    """
+
+    def test_profiles_every_thread(self):
+        with Profiler() as profiler:
+            build_list(10)
+            thread = threading.Thread(target=build_list, args=(10,))
+            thread.start()
+            thread.join()
+
+        calls = [
+            stats[0]
+            for function, stats in profiler.get_stats().stats.items()
+            if function[2] == 'build_list'
+        ]
+        self.assertEqual(sum(calls), 2)
+
+    @unittest.skipUnless(THREADS_PROFILED, 'only the main thread is profiled')
+    def test_leaves_out_running_threads(self):
+        done = threading.Event()
+
+        with Profiler() as profiler:
+            thread = threading.Thread(target=done.wait)
+            thread.start()
+
+        done.set()
+        thread.join()
+
+        self.assertEqual(profiler.running_threads, 1)
+        self.assertIn('Threads still running, and so not profiled: 1', profiler.get_summary())
+
+    def test_measures_wall_clock_and_peak_memory(self):
+        with Profiler() as profiler:
+            build_list(100000)
+
+        self.assertGreater(profiler.wall_clock, 0)
+        self.assertGreater(profiler.peak_memory, 100000 * 8)
+
+    def test_get_summary(self):
+        metrics = MetricsCollector()
+        metrics.observe('parse', 0.5)
+        metrics.observe('parse', 1.5)
+
+        with Profiler(metrics) as profiler:
+            build_list(10)
+
+        summary = profiler.get_summary()
+
+        self.assertRegex(summary, r'parse\s+2\s+2\.000\s+1\.000000')
+        self.assertRegex(summary, r'score\s+0\s+0\.000')
+        self.assertIn('build_list', summary)
@@ -0,0 +1,130 @@
+# pylint: disable=missing-function-docstring
+
+import threading
+import time
+import unittest
+
+from dealership_review.utils.rate_limiter import RateLimiter
+
+URL = 'http://www.wow.such.url/page1/'
+
+
+class TestRateLimiter(unittest.TestCase):
+    """
+    Tests for the RateLimiter class
+    """
+
+    def test_healthy_responses_increase_limits(self):
+        rate_limiter = RateLimiter(initial_rate=50, initial_concurrency=2)
+
+        for _ in range(10):
+            with rate_limiter.limit(URL) as permit:
+                permit.report(200)
+
+        host_limits = rate_limiter.get_host_limits(URL)
+        self.assertGreater(host_limits.rate, 50)
+        self.assertGreater(host_limits.concurrency, 2)
+
+    def test_throttled_response_decreases_limits(self):
+        rate_limiter = RateLimiter(initial_rate=100, initial_concurrency=8)
+
+        with rate_limiter.limit(URL) as permit:
+            permit.report(429)
+
+        host_limits = rate_limiter.get_host_limits(URL)
+        self.assertEqual(host_limits.rate, 50)
+        self.assertEqual(host_limits.concurrency, 4)
+
+    def test_failed_request_decreases_limits(self):
+        rate_limiter = RateLimiter(initial_rate=100, initial_concurrency=8)
+
+        with self.assertRaises(ConnectionError):
+            with rate_limiter.limit(URL):
+                raise ConnectionError()
+
+        self.assertEqual(rate_limiter.get_host_limits(URL).concurrency, 4)
+
+    def test_failures_in_flight_together_decrease_limits_once(self):
+        rate_limiter = RateLimiter(initial_rate=1000, initial_concurrency=8)
+
+        with rate_limiter.limit(URL) as permit:
+            time.sleep(0.05)
+            permit.report(200)
+
+        for _ in range(3):
+            with rate_limiter.limit(URL) as permit:
+                permit.report(503)
+
+        self.assertAlmostEqual(rate_limiter.get_host_limits(URL).concurrency, 8.125 / 2)
+
+    def test_slow_response_decreases_limits(self):
+        rate_limiter = RateLimiter(initial_rate=1000, initial_concurrency=8, latency_tolerance=2)
+        host_limits = rate_limiter.get_host_limits(URL)
+        host_limits.latency = 0.01
+
+        with rate_limiter.limit(URL) as permit:
+            time.sleep(0.1)
+            permit.report(200)
+
+        self.assertEqual(host_limits.concurrency, 4)
+
+    def test_retry_after_pauses_requests(self):
+        rate_limiter = RateLimiter(initial_rate=1000)
+
+        with rate_limiter.limit(URL) as permit:
+            permit.report(429, retry_after='1')
+
+        start = time.monotonic()
+        with rate_limiter.limit(URL) as permit:
+            permit.report(200)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.9)
+
+    def test_rate_limit(self):
+        rate_limiter = RateLimiter(initial_rate=20, max_rate=20)
+
+        start = time.monotonic()
+        for _ in range(5):
+            with rate_limiter.limit(URL) as permit:
+                permit.report(200)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+    def test_concurrency_limit(self):
+        rate_limiter = RateLimiter(initial_rate=1000, initial_concurrency=2, max_concurrency=2)
+        lock = threading.Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+
+        def request():
+            with rate_limiter.limit(URL) as permit:
+                with lock:
+                    in_flight[0] += 1
+                    max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+                time.sleep(0.02)
+                with lock:
+                    in_flight[0] -= 1
+                permit.report(200)
+
+        threads = [threading.Thread(target=request) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(max_in_flight[0], 2)
+
+    def test_hosts_have_their_own_limits(self):
+        rate_limiter = RateLimiter()
+
+        with rate_limiter.limit(URL) as permit:
+            permit.report(429)
+
+        self.assertIsNot(
+            rate_limiter.get_host_limits(URL),
+            rate_limiter.get_host_limits('http://www.much.url/page1/'),
+        )
+        self.assertEqual(
+            rate_limiter.get_host_limits('http://www.much.url/page2/').concurrency,
+            rate_limiter.initial_concurrency,
+        )
@@ -0,0 +1,36 @@
+# pylint: disable=missing-function-docstring
+
+import unittest
+
+from dealership_review.utils.retry_policy import RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """
+    Tests for the RetryPolicy class
+    """
+
+    def test_get_delay_backs_off_exponentially(self):
+        retry_policy = RetryPolicy(backoff=1, max_backoff=4)
+
+        for attempt, max_delay in enumerate([1, 2, 4, 4]):
+            delays = [retry_policy.get_delay(attempt) for _ in range(100)]
+
+            self.assertTrue(all(0 <= delay <= max_delay for delay in delays))
+            self.assertGreater(len(set(delays)), 1)
+
+    def test_get_delay_with_retry_after(self):
+        retry_policy = RetryPolicy(backoff=1)
+
+        self.assertGreaterEqual(retry_policy.get_delay(0, '3'), 3)
+        self.assertLessEqual(retry_policy.get_delay(0, 'Wed, 21 Oct 2015 07:28:00 GMT'), 1)
+
+    def test_is_retryable(self):
+        retry_policy = RetryPolicy()
+
+        self.assertTrue(retry_policy.is_retryable(503))
+        self.assertTrue(retry_policy.is_retryable(429))
+        self.assertFalse(retry_policy.is_retryable(404))
+
+    def test_get_deadline_without_deadline(self):
+        self.assertEqual(RetryPolicy(deadline=None).get_deadline(), float('inf'))
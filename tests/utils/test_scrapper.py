@@ -4,7 +4,9 @@ import unittest
 from unittest.mock import patch, MagicMock
 
 from dealership_review.exceptions.scrapper_exceptions import ElementNotFound
-from dealership_review.utils.scrapper import Scrapper, ScrapperElement
+from dealership_review.utils.scrapper import (
+    Scrapper, ScrapperElement, ScrapperFilter, ParserType,
+)
 
 
 class TestScrapper(unittest.TestCase):
@@ -225,6 +227,41 @@ class TestScrapper(unittest.TestCase):
         self.assertEqual(count, 3)
         mocked_find_all.assert_called_with('a', class_='wowsuchclass', attrs={'id': '123'})
 
+    def test_parsers(self):
+        for parser in ParserType:
+            with self.subTest(parser=parser):
+                scrapper = Scrapper('<div><p class="wow">Such value</p></div>', parser)
+
+                element = scrapper.find_first_element('p', cls='wow')
+
+                self.assertEqual(element.get_value(), 'Such value')
+
+    def test_partial_parse(self):
+        html = '<html><head><title>Wow</title></head><body>' \
+               '<div class="review such"><p>First</p></div>' \
+               '<div class="footer"><p>Footer</p></div>' \
+               '<div class="review"><p>Second</p></div></body></html>'
+
+        for parser in ParserType:
+            with self.subTest(parser=parser):
+                scrapper = Scrapper(html, parser, only_elements=ScrapperFilter('div', cls='review'))
+
+                paragraphs = scrapper.select_css('p')
+
+                self.assertEqual([p.get_value() for p in paragraphs], ['First', 'Second'])
+                self.assertEqual(scrapper.count_elements('title'), 0)
+
+    def test_partial_parse_with_many_classes(self):
+        html = '<div class="review"></div><div class="footer"></div><div class="pagination"></div>'
+
+        scrapper = Scrapper(
+            html,
+            only_elements=ScrapperFilter('div', cls=['review', 'pagination']),
+        )
+
+        self.assertEqual(len(scrapper.select_css('div')), 2)
+        self.assertEqual(scrapper.count_elements('div', cls='footer'), 0)
+
 
 class TestScrapperElement(unittest.TestCase):
     """
@@ -242,3 +279,10 @@ class TestScrapperElement(unittest.TestCase):
         scrapper_element = ScrapperElement(element)
 
         self.assertEqual(scrapper_element.get_class(), ['wow', 'such', 'class'])
+
+    def test_get_attribute(self):
+        element = {'href': '/wow/such/link'}
+        scrapper_element = ScrapperElement(element)
+
+        self.assertEqual(scrapper_element.get_attribute('href'), '/wow/such/link')
+        self.assertIsNone(scrapper_element.get_attribute('id'))